@@ -0,0 +1,48 @@
+"""Compare the per-token overhead of getting an algorithm, by building it every time and from the registry.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_algorithm_provider
+"""
+import time
+
+from coincurve import PrivateKey
+
+from didsdk.core.algorithm_provider import AlgorithmProvider, AlgorithmType
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+
+LOOKUPS = 200_000
+TOKENS = 5_000
+
+
+def build_every_time(type_: AlgorithmType):
+    # The way `AlgorithmProvider.create` worked before the registry.
+    if type_ == AlgorithmType.ES256K:
+        from didsdk.core.es256k_algorithm import ES256KAlgorithm
+
+        return ES256KAlgorithm()
+
+
+def measure(func, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - started) / count * 1_000_000
+
+
+def main():
+    private_key = PrivateKey()
+    unsigned = Jwt(Header(alg="ES256K", kid="did:icon:01:1234#key1"), Payload({"sub": "holder"}))
+    signed = Jwt.decode(Jwt(unsigned.header, unsigned.payload).sign(private_key))
+
+    print(f"{'operation':<34}{'us/op':>10}")
+    print(f"{'build the algorithm':<34}{measure(lambda: build_every_time(AlgorithmType['ES256K']), LOOKUPS):>10.3f}")
+    print(f"{'registry lookup':<34}{measure(lambda: AlgorithmProvider.create('ES256K'), LOOKUPS):>10.3f}")
+    print(f"{'identifier lookup':<34}{measure(lambda: AlgorithmType.from_identifier('none'), LOOKUPS):>10.3f}")
+    print(f"{'Jwt.sign':<34}{measure(lambda: unsigned.sign(private_key), TOKENS):>10.3f}")
+    print(f"{'Jwt.verify':<34}{measure(lambda: signed.verify(private_key.public_key), TOKENS):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare DID document resolution throughput of the transports against a local stand-in node.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_async_transport
+"""
+import asyncio
+import time
+
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import (
+    AioHttpTransport,
+    AsyncTransport,
+    ExecutorTransport,
+)
+from tests.utils.local_rpc_server import LocalRpcServer
+
+LATENCY = 0.02
+CONCURRENCY = [1, 10, 50, 200]
+
+
+async def create_did(did_service: DidService) -> str:
+    private_key = PrivateKey()
+    key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+    document = await did_service.create(KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64))
+    return document.id
+
+
+async def run_blocking(did_service: DidService, did: str, count: int) -> float:
+    started = time.perf_counter()
+
+    async def read():
+        return did_service.read_document(did)
+
+    await asyncio.gather(*[read() for _ in range(count)])
+    return time.perf_counter() - started
+
+
+async def run_async(did_service: DidService, did: str, count: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*[did_service.read_document_async(did) for _ in range(count)])
+    return time.perf_counter() - started
+
+
+async def main():
+    with LocalRpcServer(latency=LATENCY) as server:
+        iconservice = IconService(HTTPProvider(server.url))
+        transports = {
+            "blocking IconService": None,
+            "ExecutorTransport": ExecutorTransport(iconservice, max_workers=64),
+            "AioHttpTransport": AioHttpTransport(server.url),
+        }
+        did = await create_did(DidService(iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS))
+
+        print(f"node latency: {LATENCY * 1000:.0f} ms per request")
+        print(f"{'transport':<22}" + "".join(f"{f'n={count}':>14}" for count in CONCURRENCY))
+        for name, transport in transports.items():
+            did_service = DidService(iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS, transport=transport)
+            row = f"{name:<22}"
+            for count in CONCURRENCY:
+                run = run_blocking if transport is None else run_async
+                elapsed = await run(did_service, did, count)
+                row += f"{count / elapsed:>10.0f} r/s"
+            print(row)
+            if isinstance(transport, AsyncTransport):
+                await transport.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Compare the requests and the time of presentation checks with and without JSON-RPC batches.
+
+A check resolves the issuer documents of the credentials in a presentation, and checks their statuses.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch_reads
+"""
+import asyncio
+import time
+from typing import List
+
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.jwt.jwt import Jwt
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import AioHttpTransport
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+LATENCY = 0.02
+CREDENTIALS_PER_PRESENTATION = [1, 5, 20]
+CHECKS = 20
+
+
+async def check_one_by_one(did_service: DidService, vc_service: VCService, dids: List[str], sigs: List[str]):
+    await asyncio.gather(
+        *[did_service.read_document_async(did) for did in dids], *[vc_service.is_valid_async(sig) for sig in sigs]
+    )
+
+
+async def check_in_batches(did_service: DidService, vc_service: VCService, dids: List[str], sigs: List[str]):
+    await asyncio.gather(did_service.read_documents(dids), vc_service.is_valid_many(sigs))
+
+
+async def main():
+    with LocalRpcServer(latency=LATENCY) as server:
+        iconservice = IconService(HTTPProvider(server.url))
+        transport = AioHttpTransport(server.url)
+        did_service = DidService(iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS, transport=transport)
+        vc_service = VCService(iconservice, 2, LocalRpcServer.VC_SCORE_ADDRESS, transport=transport)
+
+        count = max(CREDENTIALS_PER_PRESENTATION)
+        dids = []
+        for _ in range(count):
+            private_key = PrivateKey()
+            key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+            document = await did_service.create(
+                KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+            )
+            dids.append(document.id)
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, count)
+        await vc_service.register_list(KeyWallet.create(), credentials, private_key)
+        sigs = [Jwt.decode(credential).signature for credential in credentials]
+
+        print(f"node latency: {LATENCY * 1000:.0f} ms per request")
+        print(f"{'credentials':<12}{'mode':<14}{'requests/check':>16}{'ms/check':>12}")
+        for size in CREDENTIALS_PER_PRESENTATION:
+            for name, check in [("one by one", check_one_by_one), ("batch", check_in_batches)]:
+                request_count = server.http_request_count
+                started = time.perf_counter()
+                for _ in range(CHECKS):
+                    await check(did_service, vc_service, dids[:size], sigs[:size])
+                elapsed = time.perf_counter() - started
+                requests = (server.http_request_count - request_count) / CHECKS
+                print(f"{size:<12}{name:<14}{requests:>16.1f}{elapsed / CHECKS * 1000:>12.1f}")
+        await transport.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""Compare the verifications per second of ES256K signatures, by recovering the public key and directly.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_es256k_verify
+"""
+import time
+
+from coincurve import PrivateKey, PublicKey
+
+from didsdk.core.es256k_algorithm import ES256KAlgorithm
+
+VERIFICATIONS = 20_000
+
+
+def verify_by_recovery(public_key: PublicKey, data: bytes, signature: bytes) -> bool:
+    # The way `ES256KAlgorithm.verify` worked before.
+    return public_key == PublicKey.from_signature_and_message(signature, data)
+
+
+def main():
+    algorithm = ES256KAlgorithm()
+    private_key = PrivateKey()
+    data = b"eyJhbGciOiJFUzI1NksiLCJraWQiOiJkaWQ6aWNvbjowMToxMjM0I2tleTEifQ.eyJzdWIiOiJob2xkZXIifQ"
+    signature = algorithm.sign(private_key, data)
+    public_key = private_key.public_key
+
+    print(f"{'mode':<12}{'verifications/s':>18}")
+    for name, verify in [("recovery", verify_by_recovery), ("direct", algorithm.verify)]:
+        started = time.perf_counter()
+        for _ in range(VERIFICATIONS):
+            assert verify(public_key, data, signature)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<12}{VERIFICATIONS / elapsed:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare the decodes per second of a credential token, parsing it at once and lazily.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_jwt_decode
+"""
+import json
+import time
+
+from coincurve import PrivateKey
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.document.encoding import Base64URLEncoder
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+
+DECODES = 50_000
+
+
+def decode_eagerly(token: str) -> Jwt:
+    # The way `Jwt.decode` worked before.
+    encoded_tokens = token.split(".")
+    return Jwt(
+        header=Header(**json.loads(Base64URLEncoder.decode(encoded_tokens[0]).decode())),
+        payload=Payload(json.loads(Base64URLEncoder.decode(encoded_tokens[1]).decode())),
+        encoded_token=encoded_tokens,
+    )
+
+
+def main():
+    payload = Payload(
+        {
+            "iss": "did:icon:01:961b6cd64253fb28c9b0d3d224be5f9b18d49f01da390f08",
+            "sub": "did:icon:01:1111961b6cd64253fb28c9b0d3d224be5f9b18d49f01da390f08",
+            "iat": int(time.time()),
+            "exp": int(time.time()) + 3600,
+            "claim": {f"claim{index}": {"claimValue": "x" * 64, "salt": "0" * 32} for index in range(10)},
+            "type": ["CREDENTIAL", "email"],
+            "version": "2.0",
+        }
+    )
+    header = Header(
+        alg=AlgorithmType.ES256K.name, kid="did:icon:01:961b6cd64253fb28c9b0d3d224be5f9b18d49f01da390f08#key1"
+    )
+    token = Jwt(header, payload).sign(PrivateKey())
+
+    reads = [
+        ("signature", lambda jwt: jwt.signature),
+        ("kid", lambda jwt: jwt.header.kid),
+        ("payload", lambda jwt: jwt.payload.exp),
+    ]
+    print(f"{'read':<12}{'eager decodes/s':>18}{'lazy decodes/s':>18}")
+    for name, read in reads:
+        rates = []
+        for decode in [decode_eagerly, Jwt.decode]:
+            started = time.perf_counter()
+            for _ in range(DECODES):
+                read(decode(token))
+            rates.append(DECODES / (time.perf_counter() - started))
+        print(f"{name:<12}{rates[0]:>18,.0f}{rates[1]:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare the tokens verified per second one by one and by `Jwt.verify_many`.
+
+The speedup of the pools depends on the number of CPUs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_verify_many
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from coincurve import PrivateKey
+
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+
+TOKENS = 10_000
+ISSUERS = 10
+
+
+def main():
+    private_keys = [PrivateKey() for _ in range(ISSUERS)]
+    items = []
+    for index in range(TOKENS):
+        private_key = private_keys[index % ISSUERS]
+        jwt = Jwt(Header(alg="ES256K", kid=f"did:icon:01:{index % ISSUERS:04d}#key1"), Payload({"sub": f"{index}"}))
+        items.append((jwt.sign(private_key), private_key.public_key))
+
+    def one_by_one():
+        return [Jwt.decode(token).verify(public_key) for token, public_key in items]
+
+    def thread_pool():
+        return Jwt.verify_many(items)
+
+    def process_pool():
+        with ProcessPoolExecutor() as executor:
+            return Jwt.verify_many(items, executor=executor, chunk_size=1_000)
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'mode':<14}{'tokens/s':>12}")
+    for name, verify in [("one by one", one_by_one), ("threads", thread_pool), ("processes", process_pool)]:
+        started = time.perf_counter()
+        results = verify()
+        elapsed = time.perf_counter() - started
+        assert all(result.success for result in results)
+        print(f"{name:<14}{TOKENS / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """A probabilistic set of strings without false negatives.
+
+    `might_contain` answers False only for an item that was never added, so it can skip the lookup
+    of an exact set for most of the items that are not in the set.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """Create the instance.
+
+        :param capacity: the expected number of items.
+        :param error_rate: the rate of false positives with `capacity` items.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive number.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+        self._size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count: int = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count: int = 0
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self._size for index in range(self._hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def might_contain(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
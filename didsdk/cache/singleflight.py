@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """This class runs at most one call for a key at a time and shares its outcome with the concurrent callers.
+
+    A caller that arrives while a call for the same key is in flight waits for it instead of starting its own,
+    and gets the same value or exception. Nothing is kept after the call ends, so it is not a cache.
+    Threads are coalesced by `do`, and asyncio tasks of an event loop by `do_async`.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._shared_count: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    @property
+    def shared_count(self) -> int:
+        """The number of callers that got the outcome of a call started by another caller."""
+        return self._shared_count
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Call the function, or wait for the call in flight for the key.
+
+        :param key: the key of the call.
+        :param function: the function without arguments to call.
+        :return: the value returned by the function.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._shared_count += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = function()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the coroutine function, or the call in flight for the key.
+
+        The call runs in its own task, so cancelling a caller does not cancel the call for the others.
+
+        :param key: the key of the call.
+        :param function: the coroutine function without arguments to call.
+        :return: the value returned by the coroutine.
+        """
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None:
+                self._shared_count += 1
+            else:
+                task = self._tasks[task_key] = asyncio.ensure_future(function())
+                task.add_done_callback(lambda done: self._remove_task(task_key, done))
+        return await asyncio.shield(task)
+
+    def _remove_task(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task):
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+
+    def forget(self, key: Hashable):
+        """Let the next caller of the key start a new call instead of waiting for the one in flight.
+
+        Use it after a change that the call in flight may not see. The callers already waiting still share it.
+
+        :param key: the key of the call.
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+            for task_key in [task_key for task_key in self._tasks if task_key[1] == key]:
+                del self._tasks[task_key]
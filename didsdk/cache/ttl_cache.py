@@ -0,0 +1,173 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+_DEFAULT_TTL = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    expires_at: Optional[float]
+    stale_until: Optional[float]
+    error_until: Optional[float] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return self.expires_at is None or now < self.expires_at
+
+    def is_usable(self, now: float, on_error: bool = False) -> bool:
+        until = self.error_until if on_error else self.stale_until
+        return until is None or now < until
+
+
+class TTLCache:
+    """A thread-safe LRU cache whose entries expire after a time-to-live.
+
+    An expired entry is kept for `stale_ttl` more seconds, so that a caller can serve it
+    while it fetches a fresh value, and for `error_ttl` seconds after that, so that a caller
+    can serve it when it fails to fetch a fresh value. Set `ttl` to None for entries that never expire.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = 60,
+        stale_ttl: float = 0,
+        error_ttl: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create the instance.
+
+        :param max_size: the maximum number of entries, the least recently used entry is evicted first.
+        :param ttl: the default time-to-live of an entry in seconds, or None to never expire.
+        :param stale_ttl: the seconds an expired entry can still be served as a stale value.
+        :param error_ttl: the seconds after the stale period an entry can be served on error.
+        :param clock: the function that returns the current time in seconds.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive number.")
+
+        self._max_size: int = max_size
+        self._ttl: Optional[float] = ttl
+        self._stale_ttl: float = stale_ttl
+        self._error_ttl: float = error_ttl
+        self._clock: Callable[[], float] = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._stats: CacheStats = CacheStats()
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.is_fresh(self._clock())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Hashable, default=None):
+        """Returns the value of a fresh entry.
+
+        :param key: the key of the entry.
+        :param default: the value to return if there is no fresh entry.
+        :return: the cached value or the default.
+        """
+        entry = self.lookup(key, allow_stale=False)
+        return entry.value if entry else default
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate_if(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry matching the predicate.
+
+        :param predicate: the function that takes a key and a value.
+        :return: the number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if predicate(key, entry.value)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def lookup(self, key: Hashable, allow_stale: bool = True, on_error: bool = False) -> Optional[CacheEntry]:
+        """Returns the entry of the key and updates the statistics.
+
+        :param key: the key of the entry.
+        :param allow_stale: whether an expired entry still in its stale period can be returned.
+        :param on_error: whether an expired entry still in its error period can be returned,
+            because the caller failed to fetch a fresh value.
+        :return: the CacheEntry object, or None if there is no usable entry.
+        """
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.is_fresh(now):
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry
+                if not entry.is_usable(now, on_error=True):
+                    del self._entries[key]
+                elif allow_stale and (on_error or entry.is_usable(now)):
+                    self._entries.move_to_end(key)
+                    self._stats.stale_hits += 1
+                    return entry
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: Hashable, value, ttl=_DEFAULT_TTL):
+        """Store a value.
+
+        :param key: the key of the entry.
+        :param value: the value to cache.
+        :param ttl: the time-to-live of this entry in seconds, None to never expire.
+        """
+        ttl = self._ttl if ttl is _DEFAULT_TTL else ttl
+        with self._lock:
+            now = self._clock()
+            expires_at = None if ttl is None else now + ttl
+            stale_until = None if ttl is None else expires_at + self._stale_ttl
+            error_until = None if ttl is None else stale_until + self._error_ttl
+            self._entries[key] = CacheEntry(
+                value=value, expires_at=expires_at, stale_until=stale_until, error_until=error_until
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
@@ -1,7 +1,7 @@
 from typing import Union
 
-from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
+from pydantic_settings import BaseSettings
 
 
 class DidSettings(BaseSettings):
@@ -9,7 +9,66 @@ class DidSettings(BaseSettings):
     DIDSDK_TX_RETRY_COUNT: int = 5
     # Second
     DIDSDK_TX_SLEEP_TIME: Union[int, float] = 1
+    DIDSDK_TX_MAX_SLEEP_TIME: Union[int, float] = 4
+    DIDSDK_TX_BACKOFF_FACTOR: float = 1.5
+    # "poll" or "long_poll"
+    DIDSDK_TX_CONFIRMATION_MODE: str = "poll"
+    # The maximum number of unconfirmed transactions of a bulk request
+    DIDSDK_TX_WINDOW_SIZE: int = 64
+    # The maximum size of the credential list in a `registerList` transaction
+    DIDSDK_TX_MAX_PAYLOAD_BYTES: int = 262_144
+    # `StepEstimator`: the ratio of a step limit to the estimate, the payload size of a cached estimate,
+    # the largest step limit, and the retries of a transaction out of steps
+    DIDSDK_STEP_MARGIN: float = 1.2
+    DIDSDK_STEP_BUCKET_BYTES: int = 1024
+    DIDSDK_STEP_MAX_LIMIT: int = 50_000_000
+    DIDSDK_STEP_RETRY_COUNT: int = 2
+    # The maximum number of operations in flight per wallet of a `WalletPool`
+    DIDSDK_WALLET_MAX_IN_FLIGHT: int = 16
+    # Coalescing of `VCService.register` (Second)
+    DIDSDK_REGISTER_COALESCE_MAX_BATCH: int = 100
+    DIDSDK_REGISTER_COALESCE_MAX_DELAY: Union[int, float] = 0.005
+    # VC status cache (Second), 0 means no cache
+    DIDSDK_VC_STATUS_CACHE_SIZE: int = 4096
+    DIDSDK_VC_STATUS_CACHE_TTL: Union[int, float] = 0
+    # The seconds between syncs of a block follower
+    DIDSDK_SYNC_INTERVAL: Union[int, float] = 2
     DIDSDK_LOG_ENABLE_LOGGER: bool = False
+    # Document cache (Second)
+    DIDSDK_DOCUMENT_CACHE_SIZE: int = 1024
+    DIDSDK_DOCUMENT_CACHE_TTL: Union[int, float] = 60
+    DIDSDK_DOCUMENT_CACHE_STALE_TTL: Union[int, float] = 300
+    # The seconds after the stale period a document is served while the circuit to the node is open
+    DIDSDK_DOCUMENT_CACHE_ERROR_TTL: Union[int, float] = 0
+    # Parsed public key cache of `KeyResolver` (Second)
+    DIDSDK_KEY_CACHE_SIZE: int = 4096
+    DIDSDK_KEY_CACHE_TTL: Union[int, float] = 60
+    # The reads at a block height never expire, 0 means no cache
+    DIDSDK_PINNED_READ_CACHE_SIZE: int = 4096
+    DIDSDK_TRANSPORT_MAX_WORKERS: int = 32
+    # `Jwt.verify_many`: the threads of the default pool, 0 means the number of CPUs, and the tokens of a task
+    DIDSDK_VERIFY_MAX_WORKERS: int = 0
+    DIDSDK_VERIFY_CHUNK_SIZE: int = 64
+    # `VerifyCache` of verified tokens (Second), an entry expires at the `exp` of its token if earlier
+    DIDSDK_VERIFY_CACHE_SIZE: int = 4096
+    DIDSDK_VERIFY_CACHE_TTL: Union[int, float] = 300
+    # The maximum number of calls in a JSON-RPC batch request
+    DIDSDK_RPC_BATCH_SIZE: int = 100
+    # `PooledHTTPProvider`: connections per node, latency percentile to hedge a read (0 means never),
+    # and the seconds a failed node is skipped
+    DIDSDK_PROVIDER_POOL_SIZE: int = 32
+    DIDSDK_PROVIDER_HEDGE_PERCENTILE: Union[int, float] = 95
+    DIDSDK_PROVIDER_NODE_COOLDOWN: Union[int, float] = 5
+    # `CallGuard`: the range of requests in flight, the latency over which the limit is cut (Second),
+    # and the ratio of the limit kept after a cut
+    DIDSDK_LIMITER_INITIAL_LIMIT: int = 16
+    DIDSDK_LIMITER_MIN_LIMIT: int = 1
+    DIDSDK_LIMITER_MAX_LIMIT: int = 256
+    DIDSDK_LIMITER_LATENCY_TARGET: Union[int, float] = 2
+    DIDSDK_LIMITER_BACKOFF: float = 0.5
+    # The consecutive failures that open the circuit, and the seconds until a request is tried again
+    DIDSDK_BREAKER_FAILURE_THRESHOLD: int = 5
+    DIDSDK_BREAKER_RESET_TIMEOUT: Union[int, float] = 10
 
     model_config = ConfigDict(case_sensitive=True)
 
@@ -1,8 +1,9 @@
 import secrets
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from os import environ
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from ecdsa.curves import Curve, NIST256p, NIST521p, SECP256k1
 
@@ -36,49 +37,91 @@ class AlgorithmType(Enum):
     NONE = TypePlate(identifier="none", signature_algorithm="none", key_algorithm="none", ecdsa_curve=NIST521p)
 
     @classmethod
-    def from_identifier(cls, identifier: str) -> TypePlate:
+    def from_identifier(cls, identifier: str) -> "AlgorithmType":
         if not identifier:
             raise ValueError("The attribute of 'identifier' can not be None or emptied.")
 
-        for member in cls.__members__.values():
-            obj: TypePlate = member.value
-            if identifier == obj.identifier:
-                return member
-
-        raise ValueError(f"The identifier of '{identifier}' is not supported.")
+        member = _TYPES_BY_IDENTIFIER.get(identifier)
+        if member is None:
+            raise ValueError(f"The identifier of '{identifier}' is not supported.")
+        return member
 
     @classmethod
-    def from_ecdsa_curve(cls, ecdsa_curve: str) -> "AlgorithmType":
+    def from_ecdsa_curve(cls, ecdsa_curve: Union[Curve, str]) -> Optional["AlgorithmType"]:
+        """Returns the type of a curve.
+
+        :param ecdsa_curve: the Curve object or its name.
+        :return: the AlgorithmType object, or None if no type uses the curve.
+        """
         if not ecdsa_curve:
             raise ValueError("The attribute of 'ecdsa_curve' can not be None or emptied.")
 
-        for member in cls.__members__.values():
-            obj: TypePlate = member.value
-            if ecdsa_curve == obj.ecdsa_curve:
-                return member
+        return _TYPES_BY_CURVE.get(ecdsa_curve if isinstance(ecdsa_curve, str) else ecdsa_curve.name)
+
+
+_TYPES_BY_IDENTIFIER: Dict[str, AlgorithmType] = {member.value.identifier: member for member in AlgorithmType}
+_TYPES_BY_CURVE: Dict[str, AlgorithmType] = {
+    member.value.ecdsa_curve.name: member for member in AlgorithmType if member.value.ecdsa_curve
+}
 
 
 class AlgorithmProvider:
+    """The registry of the algorithms by the name of `alg` in a JWT header.
+
+    An algorithm is a stateless, thread-safe instance shared by every key and token of its name.
+    The algorithms of the SDK are registered on the first lookup, and the others can be registered by `register`.
+    """
+
     IS_ANDROID = -1
     MIN_BOUNCY_CASTLE_VERSION: float = 1.54
     PROVIDER: str = "BC"
 
-    @staticmethod
-    def create(type_: AlgorithmType) -> "Algorithm":
-        if type_:
-            if type_ == AlgorithmType.ES256K:
-                from didsdk.core.es256k_algorithm import ES256KAlgorithm
-
-                return ES256KAlgorithm()
-            elif type_ == AlgorithmType.NONE:
-                from didsdk.core.none_algorithm import NoneAlgorithm
-
-                return NoneAlgorithm()
-            else:
-                raise ValueError(f"{type_.name} is not supported yet.")
-        else:
+    _algorithms: Dict[str, Algorithm] = {}
+    _lock = threading.Lock()
+    _builtins_loaded: bool = False
+
+    @classmethod
+    def _load_builtins(cls):
+        # The algorithms import `AlgorithmType` from this module, so they are imported on the first lookup.
+        from didsdk.core.es256k_algorithm import ES256KAlgorithm
+        from didsdk.core.none_algorithm import NoneAlgorithm
+
+        with cls._lock:
+            if not cls._builtins_loaded:
+                cls._algorithms.setdefault(AlgorithmType.ES256K.name, ES256KAlgorithm())
+                cls._algorithms.setdefault(AlgorithmType.NONE.name, NoneAlgorithm())
+                cls._builtins_loaded = True
+
+    @classmethod
+    def register(cls, algorithm: Algorithm, name: str = None):
+        """Register an algorithm, which replaces the one of the same name.
+
+        :param algorithm: the Algorithm object, which must be thread-safe.
+        :param name: the name of `alg` in a JWT header. (default: the name of `algorithm.type`)
+        """
+        name = name or algorithm.type.name
+        with cls._lock:
+            cls._algorithms[name] = algorithm
+
+    @classmethod
+    def create(cls, type_: Union[AlgorithmType, str]) -> Algorithm:
+        """Returns the registered algorithm.
+
+        :param type_: the AlgorithmType object, or the name of `alg` in a JWT header.
+        :return: the shared Algorithm object.
+        """
+        if not type_:
             raise ValueError("Type cannot be null.")
 
+        name = type_ if isinstance(type_, str) else type_.name
+        algorithm = cls._algorithms.get(name)
+        if algorithm is None and not cls._builtins_loaded:
+            cls._load_builtins()
+            algorithm = cls._algorithms.get(name)
+        if algorithm is None:
+            raise ValueError(f"{name} is not supported yet.")
+        return algorithm
+
     @staticmethod
     def generate_random_nonce(size: int) -> bytes:
         return secrets.token_bytes(size)
@@ -1,7 +1,14 @@
-import traceback
 from dataclasses import dataclass
+from typing import Optional
 
 from coincurve import PrivateKey, PublicKey
+from coincurve.ecdsa import (
+    cdata_to_der,
+    deserialize_recoverable,
+    recoverable_convert,
+    signature_normalize,
+)
+from loguru import logger
 
 from didsdk.core.algorithm import Algorithm
 from didsdk.core.algorithm_provider import AlgorithmType
@@ -57,9 +64,41 @@ class ES256KAlgorithm(Algorithm):
     def sign(self, private_key: PrivateKey, data: bytes) -> bytes:
         return private_key.sign_recoverable(data)
 
+    @staticmethod
+    def to_der_signature(signature: bytes) -> bytes:
+        """Convert a recoverable signature to a DER signature in the lower-S form.
+
+        :param signature: the 65 bytes of (r, s, recovery id) returned by `sign`.
+        :return: the DER signature of (r, s).
+        """
+        normal_signature = recoverable_convert(deserialize_recoverable(signature))
+        # `PublicKey.verify` rejects the higher-S form, which the recovery accepts.
+        _, normal_signature = signature_normalize(normal_signature)
+        return cdata_to_der(normal_signature)
+
+    def recover_public_key(self, data: bytes, signature: bytes) -> Optional[PublicKey]:
+        """Recover the public key from a signature, for the callers without the key.
+
+        :param data: the array of bytes used for signing.
+        :param signature: the recoverable signature returned by `sign`.
+        :return: the PublicKey object, or None if the signature is invalid.
+        """
+        try:
+            return PublicKey.from_signature_and_message(signature, data)
+        except Exception as e:
+            logger.debug(f"Can not recover the public key: {e}")
+            return None
+
     def verify(self, public_key: PublicKey, data: bytes, signature: bytes) -> bool:
+        """Verify the signature against the public key, without recovering the key from it.
+
+        :param public_key: a public key to verify for data.
+        :param data: the array of bytes used for signing
+        :param signature: the recoverable signature returned by `sign`.
+        :return: if the signature is valid, return true, or return false
+        """
         try:
-            return public_key == PublicKey.from_signature_and_message(signature, data)
-        except Exception:
-            traceback.print_exc()
+            return public_key.verify(self.to_der_signature(signature), data)
+        except Exception as e:
+            logger.debug(f"Invalid signature: {e}")
             return False
@@ -1,19 +1,54 @@
 import asyncio
 import json
-from typing import Union
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Union
 
 from coincurve import PublicKey
-from iconsdk.exception import JSONRPCException
+from iconsdk.builder.transaction_builder import CallTransaction
+from iconsdk.exception import IconServiceBaseException
 from iconsdk.icon_service import IconService
 from iconsdk.signed_transaction import SignedTransaction, Transaction
 from iconsdk.wallet.wallet import KeyWallet, Wallet
 from loguru import logger
 
 from didsdk import settings
+from didsdk.cache.singleflight import SingleFlight
+from didsdk.cache.ttl_cache import TTLCache
+from didsdk.core.property_name import PropertyName
 from didsdk.document.document import Document
-from didsdk.exceptions import DocumentException, ResolveException, TransactionException
+from didsdk.document.document_cache import DocumentCache
+from didsdk.document.key_resolver import KeyResolver
+from didsdk.document.publickey_property import PublicKeyProperty
+from didsdk.exceptions import DocumentException, ResolveException
 from didsdk.jwt.jwt import Jwt
+from didsdk.jwt.verify_cache import VerifyCache
 from didsdk.score.did_score import DidScore
+from didsdk.score.snapshot import pinned_height
+from didsdk.score.step_estimator import StepEstimator
+from didsdk.transport.async_transport import AsyncTransport
+from didsdk.transport.call_guard import CallGuard
+from didsdk.transport.deadline import (
+    Deadline,
+    effective_deadline,
+    run_within,
+    wait_within,
+)
+from didsdk.transport.tx_tracker import ConfirmationMode, TransactionTracker
+from didsdk.wallet_pool import WalletPool, lease_wallet
+
+
+@dataclass
+class CreateResult:
+    """The outcome of a DID Document creation in `DidService.create_many`."""
+
+    public_key: str
+    did: Optional[str] = None
+    tx_hash: Optional[str] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        return self.did is not None and self.error is None
 
 
 class DidService:
@@ -22,20 +57,99 @@ class DidService:
     In order to create and update DID Documents,
     a transaction is required and this class uses `iconsdk.icon_service.IconService`.
     https://github.com/icon-project/icon-sdk-python
+
+    An async operation takes a `Deadline`, or follows the one set by `deadline_scope`.
+    Its sub-calls share the time left, and `DeadlineExceededException` is raised when it runs out.
     """
 
-    def __init__(self, iconservice: IconService, network_id: int, score_address: str, timeout: int = 15_000):
+    def __init__(
+        self,
+        iconservice: IconService,
+        network_id: int,
+        score_address: str,
+        timeout: int = 15_000,
+        document_cache: DocumentCache = None,
+        transport: AsyncTransport = None,
+        tracker: TransactionTracker = None,
+        confirmation_mode: ConfirmationMode = None,
+        coalesce_reads: bool = True,
+        patch_documents: bool = False,
+        consistency_check: bool = False,
+        pinned_cache: TTLCache = None,
+        guard: CallGuard = None,
+        verify_cache: VerifyCache = None,
+    ):
         """Create the instance.
 
         :param iconservice: the IconService object.
         :param network_id: the network ID of the blockchain.
         :param score_address: the did score address deployed to the blockchain.
-        :param timeout: the specified timeout, in milliseconds.
+        :param timeout: the specified timeout of a transaction confirmation, in milliseconds.
+        :param document_cache: the cache of resolved documents. If None, every read goes to the blockchain.
+        :param transport: the AsyncTransport object for the async methods.
+            If None, the IconService object is run in a thread pool.
+        :param tracker: the TransactionTracker object that confirms transactions.
+            It can be shared by services to poll their pending transactions together.
+            If None, a new one is created with the transport.
+        :param confirmation_mode: the way the new tracker confirms transactions.
+            It's ignored if `tracker` is given. (default: `DIDSDK_TX_CONFIRMATION_MODE`)
+        :param coalesce_reads: whether concurrent reads of the same DID Document share a request to the blockchain.
+        :param patch_documents: whether `create`, `add_public_key` and `revoke_key` build the resulting document
+            from the transaction instead of reading it again. An update still reads the document
+            if it is not in the document cache.
+        :param consistency_check: whether the patched document is compared with the one read from the blockchain.
+            The document from the blockchain is returned, and a mismatch is logged.
+        :param pinned_cache: the cache of the reads at a block height, which can be shared by services.
+            If None, a new one is created.
+        :param guard: the CallGuard object which limits the requests and the transactions to the node,
+            and fails them fast while the node is failing. It can be shared by services.
+            If None, they are sent as they are.
+        :param verify_cache: the cache of the tokens verified with the key resolver, from which the tokens
+            of the keys revoked in a document read by this service are removed. If None, every signature is verified.
         """
         self._iconservice: IconService = iconservice
         self._network_id: int = network_id
-        self._did_score: DidScore = DidScore(self._iconservice, self._network_id, score_address)
+        self._did_score: DidScore = DidScore(
+            self._iconservice, self._network_id, score_address, transport, pinned_cache, guard
+        )
+        self._transport: AsyncTransport = self._did_score.transport
         self._timeout: int = timeout
+        self._tracker: TransactionTracker = tracker or TransactionTracker(self._transport, mode=confirmation_mode)
+        self._document_cache: Optional[DocumentCache] = document_cache
+        self._read_flight: Optional[SingleFlight] = SingleFlight() if coalesce_reads else None
+        self._verify_cache: Optional[VerifyCache] = verify_cache
+        self._key_resolver: KeyResolver = KeyResolver(
+            self._did_score.get_did_document, self._did_score.get_did_document_async, verify_cache=verify_cache
+        )
+        self._patch_documents: bool = patch_documents
+        self._consistency_check: bool = consistency_check
+
+    @property
+    def document_cache(self) -> Optional[DocumentCache]:
+        return self._document_cache
+
+    @property
+    def guard(self) -> Optional[CallGuard]:
+        """The CallGuard object of the requests, whose `metrics()` show the state of the node."""
+        return self._did_score.guard
+
+    @property
+    def step_estimator(self) -> StepEstimator:
+        """The StepEstimator object of the transactions, which learns the step limit of each method."""
+        return self._did_score.step_estimator
+
+    @property
+    def key_resolver(self) -> KeyResolver:
+        """The KeyResolver object that resolves a `kid` with this service, for `Jwt.verify`."""
+        return self._key_resolver
+
+    @property
+    def verify_cache(self) -> Optional[VerifyCache]:
+        return self._verify_cache
+
+    @property
+    def read_flight(self) -> Optional[SingleFlight]:
+        return self._read_flight
 
     def _get_did(self, event_log: list, event_name: str) -> Union[str, None]:
         """Get the id of document from the transaction event.
@@ -50,96 +164,281 @@ class DidService:
                 return items[2]
         return None
 
-    async def _get_transaction_result(self, tx_hash: str) -> dict:
+    @staticmethod
+    def _get_block_height(tx_result: dict) -> int:
+        block_height = tx_result["blockHeight"]
+        return int(block_height, 16) if isinstance(block_height, str) else block_height
+
+    def _get_cached_document(self, did: str) -> Optional[Document]:
+        """Returns a copy of the cached document to patch.
+
+        :param did: the id of a DID Document
+        :return: the Document object, or None if it is not cached.
+        """
+        if self._document_cache is None:
+            return None
+        document = self._document_cache.get(did)
+        return document.copy() if document is not None else None
+
+    async def _store_patched_document(self, document: Document, deadline: Deadline = None) -> Document:
+        """Put a document patched from a transaction into the document cache.
+
+        If the consistency check is enabled, the document is read from the blockchain instead.
+
+        :param document: the patched Document object.
+        :param deadline: the Deadline object of the operation.
+        :return: the Document object
+        """
+        if self._consistency_check:
+            self._invalidate_document(document.id)
+            chain_document = await self.read_document_async(document.id, deadline)
+            if json.loads(chain_document.serialize()) != json.loads(document.serialize()):
+                logger.warning(f"The patched document of {document.id} does not match the blockchain.")
+            return chain_document
+
+        if self._document_cache is not None:
+            self._document_cache.put(document)
+        return document
+
+    def _invalidate_document(self, did: str):
+        """Drop the cached document, its keys and the read in flight, which may be older than a confirmed update.
+
+        :param did: the id of a DID Document
+        """
+        if self._document_cache is not None:
+            self._document_cache.invalidate(did)
+        if self._read_flight is not None:
+            self._read_flight.forget(did)
+        self._key_resolver.invalidate(did)
+
+    async def _get_transaction_result(self, tx_hash: str, deadline: Deadline = None) -> dict:
         """Get the transaction result that matches the hash of transaction.
 
-        This method calls `iconsdk.icon_service.IconService.get_transaction_result` every 1 second
-        until the transaction is confirmed.
+        The transaction is registered with `TransactionTracker` and confirmed together with the others.
 
-        :param tx_hash:
-        :return:
+        :param tx_hash: the hash of transaction.
+        :param deadline: the Deadline object of the operation.
+        :return: the transaction result.
         """
-        response = None
-        retry_times = settings.DIDSDK_TX_RETRY_COUNT
-        while response is None and retry_times > 0:
-            try:
-                tx_result = self._iconservice.get_transaction_result(tx_hash)
-                if not tx_result:
-                    raise JSONRPCException("transaction result is None.")
-            except JSONRPCException as e:
-                logger.debug(f"{e}")
+        return await wait_within(
+            deadline,
+            lambda timeout: self._tracker.wait(tx_hash, timeout=timeout),
+            self._timeout / 1000,
+            "getTransactionResult",
+        )
 
-                if retry_times == 0:
-                    raise TransactionException(e)
+    def _resolve_document(self, did: str) -> Document:
+        """Get a DID Document from the blockchain.
 
-                retry_times -= 1
-                logger.debug(f"Remain to retry request for getting transaction result: {retry_times}")
+        :param did: the id of a DID Document
+        :return: the Document object
+        """
+        if self._read_flight is not None:
+            return self._read_flight.do(did, lambda: self._load_document(did))
+        return self._load_document(did)
 
-                await asyncio.sleep(settings.DIDSDK_TX_SLEEP_TIME)
-                continue
+    def _deserialize_document(self, json_data: Union[str, dict]) -> Document:
+        try:
+            document = Document.deserialize(json_data)
+        except Exception:
+            raise ResolveException(f"'{json_data}' parsing error.")
+        if self._verify_cache is not None:
+            self._verify_cache.invalidate_revoked(document)
+        return document
+
+    def _load_document(self, did: str) -> Document:
+        return self._deserialize_document(self._did_score.get_did_document(did))
 
-            return tx_result
+    async def _resolve_document_async(self, did: str) -> Document:
+        """Get a DID Document from the blockchain without blocking the event loop.
 
-    async def _send_jwt(self, wallet: KeyWallet, signed_jwt: str, method: str) -> dict:
+        :param did: the id of a DID Document
+        :return: the Document object
+        """
+        if self._read_flight is not None:
+            return await self._read_flight.do_async(did, lambda: self._load_document_async(did))
+        return await self._load_document_async(did)
+
+    async def _load_document_async(self, did: str) -> Document:
+        return self._deserialize_document(await self._did_score.get_did_document_async(did))
+
+    async def _read_document_async(self, did: str) -> Document:
+        if pinned_height() is not None:
+            return await self._load_document_async(did)
+        if self._document_cache is not None:
+            return await self._document_cache.get_or_load_async(did, self._resolve_document_async)
+        return await self._resolve_document_async(did)
+
+    async def _send_jwt(
+        self, wallet: Union[KeyWallet, WalletPool], signed_jwt: str, method: str, deadline: Deadline = None
+    ) -> dict:
         """Sends a transaction with a json web token string.
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the pool to lease it from until the transaction is confirmed.
         :param signed_jwt: the string that signed the object returned from `ScoreParameter`.
         :param method: the name of score function
+        :param deadline: the Deadline object of the operation.
         :return: the TransactionResult object
         """
         if not Jwt.decode(signed_jwt).signature:
             raise Exception("JWT string must contain signature to send a transaction.")
 
-        transaction = self._did_score.jwt_method(from_address=wallet.get_address(), jwt=signed_jwt, method=method)
-        tx_hash = self._send_transaction(transaction, wallet)
+        async with lease_wallet(wallet) as wallet:
+            return await self._transact(
+                lambda step_limit: self._did_score.jwt_method(wallet.get_address(), method, signed_jwt, step_limit),
+                wallet,
+                deadline,
+            )
+
+    async def _transact(
+        self, build: Callable[[Optional[int]], CallTransaction], wallet: Wallet, deadline: Deadline = None
+    ) -> dict:
+        """Sends a transaction and waits for the result, and sends it again with a higher step limit
+        while it runs out of steps.
+
+        :param build: the function that builds the transaction with a step limit, or the estimated one for None.
+        :param wallet: the wallet for transaction.
+        :param deadline: the Deadline object of the operation.
+        :return: the transaction result.
+        """
+
+        async def send(transaction: CallTransaction) -> dict:
+            tx_hash = await self._send_transaction(transaction, wallet, deadline)
+            return await self._get_transaction_result(tx_hash, deadline)
 
-        return await self._get_transaction_result(tx_hash)
+        return await self._did_score.step_estimator.run(build, send)
 
-    def _send_transaction(self, transaction: Transaction, wallet: Wallet) -> str:
+    async def _send_transaction(self, transaction: Transaction, wallet: Wallet, deadline: Deadline = None) -> str:
         """Sends a transaction.
 
         :param transaction: the Transaction object.
         :param wallet: the wallet for transaction.
+        :param deadline: the Deadline object of the operation.
         :return: the hash of transaction.
         """
         signed_tx = SignedTransaction(transaction, wallet)
-        return self._iconservice.send_transaction(signed_tx)
+        return await run_within(deadline, self._transport.send_transaction(signed_tx), "sendTransaction")
 
-    async def add_public_key(self, wallet: KeyWallet, signed_jwt: str) -> Document:
+    async def add_public_key(
+        self, wallet: Union[KeyWallet, WalletPool], signed_jwt: str, deadline: Deadline = None
+    ) -> Document:
         """Add a publicKey to DID Document.
 
-        :param wallet: the wallet for transaction.
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param signed_jwt: the string that signed the object returned.
+        :param deadline: the Deadline object by which the document is returned.
         :return: the Document object.
         """
-        tx_result = await self._send_jwt(wallet, signed_jwt, method="update")
+        deadline = effective_deadline(deadline)
+        tx_result = await self._send_jwt(wallet, signed_jwt, method="update", deadline=deadline)
         did = self._get_did(tx_result["eventLogs"], event_name="AddKey(Address,str,str)")
         if not did:
             raise DocumentException(tx_result["failure"]["message"])
 
-        return self.read_document(did)
+        document = self._get_cached_document(did) if self._patch_documents else None
+        self._invalidate_document(did)
+        if document is None:
+            return await self.read_document_async(did, deadline)
+
+        param = Jwt.decode(signed_jwt).payload.get(PropertyName.KEY_TX_UPDATE_PARAM)
+        public_key_property = PublicKeyProperty.from_json(param[PropertyName.KEY_DOCUMENT_PUBLICKEY])
+        document.add_public_key_property(public_key_property, updated=self._get_block_height(tx_result))
+        return await self._store_patched_document(document, deadline)
 
-    async def create(self, wallet: KeyWallet, public_key: str) -> Document:
+    async def create(
+        self, wallet: Union[KeyWallet, WalletPool], public_key: str, deadline: Deadline = None
+    ) -> Document:
         """Create a DID Document.
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param public_key: the json string returned by calling
+        :param deadline: the Deadline object by which the document is returned.
         :return: the Document object
         """
+        deadline = effective_deadline(deadline)
         try:
             json.loads(public_key)
         except Exception as e:
             raise TypeError(f"Invalid type of public key.({e})")
 
-        transaction = self._did_score.create(from_address=wallet.get_address(), public_key=public_key)
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
+        async with lease_wallet(wallet) as wallet:
+            tx_result = await self._transact(
+                lambda step_limit: self._did_score.create(wallet.get_address(), public_key, step_limit),
+                wallet,
+                deadline,
+            )
         did = self._get_did(tx_result["eventLogs"], "Create(Address,str,str)")
         if not did:
             raise DocumentException(tx_result["failure"]["message"])
 
-        return self.read_document(did)
+        if not self._patch_documents:
+            return await self.read_document_async(did, deadline)
+        document = Document.from_public_key(
+            did, PublicKeyProperty.from_json(public_key), created=self._get_block_height(tx_result)
+        )
+        return await self._store_patched_document(document, deadline)
+
+    async def create_many(
+        self,
+        wallets: Union[Wallet, Sequence[Wallet], WalletPool],
+        public_keys: Sequence[str],
+        window: int = None,
+        deadline: Deadline = None,
+    ) -> List[CreateResult]:
+        """Create DID Documents in bulk.
+
+        The transactions are sent while at most `window` of them are waiting for the confirmation.
+        A failed item does not stop the others.
+
+        :param wallets: the wallet for all transactions, a wallet for each public key,
+            or the WalletPool object to lease a wallet from for each transaction.
+        :param public_keys: the json strings returned by calling `DidScoreParameter.create`.
+        :param window: the maximum number of unconfirmed transactions. (default: `DIDSDK_TX_WINDOW_SIZE`)
+        :param deadline: the Deadline object by which the items are created.
+            The items not confirmed by then have `DeadlineExceededException` as their error.
+        :return: the CreateResult objects in the same order as `public_keys`.
+        """
+        deadline = effective_deadline(deadline)
+        if isinstance(wallets, (Wallet, WalletPool)):
+            wallets = [wallets] * len(public_keys)
+        elif len(wallets) != len(public_keys):
+            raise ValueError(f"The number of wallets({len(wallets)}) must be 1 or {len(public_keys)}.")
+
+        results = [CreateResult(public_key=public_key) for public_key in public_keys]
+        valid_indexes = []
+        for index, public_key in enumerate(public_keys):
+            try:
+                json.loads(public_key)
+            except Exception as e:
+                results[index].error = TypeError(f"Invalid type of public key.({e})")
+                continue
+            valid_indexes.append(index)
+
+        semaphore = asyncio.Semaphore(window or settings.DIDSDK_TX_WINDOW_SIZE)
+
+        async def submit(result: CreateResult, wallet: Union[Wallet, WalletPool]):
+            async def send(transaction: CallTransaction) -> dict:
+                # Keep the hash of the last transaction even if its confirmation fails.
+                result.tx_hash = await self._send_transaction(transaction, leased, deadline)
+                return await self._get_transaction_result(result.tx_hash, deadline)
+
+            async with semaphore:
+                try:
+                    async with lease_wallet(wallet) as leased:
+                        tx_result = await self._did_score.step_estimator.run(
+                            lambda step_limit: self._did_score.create(
+                                leased.get_address(), result.public_key, step_limit
+                            ),
+                            send,
+                        )
+                    result.did = self._get_did(tx_result["eventLogs"], "Create(Address,str,str)")
+                    if not result.did:
+                        raise DocumentException(tx_result["failure"]["message"])
+                except (Exception, IconServiceBaseException) as e:
+                    result.error = e
+
+        await asyncio.gather(*[submit(results[index], wallets[index]) for index in valid_indexes])
+        return results
 
     def get_public_key(self, did: str, key_id: str) -> PublicKey:
         """Get a publicKey that matches the id of DID document and the id of publicKey.
@@ -152,6 +451,18 @@ class DidService:
         public_key_property = document.get_public_key_property(key_id)
         return public_key_property.public_key if public_key_property else public_key_property
 
+    async def get_public_key_async(self, did: str, key_id: str, deadline: Deadline = None) -> PublicKey:
+        """Get a publicKey that matches the id of DID document and the id of publicKey.
+
+        :param did: the id of DID document
+        :param key_id: the id of publicKey
+        :param deadline: the Deadline object by which the publicKey is returned.
+        :return: the publicKey object
+        """
+        document = await self.read_document_async(did, deadline)
+        public_key_property = document.get_public_key_property(key_id)
+        return public_key_property.public_key if public_key_property else public_key_property
+
     def get_version(self) -> str:
         """Get the version of score.
 
@@ -162,28 +473,98 @@ class DidService:
     def read_document(self, did: str) -> Document:
         """Get a DID Document.
 
+        If the service has a document cache, a cached document is returned without reading the blockchain.
+
         :param did: the id of a DID Document
         :return: the Document object
         """
         if not did:
             raise Exception("did cannot be None.")
 
-        json_data = self._did_score.get_did_document(did)
-        try:
-            return Document.deserialize(json_data)
-        except Exception:
-            raise ResolveException(f"'{json_data}' parsing error.")
+        if pinned_height() is not None:
+            return self._load_document(did)
+        if self._document_cache is not None:
+            return self._document_cache.get_or_load(did, self._resolve_document)
+        return self._resolve_document(did)
+
+    async def read_document_async(self, did: str, deadline: Deadline = None) -> Document:
+        """Get a DID Document without blocking the event loop.
+
+        :param did: the id of a DID Document
+        :param deadline: the Deadline object by which the document is returned.
+            A read shared with the other callers goes on after the deadline of this caller.
+        :return: the Document object
+        """
+        if not did:
+            raise Exception("did cannot be None.")
+
+        deadline = effective_deadline(deadline)
+        return await run_within(deadline, self._read_document_async(did), "read_document")
+
+    async def read_documents(
+        self, dids: Sequence[str], window: int = None, deadline: Deadline = None
+    ) -> List[Document]:
+        """Get DID Documents together without blocking the event loop.
+
+        The documents not in the document cache are read by `AsyncTransport.call_many`,
+        which sends them in JSON-RPC batch requests with `AioHttpTransport`.
 
-    async def revoke_key(self, wallet: "KeyWallet", signed_jwt: str) -> Document:
+        :param dids: the ids of DID Documents
+        :param window: the maximum number of requests in flight. (default: `DIDSDK_TRANSPORT_MAX_WORKERS`)
+        :param deadline: the Deadline object by which the documents are returned.
+        :return: the Document objects in the same order as `dids`.
+        """
+        if not all(dids):
+            raise Exception("did cannot be None.")
+
+        deadline = effective_deadline(deadline)
+        use_cache = self._document_cache is not None and pinned_height() is None
+        documents = {}
+        for did in dict.fromkeys(dids):
+            document = self._document_cache.get(did) if use_cache else None
+            if document is not None:
+                documents[did] = document
+
+        missing = [did for did in dict.fromkeys(dids) if did not in documents]
+        results = (
+            await run_within(
+                deadline, self._did_score.get_did_documents_async(missing, window=window), "read_documents"
+            )
+            if missing
+            else []
+        )
+        for did, json_data in zip(missing, results):
+            if isinstance(json_data, BaseException):
+                raise json_data
+            documents[did] = self._deserialize_document(json_data)
+            if use_cache:
+                self._document_cache.put(documents[did])
+        return [documents[did] for did in dids]
+
+    async def revoke_key(
+        self, wallet: Union[KeyWallet, WalletPool], signed_jwt: str, deadline: Deadline = None
+    ) -> Document:
         """Revoke a publicKey in the DID Document.
 
-        :param wallet: the wallet for transaction.
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param signed_jwt: the string that signed the object returned.
+        :param deadline: the Deadline object by which the document is returned.
         :return: the Document object
         """
-        tx_result = await self._send_jwt(wallet, signed_jwt, method="update")
+        deadline = effective_deadline(deadline)
+        tx_result = await self._send_jwt(wallet, signed_jwt, method="update", deadline=deadline)
         did = self._get_did(tx_result["eventLogs"], event_name="RevokeKey(Address,str,str)")
         if not did:
             raise DocumentException(tx_result["failure"]["message"])
 
-        return self.read_document(did)
+        document = self._get_cached_document(did) if self._patch_documents else None
+        self._invalidate_document(did)
+        param = Jwt.decode(signed_jwt).payload.get(PropertyName.KEY_TX_UPDATE_PARAM)
+        key_id = param[PropertyName.KEY_DOCUMENT_PUBLICKEY]
+        if document is None or document.get_public_key_property(key_id) is None:
+            return await self.read_document_async(did, deadline)
+
+        document.revoke_public_key_property(key_id, revoked=self._get_block_height(tx_result))
+        if self._verify_cache is not None:
+            self._verify_cache.invalidate_revoked(document)
+        return await self._store_patched_document(document, deadline)
@@ -1,3 +1,4 @@
+import dataclasses
 import json
 from typing import Dict, List, Union
 
@@ -12,6 +13,8 @@ class Document:
     https://w3c-ccg.github.io/did-spec/#did-documents
     """
 
+    VERSION = "1.0"
+
     def __init__(
         self, id_: str, created: int, public_key: dict, authentication: list, version: str = None, updated: int = None
     ):
@@ -36,12 +39,66 @@ class Document:
             public_key=public_keys,
             authentication=json_data["authentication"],
             version=json_data[PropertyName.KEY_VERSION],
-            updated=PropertyName.KEY_DOCUMENT_UPDATED,
+            updated=json_data.get(PropertyName.KEY_DOCUMENT_UPDATED),
+        )
+
+    @staticmethod
+    def from_public_key(did: str, public_key_property: PublicKeyProperty, created: int) -> "Document":
+        """Build the document that the DID SCORE creates with a publicKey.
+
+        :param did: the id of the document.
+        :param public_key_property: the first publicKey of the document.
+        :param created: the block height of the transaction.
+        :return: the Document object
+        """
+        public_key_property = dataclasses.replace(public_key_property, created=created)
+        return Document(
+            id_=did,
+            created=created,
+            public_key={public_key_property.id: public_key_property},
+            authentication=[{PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY: public_key_property.id}],
+            version=Document.VERSION,
+        )
+
+    def add_public_key_property(self, public_key_property: PublicKeyProperty, updated: int):
+        """Add a publicKey as the DID SCORE does with an `addKey` transaction.
+
+        :param public_key_property: the publicKey to add.
+        :param updated: the block height of the transaction.
+        """
+        public_key_property = dataclasses.replace(public_key_property, created=updated)
+        self.public_key[public_key_property.id] = public_key_property
+        self.authentication.append({PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY: public_key_property.id})
+        self.updated = updated
+
+    def copy(self) -> "Document":
+        return Document(
+            id_=self.id,
+            created=self.created,
+            public_key=dict(self.public_key),
+            authentication=[dict(authentication) for authentication in self.authentication],
+            version=self.version,
+            updated=self.updated,
         )
 
     def get_public_key_property(self, key_id: str) -> PublicKeyProperty:
         return self.public_key.get(key_id)
 
+    def revoke_public_key_property(self, key_id: str, revoked: int):
+        """Revoke a publicKey as the DID SCORE does with a `revokeKey` transaction.
+
+        :param key_id: the id of the publicKey to revoke.
+        :param revoked: the block height of the transaction.
+        """
+        self.public_key[key_id] = dataclasses.replace(self.public_key[key_id], revoked=revoked)
+        # The revoked key can't authenticate the DID anymore.
+        self.authentication = [
+            authentication
+            for authentication in self.authentication
+            if authentication.get(PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY) != key_id
+        ]
+        self.updated = revoked
+
     def serialize(self) -> str:
         public_key = [public_key_property.as_dict() for _, public_key_property in self.public_key.items()]
         dict_data = {
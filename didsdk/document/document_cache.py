@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from iconsdk.exception import IconServiceBaseException
+from loguru import logger
+
+from didsdk import settings
+from didsdk.cache.ttl_cache import CacheStats, TTLCache
+from didsdk.document.document import Document
+from didsdk.exceptions import CircuitOpenException
+from didsdk.transport.call_guard import is_node_failure
+
+
+class DocumentCache:
+    """A bounded cache of resolved DID Documents.
+
+    A document is fresh for `ttl` seconds. After that it is still served for `stale_ttl` seconds
+    while a background refresh fetches the current document from the blockchain.
+    While the node is failing, or the circuit to it is open, it's served for `error_ttl` more seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        ttl: float = None,
+        stale_ttl: float = None,
+        error_ttl: float = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create the instance.
+
+        :param max_size: the maximum number of documents. (default: `DIDSDK_DOCUMENT_CACHE_SIZE`)
+        :param ttl: the seconds a document is fresh. (default: `DIDSDK_DOCUMENT_CACHE_TTL`)
+        :param stale_ttl: the seconds an expired document can be served. (default: `DIDSDK_DOCUMENT_CACHE_STALE_TTL`)
+        :param error_ttl: the seconds after the stale period a document can be served while the node is failing.
+            (default: `DIDSDK_DOCUMENT_CACHE_ERROR_TTL`)
+        :param clock: the function that returns the current time in seconds.
+        """
+        self._cache: TTLCache = TTLCache(
+            max_size=max_size or settings.DIDSDK_DOCUMENT_CACHE_SIZE,
+            ttl=settings.DIDSDK_DOCUMENT_CACHE_TTL if ttl is None else ttl,
+            stale_ttl=settings.DIDSDK_DOCUMENT_CACHE_STALE_TTL if stale_ttl is None else stale_ttl,
+            error_ttl=settings.DIDSDK_DOCUMENT_CACHE_ERROR_TTL if error_ttl is None else error_ttl,
+            clock=clock,
+        )
+        self._clock: Callable[[], float] = clock
+        # The loads in flight of each DID: the token of the DID's generation and the number of loads.
+        # `invalidate` drops the token, so that a load started before it does not put back the document it loaded.
+        self._loads: Dict[str, List] = {}
+        self._revalidating: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, did: str) -> bool:
+        return did in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def _begin_load(self, did: str) -> object:
+        with self._lock:
+            load = self._loads.get(did)
+            if load is None:
+                load = self._loads[did] = [object(), 0]
+            load[1] += 1
+            return load[0]
+
+    def _end_load(self, did: str, token: object, document: Document = None):
+        """Put a loaded document unless the DID was invalidated while it was loaded.
+
+        :param did: the id of a DID Document.
+        :param token: the token returned by `_begin_load`.
+        :param document: the loaded Document object, or None if the load failed.
+        """
+        with self._lock:
+            load = self._loads.get(did)
+            if load is None or load[0] is not token:
+                return
+            load[1] -= 1
+            if load[1] == 0:
+                del self._loads[did]
+            if document is not None:
+                self._cache.put(did, document)
+
+    def _refresh(self, did: str, token: object, loader: Callable[[str], Document]):
+        document = None
+        try:
+            document = loader(did)
+        except Exception as e:
+            logger.debug(f"Failed to revalidate the document of {did}: {e}")
+        finally:
+            self._end_load(did, token, document)
+            with self._lock:
+                self._revalidating.discard(did)
+
+    async def _refresh_async(self, did: str, token: object, loader: Callable[[str], Awaitable[Document]]):
+        document = None
+        try:
+            document = await loader(did)
+        except Exception as e:
+            logger.debug(f"Failed to revalidate the document of {did}: {e}")
+        finally:
+            self._end_load(did, token, document)
+            with self._lock:
+                self._revalidating.discard(did)
+
+    def _start_revalidation(self, did: str) -> Optional[object]:
+        with self._lock:
+            if did in self._revalidating:
+                return None
+            self._revalidating.add(did)
+        return self._begin_load(did)
+
+    def _revalidate(self, did: str, loader: Callable[[str], Document]):
+        token = self._start_revalidation(did)
+        if token is not None:
+            threading.Thread(target=self._refresh, args=(did, token, loader), daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._loads.clear()
+            self._revalidating.clear()
+            self._cache.clear()
+
+    def _get_on_error(self, did: str, error: BaseException) -> Document:
+        if not isinstance(error, CircuitOpenException) and not is_node_failure(error):
+            raise error
+        entry = self._cache.lookup(did, on_error=True)
+        if entry is None:
+            raise error
+        logger.debug(f"Serve the expired document of {did}: {error}")
+        return entry.value
+
+    def get(self, did: str) -> Optional[Document]:
+        """Returns a fresh document without loading it.
+
+        :param did: the id of a DID Document.
+        :return: the Document object, or None if it is not cached or expired.
+        """
+        return self._cache.get(did)
+
+    def get_or_load(self, did: str, loader: Callable[[str], Document]) -> Document:
+        """Returns the cached document, or loads and caches it.
+
+        A stale document is returned as is, and reloaded in the background.
+        If the loader fails because of the node, an expired document in its error period is returned.
+
+        :param did: the id of a DID Document.
+        :param loader: the function that resolves a document from the blockchain.
+        :return: the Document object.
+        """
+        entry = self._cache.lookup(did)
+        if entry is None:
+            token = self._begin_load(did)
+            document = None
+            try:
+                document = loader(did)
+            except (Exception, IconServiceBaseException) as e:
+                return self._get_on_error(did, e)
+            finally:
+                self._end_load(did, token, document)
+            return document
+
+        if not entry.is_fresh(self._clock()):
+            self._revalidate(did, loader)
+        return entry.value
+
+    async def get_or_load_async(self, did: str, loader: Callable[[str], Awaitable[Document]]) -> Document:
+        """Returns the cached document, or awaits the loader and caches the document.
+
+        A stale document is returned as is, and reloaded in a background task.
+        If the loader fails because of the node, an expired document in its error period is returned.
+
+        :param did: the id of a DID Document.
+        :param loader: the coroutine function that resolves a document from the blockchain.
+        :return: the Document object.
+        """
+        entry = self._cache.lookup(did)
+        if entry is None:
+            token = self._begin_load(did)
+            document = None
+            try:
+                document = await loader(did)
+            except (Exception, IconServiceBaseException) as e:
+                return self._get_on_error(did, e)
+            finally:
+                self._end_load(did, token, document)
+            return document
+
+        if not entry.is_fresh(self._clock()):
+            token = self._start_revalidation(did)
+            if token is not None:
+                task = asyncio.create_task(self._refresh_async(did, token, loader))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        return entry.value
+
+    def invalidate(self, did: str) -> bool:
+        """Remove the cached document. A load in flight does not put back the document it loads.
+
+        :param did: the id of a DID Document.
+        :return: True if the document was cached.
+        """
+        with self._lock:
+            self._loads.pop(did, None)
+            self._revalidating.discard(did)
+            return self._cache.invalidate(did)
+
+    def put(self, document: Document):
+        self._cache.put(document.id, document)
@@ -0,0 +1,132 @@
+import json
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Union
+
+from didsdk import settings
+from didsdk.cache.singleflight import SingleFlight
+from didsdk.cache.ttl_cache import CacheStats, TTLCache
+from didsdk.core.property_name import PropertyName
+from didsdk.document.publickey_property import PublicKeyProperty
+from didsdk.exceptions import ResolveException
+from didsdk.jwt.verify_cache import VerifyCache
+from didsdk.score.snapshot import pinned_height
+
+DocumentLoader = Callable[[str], Union[str, dict]]
+AsyncDocumentLoader = Callable[[str], Awaitable[Union[str, dict]]]
+
+
+class KeyResolver:
+    """This class resolves a `kid`(`did#keyId`) to the publicKey of the DID Document.
+
+    Only the requested publicKey of a document is parsed, and the parsed PublicKeyProperty objects are cached
+    by `kid`, so that a verification does not decode the key again. It can be given to `Jwt.verify`,
+    `ClaimRequest.verify` and `ClaimResponse.verify` instead of a public key.
+    In a `snapshot`, the key is read at the pinned height without the cache.
+    A `Jwt.verify` with the resolver uses its VerifyCache object, which drops the tokens of a key found revoked.
+    """
+
+    def __init__(
+        self,
+        loader: DocumentLoader,
+        async_loader: AsyncDocumentLoader = None,
+        max_size: int = None,
+        ttl: float = None,
+        clock: Callable[[], float] = time.monotonic,
+        verify_cache: VerifyCache = None,
+    ):
+        """Create the instance.
+
+        :param loader: the function that returns the json of a DID Document, like `DidScore.get_did_document`.
+        :param async_loader: the coroutine function that returns the json of a DID Document,
+            like `DidScore.get_did_document_async`. It's required for `resolve_async`.
+        :param max_size: the maximum number of cached keys. (default: `DIDSDK_KEY_CACHE_SIZE`)
+        :param ttl: the seconds a key is cached. (default: `DIDSDK_KEY_CACHE_TTL`)
+        :param clock: the function that returns the current time in seconds.
+        :param verify_cache: the cache of verified tokens. If None, every signature is verified.
+        """
+        self._loader: DocumentLoader = loader
+        self._async_loader: Optional[AsyncDocumentLoader] = async_loader
+        self._cache: TTLCache = TTLCache(
+            max_size=max_size or settings.DIDSDK_KEY_CACHE_SIZE,
+            ttl=settings.DIDSDK_KEY_CACHE_TTL if ttl is None else ttl,
+            clock=clock,
+        )
+        self._flight: SingleFlight = SingleFlight()
+        self._verify_cache: Optional[VerifyCache] = verify_cache
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    @property
+    def verify_cache(self) -> Optional[VerifyCache]:
+        return self._verify_cache
+
+    @staticmethod
+    def _split(kid: str) -> Tuple[str, str]:
+        if not kid or "#" not in kid:
+            raise ResolveException(f"'{kid}' is not a kid of 'did#keyId' form.")
+        did, key_id = kid.split("#", 1)
+        return did, key_id
+
+    def _parse(self, kid: str, key_id: str, json_data: Union[str, dict], cache: bool = True) -> PublicKeyProperty:
+        try:
+            json_data = json.loads(json_data) if isinstance(json_data, str) else json_data
+            public_keys = json_data[PropertyName.KEY_DOCUMENT_PUBLICKEY]
+        except Exception:
+            raise ResolveException(f"'{json_data}' parsing error.")
+
+        for public_key in public_keys:
+            if public_key[PropertyName.KEY_DOCUMENT_PUBLICKEY_ID] == key_id:
+                public_key_property = PublicKeyProperty.from_json(public_key)
+                if self._verify_cache is not None and public_key_property.is_revoked():
+                    self._verify_cache.invalidate_key(public_key_property.public_key)
+                if cache:
+                    self._cache.put(kid, public_key_property)
+                return public_key_property
+        raise ResolveException(f"{kid} is not found.")
+
+    def invalidate(self, did: str) -> int:
+        """Remove the cached keys of a DID Document.
+
+        :param did: the id of a DID Document.
+        :return: the number of removed keys.
+        """
+        self._flight.forget(did)
+        prefix = f"{did}#"
+        return self._cache.invalidate_if(lambda kid, _: kid.startswith(prefix))
+
+    def resolve(self, kid: str) -> PublicKeyProperty:
+        """Returns the publicKey of the kid.
+
+        :param kid: the id of a publicKey with the DID, `did#keyId`.
+        :return: the PublicKeyProperty object that has the PublicKey object and its created/revoked heights.
+        """
+        did, key_id = self._split(kid)
+        if pinned_height() is not None:
+            return self._parse(kid, key_id, self._loader(did), cache=False)
+
+        public_key_property = self._cache.get(kid)
+        if public_key_property is not None:
+            return public_key_property
+        json_data = self._flight.do(did, lambda: self._loader(did))
+        return self._parse(kid, key_id, json_data)
+
+    async def resolve_async(self, kid: str) -> PublicKeyProperty:
+        """Returns the publicKey of the kid without blocking the event loop.
+
+        :param kid: the id of a publicKey with the DID, `did#keyId`.
+        :return: the PublicKeyProperty object that has the PublicKey object and its created/revoked heights.
+        """
+        if self._async_loader is None:
+            raise ResolveException("An async loader is required to resolve a key asynchronously.")
+
+        did, key_id = self._split(kid)
+        if pinned_height() is not None:
+            return self._parse(kid, key_id, await self._async_loader(did), cache=False)
+
+        public_key_property = self._cache.get(kid)
+        if public_key_property is not None:
+            return public_key_property
+        json_data = await self._flight.do_async(did, lambda: self._async_loader(did))
+        return self._parse(kid, key_id, json_data)
@@ -1,3 +1,6 @@
+import asyncio
+
+
 class AlgorithmException(Exception):
     pass
 
@@ -36,3 +39,12 @@ class ResolveException(RuntimeError):
 
 class TransactionException(Exception):
     pass
+
+
+class CircuitOpenException(RuntimeError):
+    pass
+
+
+# It's caught as `asyncio.TimeoutError`, which is also the builtin `TimeoutError` since Python 3.11.
+class DeadlineExceededException(asyncio.TimeoutError):
+    pass
@@ -1,13 +1,20 @@
 import json
+import os
+import threading
 import time
-from typing import List
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from coincurve import PrivateKey, PublicKey
+from iconsdk.exception import IconServiceBaseException
 
-from didsdk.core.algorithm_provider import AlgorithmProvider, AlgorithmType
+from didsdk import settings
+from didsdk.core.algorithm_provider import AlgorithmProvider
 from didsdk.document.encoding import Base64URLEncoder
+from didsdk.document.key_resolver import KeyResolver
 from didsdk.exceptions import JwtException
 from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.verify_cache import VerifyCache
 
 
 class VerifyResult:
@@ -32,26 +39,61 @@ class Jwt:
         self._header: Header = header
         self._payload: Payload = payload
         self._encoded_token: List[str] = encoded_token
+        # The string of a decoded token and the positions of its periods.
+        # Its header and payload are parsed when they are first read.
+        self._compact: Optional[str] = None
+        self._periods: Tuple[int, int] = (-1, -1)
+        self._encoding: str = "UTF-8"
 
     @property
     def encoded_token(self) -> List[str]:
+        if self._encoded_token is None and self._compact is not None:
+            self._encoded_token = self._compact.split(".")
         return self._encoded_token
 
+    @property
+    def encoded(self) -> Optional[str]:
+        """The compact string of the token, which is decoded or signed."""
+        if self._compact is not None:
+            return self._compact
+        if isinstance(self._encoded_token, str):
+            return self._encoded_token
+        return ".".join(self._encoded_token) if self._encoded_token else None
+
     @property
     def header(self) -> Header:
+        if self._header is None and self._compact is not None:
+            self._header = Header(**self._parse_segment(0, self._periods[0]))
         return self._header
 
     @property
     def payload(self) -> Payload:
+        if self._payload is None and self._compact is not None:
+            end = self._periods[1] if self._periods[1] >= 0 else len(self._compact)
+            self._payload = Payload(self._parse_segment(self._periods[0] + 1, end))
         return self._payload
 
     @property
     def signature(self) -> str:
+        if self._compact is not None:
+            return self._compact[self._periods[1] + 1 :] if self._periods[1] >= 0 else None
         return self._encoded_token[2] if self._encoded_token and len(self._encoded_token) == 3 else None
 
+    def _parse_segment(self, start: int, end: int) -> dict:
+        return json.loads(Base64URLEncoder.decode(self._compact[start:end]).decode(self._encoding))
+
+    def _signed_content(self) -> Optional[Tuple[str, str]]:
+        """Returns the signed part of the token and its signature, or None if the token is not signed."""
+        if self._compact is not None:
+            second = self._periods[1]
+            return (self._compact[:second], self._compact[second + 1 :]) if second >= 0 else None
+        if self._encoded_token and len(self._encoded_token) == 3:
+            return ".".join(self._encoded_token[0:2]), self._encoded_token[2]
+        return None
+
     def _encode(self, encoding: str = "UTF-8") -> str:
-        header = Base64URLEncoder.encode((json.dumps(self._header.as_dict()).encode(encoding)))
-        payload = Base64URLEncoder.encode(json.dumps(self._payload.as_dict()).encode(encoding))
+        header = Base64URLEncoder.encode((json.dumps(self.header.as_dict()).encode(encoding)))
+        payload = Base64URLEncoder.encode(json.dumps(self.payload.as_dict()).encode(encoding))
         return f"{header}.{payload}"
 
     def compact(self, encoding: str = "UTF-8") -> str:
@@ -59,43 +101,171 @@ class Jwt:
 
     @staticmethod
     def decode(jwt: str, encoding: str = "UTF-8") -> "Jwt":
-        try:
-            encoded_tokens = jwt.split(".")
-            if len(encoded_tokens) not in [2, 3]:
-                raise ValueError("JWT strings must contain exactly 2 period characters.")
-        except ValueError as e:
-            raise JwtException(e)
-
-        decoded_header: bytes = Base64URLEncoder.decode(encoded_tokens[0])
-        decoded_payload: bytes = Base64URLEncoder.decode(encoded_tokens[1])
-        return Jwt(
-            header=Header(**json.loads(decoded_header.decode(encoding))),
-            payload=Payload(json.loads(decoded_payload.decode(encoding))),
-            encoded_token=encoded_tokens,
-        )
+        """Decode a token lazily.
+
+        The string is kept as it is, and the header and the payload are parsed when they are first read,
+        so that reading the `signature` or the `kid` does not parse the payload.
+        A malformed header or payload raises when it's read.
+
+        :param jwt: the compact string of the token.
+        :param encoding: the encoding of the token.
+        :return: the Jwt object.
+        """
+        first = jwt.find(".")
+        second = jwt.find(".", first + 1) if first >= 0 else -1
+        if first < 0 or (second >= 0 and jwt.find(".", second + 1) >= 0):
+            raise JwtException(ValueError("JWT strings must contain exactly 2 period characters."))
+
+        token = Jwt(header=None, payload=None)
+        token._compact = jwt
+        token._periods = (first, second)
+        token._encoding = encoding
+        return token
 
     def sign(self, private_key: PrivateKey, encoding: str = "UTF-8") -> str:
         content = self._encode(encoding)
-        algorithm = AlgorithmProvider.create(AlgorithmType[self._header.alg])
+        algorithm = AlgorithmProvider.create(self.header.alg)
         signature: bytes = algorithm.sign(private_key, content.encode(encoding))
+        self._compact = None
         self._encoded_token = f"{content}.{Base64URLEncoder.encode(signature)}"
         return self._encoded_token
 
-    def verify(self, public_key: PublicKey = None, encoding: str = "UTF-8") -> VerifyResult:
+    def verify(
+        self,
+        public_key: PublicKey = None,
+        encoding: str = "UTF-8",
+        resolver: KeyResolver = None,
+        cache: VerifyCache = None,
+    ) -> VerifyResult:
+        """Verify the signature and the expiration of the token.
+
+        :param public_key: the key to verify the signature. If None, only the expiration is verified.
+        :param encoding: the encoding of the token.
+        :param resolver: the KeyResolver object to resolve the key of the `kid` in the header,
+            which is used if `public_key` is None.
+        :param cache: the VerifyCache object of the tokens verified before, whose signatures are not verified again.
+            If None, the one of the resolver is used.
+        :return: the VerifyResult object.
+        """
+        if cache is None and resolver is not None:
+            cache = resolver.verify_cache
+        if not public_key and resolver:
+            public_key, failure = self._resolve_key(resolver)
+            if failure is not None:
+                return failure
+
         if not public_key:
             return self.verify_expired()
 
-        if not self._encoded_token or len(self._encoded_token) != 3:
+        signed_content = self._signed_content()
+        if signed_content is None:
             raise JwtException("A signature is required for verify.")
+        if cache is not None and cache.contains(self, public_key):
+            return self.verify_expired()
 
-        content = ".".join(self._encoded_token[0:2])
-        signature = Base64URLEncoder.decode(self._encoded_token[2])
-        algorithm = AlgorithmProvider.create(AlgorithmType[self._header.alg])
+        content, encoded_signature = signed_content
+        signature = Base64URLEncoder.decode(encoded_signature)
+        algorithm = AlgorithmProvider.create(self.header.alg)
         if algorithm.verify(public_key, content.encode(encoding), signature):
+            if cache is not None:
+                cache.put(self, public_key)
             return self.verify_expired()
         else:
             return VerifyResult(success=False, fail_message="JWT signature does not match.")
 
+    def _resolve_key(self, resolver: KeyResolver) -> Tuple[Optional[PublicKey], Optional[VerifyResult]]:
+        """Resolve the key of the `kid` in the header.
+
+        :param resolver: the KeyResolver object.
+        :return: the public key, or the failed VerifyResult object if the key can't verify the token.
+        """
+        header = self.header
+        public_key_property = resolver.resolve(header.kid)
+        if public_key_property.public_key is None:
+            return None, VerifyResult(success=False, fail_message=f"The key of {header.kid} is not resolved.")
+        if public_key_property.is_revoked():
+            return None, VerifyResult(success=False, fail_message=f"{header.kid} is revoked.")
+        if public_key_property.algorithm_type.name != header.alg:
+            return None, VerifyResult(success=False, fail_message=f"{header.kid} is not a key of {header.alg}.")
+        return public_key_property.public_key, None
+
+    @staticmethod
+    def verify_many(
+        items: Sequence[Tuple[Union["Jwt", str], Optional[Union[PublicKey, bytes]]]],
+        encoding: str = "UTF-8",
+        resolver: KeyResolver = None,
+        executor: Executor = None,
+        chunk_size: int = None,
+        cache: VerifyCache = None,
+    ) -> List[VerifyResult]:
+        """Verify the signatures and the expirations of tokens in parallel.
+
+        The tokens are verified in chunks of `chunk_size` by the executor. coincurve releases the GIL
+        while it verifies a signature, so the threads of the default executor run on every core.
+        A ProcessPoolExecutor can be given for a large batch, to which the keys are sent as bytes.
+        A key given as bytes is parsed once per chunk.
+
+        The tokens in the cache are not sent to the executor, and the verified ones are added to it.
+
+        Unlike `verify`, a token that can't be verified, like a malformed one, gets a failed result.
+
+        :param items: the pairs of the Jwt object or the encoded token, and its public key or None.
+        :param encoding: the encoding of the tokens.
+        :param resolver: the KeyResolver object to resolve the key of a token without one,
+            which is done in the calling thread before the verification.
+        :param executor: the Executor object that verifies the chunks.
+            If None, a shared pool of `DIDSDK_VERIFY_MAX_WORKERS` threads is used.
+        :param chunk_size: the number of tokens a task verifies. (default: `DIDSDK_VERIFY_CHUNK_SIZE`)
+        :param cache: the VerifyCache object of the tokens verified before. If None, the one of the resolver is used.
+        :return: the VerifyResult objects in the same order as `items`.
+        """
+        chunk_size = chunk_size or settings.DIDSDK_VERIFY_CHUNK_SIZE
+        if cache is None and resolver is not None:
+            cache = resolver.verify_cache
+        to_bytes = isinstance(executor, ProcessPoolExecutor)
+        key_bytes: Dict[int, bytes] = {}
+        results: List[Optional[VerifyResult]] = [None] * len(items)
+        pending = []
+        for index, (token, public_key) in enumerate(items):
+            if not public_key and resolver:
+                try:
+                    token = Jwt.decode(token, encoding) if isinstance(token, str) else token
+                    public_key, failure = token._resolve_key(resolver)
+                except (Exception, IconServiceBaseException) as e:
+                    failure = VerifyResult(success=False, fail_message=str(e))
+                if failure is not None:
+                    results[index] = failure
+                    continue
+            if cache is not None and public_key:
+                try:
+                    token = Jwt.decode(token, encoding) if isinstance(token, str) else token
+                    if cache.contains(token, public_key):
+                        results[index] = token.verify_expired()
+                        continue
+                except Exception as e:
+                    results[index] = VerifyResult(success=False, fail_message=str(e))
+                    continue
+            if to_bytes and isinstance(public_key, PublicKey):
+                public_key = key_bytes.setdefault(id(public_key), public_key.format())
+            pending.append((index, token, public_key))
+
+        chunks = [pending[start : start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        if len(chunks) > 1:
+            executor = executor or _get_verify_executor()
+            futures = [
+                executor.submit(_verify_chunk, [(token, key) for _, token, key in chunk], encoding) for chunk in chunks
+            ]
+            chunk_results = [future.result() for future in futures]
+        else:
+            chunk_results = [_verify_chunk([(token, key) for _, token, key in chunk], encoding) for chunk in chunks]
+
+        for chunk, verify_results in zip(chunks, chunk_results):
+            for (index, token, public_key), result in zip(chunk, verify_results):
+                results[index] = result
+                if cache is not None and public_key and result.success:
+                    cache.put(token, public_key)
+        return results
+
     def verify_iat(self, valid_second: int = None) -> VerifyResult:
         # default 10 seconds.
         if not valid_second:
@@ -116,7 +286,7 @@ class Jwt:
 
     def verify_expired(self) -> VerifyResult:
         now = int(time.time())
-        exp = self._payload.exp
+        exp = self.payload.exp
 
         # TODO: Temporary fix to avoid checking empty exp validation for `Zzeung` mobile app.
         # if not exp:
@@ -131,3 +301,41 @@ class Jwt:
             return VerifyResult(success=False, fail_message="The expiration date has expired.")
 
         return VerifyResult(success=True)
+
+
+_verify_executor: Optional[ThreadPoolExecutor] = None
+_verify_executor_lock = threading.Lock()
+
+
+def _get_verify_executor() -> ThreadPoolExecutor:
+    global _verify_executor
+    with _verify_executor_lock:
+        if _verify_executor is None:
+            _verify_executor = ThreadPoolExecutor(
+                max_workers=settings.DIDSDK_VERIFY_MAX_WORKERS or os.cpu_count(), thread_name_prefix="didsdk-verify"
+            )
+        return _verify_executor
+
+
+def _verify_chunk(
+    items: List[Tuple[Union[Jwt, str], Optional[Union[PublicKey, bytes]]]], encoding: str
+) -> List[VerifyResult]:
+    """Verify the tokens of a chunk of `Jwt.verify_many` in a worker.
+
+    :param items: the pairs of the Jwt object or the encoded token, and its public key, its bytes or None.
+    :param encoding: the encoding of the tokens.
+    :return: the VerifyResult objects in the same order as `items`.
+    """
+    parsed_keys: Dict[bytes, PublicKey] = {}
+    results = []
+    for token, public_key in items:
+        try:
+            jwt = Jwt.decode(token, encoding) if isinstance(token, str) else token
+            if isinstance(public_key, bytes):
+                if public_key not in parsed_keys:
+                    parsed_keys[public_key] = PublicKey(public_key)
+                public_key = parsed_keys[public_key]
+            results.append(jwt.verify(public_key, encoding))
+        except Exception as e:
+            results.append(VerifyResult(success=False, fail_message=str(e)))
+    return results
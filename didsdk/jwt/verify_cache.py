@@ -0,0 +1,113 @@
+import hashlib
+import time
+from typing import TYPE_CHECKING, Callable, Tuple, Union
+
+from coincurve import PublicKey
+
+from didsdk import settings
+from didsdk.cache.ttl_cache import CacheStats, TTLCache
+from didsdk.document.document import Document
+
+if TYPE_CHECKING:
+    from didsdk.jwt.jwt import Jwt
+
+
+class VerifyCache:
+    """A bounded cache of the tokens whose signatures were verified, keyed by the token digest and the key bytes.
+
+    `Jwt.verify` given a cache skips the signature of a token verified with the same key before,
+    but still verifies its expiration. An entry expires after `ttl` seconds, or at the `exp` of the token
+    if earlier. Only a matched signature is cached. The entries of a key are removed when
+    the key is found revoked, by `KeyResolver` or by `DidService` reading its DID Document.
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        ttl: float = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """Create the instance.
+
+        :param max_size: the maximum number of verified tokens. (default: `DIDSDK_VERIFY_CACHE_SIZE`)
+        :param ttl: the seconds a verified token is cached. (default: `DIDSDK_VERIFY_CACHE_TTL`)
+        :param clock: the function that returns the current time in seconds.
+        :param wall_clock: the function that returns the current epoch time in seconds, to compare with `exp`.
+        """
+        self._ttl: float = settings.DIDSDK_VERIFY_CACHE_TTL if ttl is None else ttl
+        self._cache: TTLCache = TTLCache(
+            max_size=max_size or settings.DIDSDK_VERIFY_CACHE_SIZE, ttl=self._ttl, clock=clock
+        )
+        self._wall_clock: Callable[[], float] = wall_clock
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    @staticmethod
+    def _key(jwt: "Jwt", public_key: Union[PublicKey, bytes]) -> Tuple[bytes, bytes]:
+        digest = hashlib.sha256(jwt.encoded.encode()).digest()
+        return digest, public_key if isinstance(public_key, bytes) else public_key.format()
+
+    def contains(self, jwt: "Jwt", public_key: Union[PublicKey, bytes]) -> bool:
+        """Returns True if the signature of the token was verified with the key, and updates the statistics.
+
+        :param jwt: the Jwt object with the signature.
+        :param public_key: the key to verify the signature, or its compressed bytes.
+        :return: True if the verified token is cached.
+        """
+        return self._cache.get(self._key(jwt, public_key)) is not None
+
+    def put(self, jwt: "Jwt", public_key: Union[PublicKey, bytes]):
+        """Store a token whose signature matches the key.
+
+        :param jwt: the Jwt object with the signature.
+        :param public_key: the key which verified the signature, or its compressed bytes.
+        """
+        ttl = self._ttl
+        exp = jwt.payload.exp
+        if exp:
+            ttl = min(ttl, exp - self._wall_clock())
+            if ttl <= 0:
+                return
+        self._cache.put(self._key(jwt, public_key), jwt.header.kid or "", ttl=ttl)
+
+    def invalidate_key(self, public_key: PublicKey) -> int:
+        """Remove the tokens verified with a key.
+
+        :param public_key: the key, which is revoked.
+        :return: the number of removed tokens.
+        """
+        key_bytes = public_key.format()
+        return self._cache.invalidate_if(lambda key, _: key[1] == key_bytes)
+
+    def invalidate_did(self, did: str) -> int:
+        """Remove the tokens whose `kid` is a key of a DID Document.
+
+        :param did: the id of a DID Document.
+        :return: the number of removed tokens.
+        """
+        prefix = f"{did}#"
+        return self._cache.invalidate_if(lambda _, kid: kid.startswith(prefix))
+
+    def invalidate_revoked(self, document: Document) -> int:
+        """Remove the tokens verified with the revoked keys of a DID Document.
+
+        :param document: the Document object.
+        :return: the number of removed tokens.
+        """
+        revoked = {
+            public_key_property.public_key.format()
+            for public_key_property in document.public_key.values()
+            if public_key_property.is_revoked()
+        }
+        if not revoked:
+            return 0
+        return self._cache.invalidate_if(lambda key, _: key[1] in revoked)
+
+    def clear(self):
+        self._cache.clear()
@@ -1,12 +1,17 @@
 import json
+from concurrent.futures import Executor
 from typing import List, Optional
 
+from coincurve import PublicKey
+
 from didsdk.core.algorithm_provider import AlgorithmType
 from didsdk.credential import Credential, CredentialVersion
+from didsdk.document.key_resolver import KeyResolver
+from didsdk.exceptions import JwtException
 from didsdk.jwt.convert_jwt import ConvertJwt
 from didsdk.jwt.elements import Header, Payload
 from didsdk.jwt.issuer_did import IssuerDid
-from didsdk.jwt.jwt import Jwt
+from didsdk.jwt.jwt import Jwt, VerifyResult
 from didsdk.protocol.base_vc import BaseVc
 from didsdk.protocol.json_ld.json_ld_vp import JsonLdVp
 
@@ -182,6 +187,62 @@ class Presentation(ConvertJwt):
             jwt=jwt,
         )
 
+    def get_credential_jwts(self) -> List[str]:
+        """Returns the encoded JWTs of the credentials in the presentation.
+
+        :return: the credential JWTs signed by the issuers.
+        """
+        if CredentialVersion.v1_1 == self.version:
+            return [base_vc.vc for base_vc in self.base_vcs]
+        elif CredentialVersion.v2_0 == self.version:
+            return [self.vp.fulfilledCriteria.get_vc()] if self.vp and self.vp.fulfilledCriteria else []
+        return list(self._credentials)
+
+    def verify_credentials(self, resolver: KeyResolver, executor: Executor = None) -> List[VerifyResult]:
+        """Verify the signatures and the expirations of the credentials by `Jwt.verify_many`.
+
+        :param resolver: the KeyResolver object to resolve the key of each issuer.
+        :param executor: the Executor object that verifies the credentials. If None, the default one is used.
+        :return: the VerifyResult objects in the same order as `get_credential_jwts()`.
+            A credential whose issuer key can't be resolved gets a failed result.
+        """
+        if not resolver:
+            raise JwtException("A KeyResolver is required to verify the credentials.")
+        return Jwt.verify_many(
+            [(credential_jwt, None) for credential_jwt in self.get_credential_jwts()],
+            resolver=resolver,
+            executor=executor,
+        )
+
+    def verify(
+        self, public_key: PublicKey = None, resolver: KeyResolver = None, executor: Executor = None
+    ) -> VerifyResult:
+        """Verify the presentation and the credentials in it, which are verified together by `Jwt.verify_many`.
+
+        :param public_key: the key of the holder. If None, it's resolved by the resolver.
+        :param resolver: the KeyResolver object to resolve the keys of the holder and the issuers.
+            It's required if the presentation has credentials.
+        :param executor: the Executor object that verifies the tokens. If None, the default one is used.
+        :return: the VerifyResult object of the presentation, or of the first credential that fails.
+        """
+        if not self._jwt or not self._jwt.signature:
+            raise JwtException("A signed presentation is required for verify.")
+
+        credential_jwts = self.get_credential_jwts()
+        if not resolver and (credential_jwts or not public_key):
+            raise JwtException("A KeyResolver is required to verify the issuers of the credentials.")
+        results = Jwt.verify_many(
+            [(self._jwt, public_key)] + [(credential_jwt, None) for credential_jwt in credential_jwts],
+            resolver=resolver,
+            executor=executor,
+        )
+        if not results[0].success:
+            return results[0]
+        for index, result in enumerate(results[1:]):
+            if not result.success:
+                return VerifyResult(success=False, fail_message=f"credential[{index}]: {result.fail_message}")
+        return VerifyResult(success=True)
+
     def get_plain_params(self, key: str) -> list:
         """get claim values from Presentation VC
 
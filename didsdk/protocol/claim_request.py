@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 from coincurve import PublicKey
 
 from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.document.key_resolver import KeyResolver
 from didsdk.jwe.ephemeral_publickey import EphemeralPublicKey
 from didsdk.jwt.elements import Header, Payload
 from didsdk.jwt.jwt import Jwt, VerifyResult
@@ -101,8 +102,8 @@ class ClaimRequest:
     def verify_result_time(self, valid_second: int = None) -> VerifyResult:
         return self.jwt.verify_iat(valid_second)
 
-    def verify(self, public_key: PublicKey) -> VerifyResult:
-        return self.jwt.verify(public_key)
+    def verify(self, public_key: PublicKey = None, resolver: KeyResolver = None) -> VerifyResult:
+        return self.jwt.verify(public_key, resolver=resolver)
 
     @classmethod
     def from_(
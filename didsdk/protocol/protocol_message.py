@@ -204,7 +204,8 @@ class ProtocolMessage:
         self._is_decrypted = True
         self._is_protected = False
         self._jwt = Jwt.decode(self._plain_message)
-        logger.debug(f">>>decoded payload: {self._jwt.payload.as_dict()}")
+        # The payload is parsed for the log only if it is written.
+        logger.opt(lazy=True).debug(">>>decoded payload: {}", lambda: self._jwt.payload.as_dict())
 
         if ProtocolType.is_request_member(self._type):
             if self._type == ProtocolType.REQUEST_PRESENTATION.value:
@@ -448,8 +449,8 @@ class ProtocolMessage:
             return SignResult(fail_message=f"Type({self._type}) is cannot sign.")
 
         self._jwt = Jwt.decode(self._plain_message)
-        logger.debug(f">>>jwt header:{self._jwt.header.as_dict()}")
-        logger.debug(f">>>jwt payload:{self._jwt.payload.as_dict()}")
+        logger.opt(lazy=True).debug(">>>jwt header:{}", lambda: self._jwt.header.as_dict())
+        logger.opt(lazy=True).debug(">>>jwt payload:{}", lambda: self._jwt.payload.as_dict())
         if self._request_public_key:
             if not ecdh_key:
                 return SignResult(fail_message="Issuer's ECDH PrivateKey is required for createJwe.")
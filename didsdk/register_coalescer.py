@@ -0,0 +1,148 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from coincurve import PrivateKey
+from iconsdk.exception import IconServiceBaseException
+from iconsdk.wallet.wallet import KeyWallet
+from loguru import logger
+
+from didsdk import settings
+from didsdk.exceptions import VCException
+from didsdk.wallet_pool import WalletPool
+
+RegisterFunction = Callable[[Union[KeyWallet, WalletPool], str, PrivateKey], Awaitable[dict]]
+RegisterListFunction = Callable[[Union[KeyWallet, WalletPool], List[str], PrivateKey], Awaitable[dict]]
+
+
+@dataclass
+class _Batch:
+    wallet: Union[KeyWallet, WalletPool]
+    private_key: PrivateKey
+    credentials: List[str] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class RegisterCoalescer:
+    """This class merges concurrent registrations of single VCs into `registerList` transactions.
+
+    The registrations with the same wallet, or the same wallet pool, and key are buffered for `max_delay` seconds
+    or until `max_batch` of them, and sent in a transaction. Every caller gets the result of the shared transaction.
+    If the transaction fails, its credentials are registered one by one so that each caller gets its own outcome.
+    If it's not confirmed, for a timeout or a transport error, every caller gets the error.
+    """
+
+    def __init__(
+        self,
+        register: RegisterFunction,
+        register_list: RegisterListFunction,
+        max_batch: int = None,
+        max_delay: float = None,
+    ):
+        """Create the instance.
+
+        :param register: the coroutine function that registers a VC, like `VCService.register`.
+        :param register_list: the coroutine function that registers VCs in a transaction,
+            like `VCService.register_list`.
+        :param max_batch: the maximum number of VCs in a transaction. (default: `DIDSDK_REGISTER_COALESCE_MAX_BATCH`)
+        :param max_delay: the seconds to wait for more registrations. (default: `DIDSDK_REGISTER_COALESCE_MAX_DELAY`)
+        """
+        self._register: RegisterFunction = register
+        self._register_list: RegisterListFunction = register_list
+        self._max_batch: int = max_batch or settings.DIDSDK_REGISTER_COALESCE_MAX_BATCH
+        self._max_delay: float = settings.DIDSDK_REGISTER_COALESCE_MAX_DELAY if max_delay is None else max_delay
+        self._batches: Dict[Tuple[Hashable, bytes], _Batch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(batch.credentials) for batch in self._batches.values())
+
+    def _flush(self, key: Tuple[Hashable, bytes]):
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: _Batch):
+        if len(batch.credentials) == 1:
+            await self._resolve(batch.futures[0], self._register(batch.wallet, batch.credentials[0], batch.private_key))
+            return
+
+        try:
+            tx_result = await self._register_list(batch.wallet, batch.credentials, batch.private_key)
+        except VCException as e:
+            # The transaction failed, so the VCs are not registered, and the ones without a fault can be registered.
+            logger.debug(f"Failed to register {len(batch.credentials)} VCs in a transaction: {e}")
+            await asyncio.gather(
+                *[
+                    self._resolve(future, self._register(batch.wallet, credential, batch.private_key))
+                    for credential, future in zip(batch.credentials, batch.futures)
+                ]
+            )
+        except (Exception, IconServiceBaseException) as e:
+            # The transaction may be committed after a timeout or a transport error, so it's not sent again.
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_result(tx_result)
+
+    @staticmethod
+    async def _resolve(future: asyncio.Future, registration: Awaitable[dict]):
+        try:
+            tx_result = await registration
+        except (Exception, IconServiceBaseException) as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(tx_result)
+
+    async def flush(self):
+        """Sends all the buffered registrations now, and waits for their results."""
+        for key in list(self._batches):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def register(self, wallet: Union[KeyWallet, WalletPool], credential: str, private_key: PrivateKey) -> dict:
+        """Register VC with the other VCs registered in a moment.
+
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from when the batch is sent.
+        :param credential: signed credential
+        :param private_key: Key to sign credential
+        :return: the transaction result which may include the other VCs.
+        """
+        loop = asyncio.get_running_loop()
+        # A batch of a pool leases a wallet when it's sent, so the batches of a pool are not split by wallet.
+        key = (wallet if isinstance(wallet, WalletPool) else wallet.get_address(), private_key.secret)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _Batch(wallet=wallet, private_key=private_key)
+            batch.timer = loop.call_later(self._max_delay, self._flush, key)
+            self._batches[key] = batch
+
+        future = loop.create_future()
+        batch.credentials.append(credential)
+        batch.futures.append(future)
+        if len(batch.credentials) >= self._max_batch:
+            self._flush(key)
+        return await future
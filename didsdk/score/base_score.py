@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from typing import Any, Hashable, List, Optional
+
+from iconsdk.builder.call_builder import Call, CallBuilder
+from iconsdk.builder.transaction_builder import CallTransaction, CallTransactionBuilder
+from iconsdk.icon_service import IconService
+
+from didsdk import settings
+from didsdk.cache.ttl_cache import TTLCache
+from didsdk.score.snapshot import pinned_height
+from didsdk.score.step_estimator import StepEstimator, payload_size
+from didsdk.transport.async_transport import AsyncTransport, ExecutorTransport
+from didsdk.transport.call_guard import CallGuard, GuardedTransport
+
+_timestamp_lock = threading.Lock()
+_last_timestamp = 0
+
+
+def _unique_timestamp() -> int:
+    """Returns the current time in microseconds, which is always greater than the previous one.
+
+    Transactions built in a tight loop by the same wallet would otherwise share a timestamp and a hash.
+    """
+    global _last_timestamp
+    with _timestamp_lock:
+        _last_timestamp = max(int(time.time() * 1_000_000), _last_timestamp + 1)
+        return _last_timestamp
+
+
+class BaseScore:
+    """The common part of the score clients.
+
+    A read method is sent by the `IconService` object, and its `_async` counterpart by the `AsyncTransport` object.
+    A read at a block height, given by the `height` parameter or by `snapshot`, never changes,
+    so its result is kept in the pinned cache without expiration.
+    With a `CallGuard`, the requests of both are sent through it, and so are the transactions sent by the transport.
+    A transaction is built with the step limit estimated by the `StepEstimator` object from the confirmed ones,
+    or with `DEFAULT_STEP_LIMIT` until its method has been confirmed.
+    """
+
+    DEFAULT_STEP_LIMIT = 5_000_000
+
+    def __init__(
+        self,
+        iconservice: IconService,
+        network_id: int,
+        score_address: str,
+        transport: AsyncTransport = None,
+        pinned_cache: TTLCache = None,
+        guard: CallGuard = None,
+        step_estimator: StepEstimator = None,
+    ):
+        """Create the instance.
+
+        :param iconservice: the IconService object.
+        :param network_id: the network ID of the blockchain.
+        :param score_address: the score address deployed to the blockchain.
+        :param transport: the AsyncTransport object for the async methods.
+            If None, the IconService object is run in a thread pool.
+        :param pinned_cache: the cache of the reads at a block height, which can be shared by scores.
+            If None, a new one of `DIDSDK_PINNED_READ_CACHE_SIZE` entries is created.
+        :param guard: the CallGuard object which limits the requests to the node, and can be shared by scores.
+            If None, the requests are sent as they are.
+        :param step_estimator: the StepEstimator object of the transactions. If None, a new one is created.
+        """
+        self._iconservice: IconService = iconservice
+        self._network_id: int = network_id
+        self._score_address: str = score_address
+        self._guard: Optional[CallGuard] = guard
+        transport = transport if transport else ExecutorTransport(iconservice)
+        self._transport: AsyncTransport = GuardedTransport(transport, guard) if guard is not None else transport
+        if pinned_cache is None and settings.DIDSDK_PINNED_READ_CACHE_SIZE > 0:
+            pinned_cache = TTLCache(max_size=settings.DIDSDK_PINNED_READ_CACHE_SIZE, ttl=None)
+        self._pinned_cache: Optional[TTLCache] = pinned_cache
+        self._step_estimator: StepEstimator = step_estimator or StepEstimator()
+
+    @property
+    def score_address(self) -> str:
+        return self._score_address
+
+    @property
+    def guard(self) -> Optional[CallGuard]:
+        return self._guard
+
+    @property
+    def pinned_cache(self) -> Optional[TTLCache]:
+        return self._pinned_cache
+
+    @property
+    def step_estimator(self) -> StepEstimator:
+        return self._step_estimator
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    def _build_call(self, method: str, from_address: str = None, params=None, height: int = None) -> Call:
+        height = pinned_height() if height is None else height
+        builder = CallBuilder(from_=from_address, to=self._score_address, method=method, params=params, height=height)
+        return builder.build()
+
+    def _build_transaction(
+        self, from_address: str, method: str, params: dict, step_limit: int = None
+    ) -> CallTransaction:
+        timestamp = _unique_timestamp()
+        if step_limit is None:
+            step_limit = self._step_estimator.step_limit(method, payload_size(params)) or self.DEFAULT_STEP_LIMIT
+        builder = CallTransactionBuilder(
+            nid=self._network_id,
+            from_=from_address,
+            to=self._score_address,
+            step_limit=step_limit,
+            timestamp=timestamp,
+            method=method,
+            params=params,
+        )
+        return builder.build()
+
+    def _pinned_key(self, call: Call) -> Optional[Hashable]:
+        if call.height is None or self._pinned_cache is None:
+            return None
+        return call.to, call.from_, call.method, json.dumps(call.params, sort_keys=True), call.height
+
+    def _send_call(self, call: Call) -> Any:
+        if self._guard is not None:
+            return self._guard.run(self._iconservice.call, call)
+        return self._iconservice.call(call)
+
+    def _call(self, call: Call) -> Any:
+        key = self._pinned_key(call)
+        if key is None:
+            return self._send_call(call)
+
+        entry = self._pinned_cache.lookup(key)
+        if entry is not None:
+            return entry.value
+        result = self._send_call(call)
+        self._pinned_cache.put(key, result)
+        return result
+
+    async def _call_many_async(self, calls: List[Call], window: int = None) -> List[Any]:
+        """Sends the calls together by `AsyncTransport.call_many`.
+
+        :param calls: the Call objects.
+        :param window: the maximum number of requests in flight.
+        :return: the values or the exceptions in the same order as `calls`.
+        """
+        results: List[Any] = [None] * len(calls)
+        keys = [self._pinned_key(call) for call in calls]
+        missing = []
+        for index, key in enumerate(keys):
+            entry = self._pinned_cache.lookup(key) if key is not None else None
+            if entry is not None:
+                results[index] = entry.value
+            else:
+                missing.append(index)
+
+        values = await self._transport.call_many([calls[index] for index in missing], window) if missing else []
+        for index, value in zip(missing, values):
+            results[index] = value
+            if keys[index] is not None and not isinstance(value, BaseException):
+                self._pinned_cache.put(keys[index], value)
+        return results
+
+    async def _call_async(self, call: Call) -> Any:
+        key = self._pinned_key(call)
+        if key is None:
+            return await self._transport.call(call)
+
+        entry = self._pinned_cache.lookup(key)
+        if entry is not None:
+            return entry.value
+        result = await self._transport.call(call)
+        self._pinned_cache.put(key, result)
+        return result
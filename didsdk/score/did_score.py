@@ -1,50 +1,45 @@
-import time
-
-from iconsdk.builder.call_builder import Call, CallBuilder
-from iconsdk.builder.transaction_builder import CallTransaction, CallTransactionBuilder
-from iconsdk.icon_service import IconService
-
-
-class DidScore:
-    def __init__(self, iconservice: IconService, network_id: int, score_address: str):
-        self._iconservice: IconService = iconservice
-        self._network_id: int = network_id
-        self._score_address: str = score_address
-
-    def _build_call(self, method: str, from_address: str = None, params=None) -> Call:
-        builder = CallBuilder(from_=from_address, to=self._score_address, method=method, params=params)
-        return builder.build()
-
-    def _build_transaction(self, from_address: str, method: str, params: dict) -> CallTransaction:
-        timestamp = int(time.time() * 1_000_000)
-        builder = CallTransactionBuilder(
-            nid=self._network_id,
-            from_=from_address,
-            to=self._score_address,
-            step_limit=5_000_000,
-            timestamp=timestamp,
-            method=method,
-            params=params,
-        )
-        return builder.build()
-
-    def create(self, from_address: str, public_key: str) -> CallTransaction:
+from typing import Any, List
+
+from iconsdk.builder.transaction_builder import CallTransaction
+
+from didsdk.score.base_score import BaseScore
+
+
+class DidScore(BaseScore):
+    def create(self, from_address: str, public_key: str, step_limit: int = None) -> CallTransaction:
         params = {"publicKey": public_key}
-        return self._build_transaction(from_address, method="create", params=params)
+        return self._build_transaction(from_address, method="create", params=params, step_limit=step_limit)
+
+    def get_did(self, from_address: str, height: int = None) -> str:
+        call = self._build_call(from_address=from_address, method="getDid", height=height)
+        return self._call(call)
 
-    def get_did(self, from_address: str) -> str:
-        call = self._build_call(from_address=from_address, method="getDid")
-        return self._iconservice.call(call)
+    async def get_did_async(self, from_address: str, height: int = None) -> str:
+        call = self._build_call(from_address=from_address, method="getDid", height=height)
+        return await self._call_async(call)
 
-    def get_did_document(self, did: str) -> dict:
+    def get_did_document(self, did: str, height: int = None) -> dict:
         params = {"did": did}
-        call = self._build_call(method="read", params=params)
-        return self._iconservice.call(call)
+        call = self._build_call(method="read", params=params, height=height)
+        return self._call(call)
+
+    async def get_did_document_async(self, did: str, height: int = None) -> dict:
+        params = {"did": did}
+        call = self._build_call(method="read", params=params, height=height)
+        return await self._call_async(call)
+
+    async def get_did_documents_async(self, dids: List[str], height: int = None, window: int = None) -> List[Any]:
+        calls = [self._build_call(method="read", params={"did": did}, height=height) for did in dids]
+        return await self._call_many_async(calls, window)
+
+    def get_version(self, height: int = None) -> str:
+        call = self._build_call(method="getVersion", height=height)
+        return self._call(call)
 
-    def get_version(self) -> str:
-        call = self._build_call(method="getVersion")
-        return self._iconservice.call(call)
+    async def get_version_async(self, height: int = None) -> str:
+        call = self._build_call(method="getVersion", height=height)
+        return await self._call_async(call)
 
-    def jwt_method(self, from_address: str, method: str, jwt: str) -> CallTransaction:
+    def jwt_method(self, from_address: str, method: str, jwt: str, step_limit: int = None) -> CallTransaction:
         params = {"jwt": jwt}
-        return self._build_transaction(from_address, method=method, params=params)
+        return self._build_transaction(from_address, method=method, params=params, step_limit=step_limit)
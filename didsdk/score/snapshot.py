@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_pinned_height: ContextVar[Optional[int]] = ContextVar("didsdk_pinned_height", default=None)
+
+
+def pinned_height() -> Optional[int]:
+    """Returns the block height that the reads of the current context are pinned to.
+
+    :return: the block height, or None to read the latest state.
+    """
+    return _pinned_height.get()
+
+
+@contextmanager
+def snapshot(height: int) -> Iterator[int]:
+    """Pin the score reads in the block to a block height.
+
+    Every read of `DidScore` and `VCScore` without an explicit `height`, and so of the services using them,
+    sees the state at the height. It follows the context of the current thread or asyncio task,
+    so that concurrent verifications can be pinned to their own heights.
+    The caches of the latest state are bypassed in a snapshot.
+
+    :param height: the block height to read at.
+    :return: the block height.
+    """
+    if height is None or height < 0:
+        raise ValueError("height must be a non-negative number.")
+
+    token = _pinned_height.set(height)
+    try:
+        yield height
+    finally:
+        _pinned_height.reset(token)
@@ -0,0 +1,201 @@
+import math
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from iconsdk.builder.transaction_builder import CallTransaction
+from loguru import logger
+
+from didsdk import settings
+
+# The status code of a transaction which ran out of steps
+OUT_OF_STEP_CODE = 0xA
+
+
+def payload_size(params: Optional[dict]) -> int:
+    """Returns the size of the parameters of a score method, which the step cost grows with.
+
+    :param params: the parameters of the method.
+    :return: the total length of the parameter values.
+    """
+    return sum(len(str(value)) for value in params.values()) if params else 0
+
+
+def is_out_of_step(tx_result: dict) -> bool:
+    """Returns True if a transaction failed for lack of steps.
+
+    :param tx_result: the transaction result.
+    :return: True if it ran out of steps.
+    """
+    failure = tx_result.get("failure")
+    if tx_result.get("status") == 1 or not failure:
+        return False
+    code = failure.get("code")
+    if isinstance(code, str):
+        code = int(code, 16) if code.startswith("0x") else int(code)
+    message = str(failure.get("message", "")).lower().replace(" ", "")
+    return code == OUT_OF_STEP_CODE or "outofstep" in message
+
+
+class StepEstimator:
+    """This class estimates the step limit of a transaction from the steps used by the confirmed ones.
+
+    The step used by a method is modeled as a linear function of the payload size, fitted to the smallest and
+    the largest transactions confirmed. The limit of a size bucket is the estimate at the top of the bucket,
+    or the most used in the bucket if larger, times `margin`. It's cached until a new sample changes the model.
+    A method without samples gets no estimate, and the score uses its default limit.
+    An estimate from the node, like `IconService.estimate_step`, can be given to `record` as a sample.
+    """
+
+    def __init__(
+        self,
+        margin: float = None,
+        bucket_bytes: int = None,
+        max_step_limit: int = None,
+        retry_count: int = None,
+    ):
+        """Create the instance.
+
+        :param margin: the ratio of the limit to the estimated step. (default: `DIDSDK_STEP_MARGIN`)
+        :param bucket_bytes: the payload size of a bucket. (default: `DIDSDK_STEP_BUCKET_BYTES`)
+        :param max_step_limit: the largest limit to estimate or to retry with. (default: `DIDSDK_STEP_MAX_LIMIT`)
+        :param retry_count: the number of times a transaction out of steps is sent again with a higher limit.
+            (default: `DIDSDK_STEP_RETRY_COUNT`)
+        """
+        self._margin: float = margin or settings.DIDSDK_STEP_MARGIN
+        self._bucket_bytes: int = bucket_bytes or settings.DIDSDK_STEP_BUCKET_BYTES
+        self._max_step_limit: int = max_step_limit or settings.DIDSDK_STEP_MAX_LIMIT
+        self._retry_count: int = settings.DIDSDK_STEP_RETRY_COUNT if retry_count is None else retry_count
+        self._lock = threading.Lock()
+        # The step used by the smallest and the largest transactions of each method, by the payload size
+        self._samples: Dict[str, Dict[int, int]] = {}
+        # The most step used in each bucket, which is a lower bound of its limit
+        self._bucket_max: Dict[Tuple[str, int], int] = {}
+        self._limits: Dict[Tuple[str, int], int] = {}
+        self._retries: int = 0
+
+    def _bucket(self, size: int) -> int:
+        return size // self._bucket_bytes
+
+    def has_samples(self, method: str) -> bool:
+        return method in self._samples
+
+    def estimate(self, method: str, size: int) -> Optional[float]:
+        """Estimates the step used by a transaction, without the margin.
+
+        With two samples, the step is the linear function of the size through them.
+        With a sample, it's proportional to the size above the sample, which overestimates the step
+        of a larger transaction, and the same below it.
+
+        :param method: the name of the score method.
+        :param size: the payload size returned by `payload_size`.
+        :return: the estimated step, or None if the method has no samples.
+        """
+        samples = self._samples.get(method)
+        if not samples:
+            return None
+        (min_size, min_step), *rest = sorted(samples.items())
+        if not rest:
+            return min_step * max(size, min_size) / max(min_size, 1)
+        max_size, max_step = rest[-1]
+        step_per_byte = max((max_step - min_step) / (max_size - min_size), 0)
+        return min_step + step_per_byte * (size - min_size)
+
+    def step_limit(self, method: str, size: int) -> Optional[int]:
+        """Returns the step limit of a transaction.
+
+        :param method: the name of the score method.
+        :param size: the payload size returned by `payload_size`.
+        :return: the step limit, or None if the method has no samples.
+        """
+        key = (method, self._bucket(size))
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is not None:
+                return limit
+            estimate = self.estimate(method, (key[1] + 1) * self._bucket_bytes)
+            if estimate is None:
+                return None
+            estimate = max(estimate, self._bucket_max.get(key, 0))
+            limit = min(math.ceil(estimate * self._margin), self._max_step_limit)
+            self._limits[key] = limit
+            return limit
+
+    def record(self, method: str, size: int, step_used: int):
+        """Adds the step used by a transaction to the samples.
+
+        :param method: the name of the score method.
+        :param size: the payload size returned by `payload_size`.
+        :param step_used: the step used by the transaction, or estimated by the node.
+        """
+        key = (method, self._bucket(size))
+        with self._lock:
+            changed = step_used > self._bucket_max.get(key, 0)
+            if changed:
+                self._bucket_max[key] = step_used
+
+            samples = self._samples.setdefault(method, {})
+            if step_used > samples.get(size, 0):
+                samples[size] = step_used
+                if len(samples) > 2:
+                    sizes = sorted(samples)
+                    for size_to_drop in sizes[1:-1]:
+                        del samples[size_to_drop]
+                changed = changed or size in samples
+            if changed:
+                self._limits = {cached: limit for cached, limit in self._limits.items() if cached[0] != method}
+
+    def record_transaction(self, transaction: CallTransaction, step_used: int):
+        """Adds the step used by a confirmed transaction to the samples.
+
+        :param transaction: the CallTransaction object.
+        :param step_used: the `stepUsed` of the transaction result.
+        """
+        self.record(transaction.method, payload_size(transaction.params), step_used)
+
+    def raise_limit(self, transaction: CallTransaction) -> Optional[int]:
+        """Returns the step limit to send again a transaction which ran out of steps.
+
+        The steps given to the transaction become the lower bound of its bucket.
+
+        :param transaction: the CallTransaction object which ran out of steps.
+        :return: the doubled limit, or None if the limit is already the maximum.
+        """
+        if transaction.step_limit >= self._max_step_limit:
+            return None
+        self.record(transaction.method, payload_size(transaction.params), transaction.step_limit)
+        return min(transaction.step_limit * 2, self._max_step_limit)
+
+    async def run(
+        self,
+        build: Callable[[Optional[int]], CallTransaction],
+        send: Callable[[CallTransaction], Awaitable[dict]],
+    ) -> dict:
+        """Sends a transaction, and sends it again with a higher limit while it runs out of steps.
+
+        :param build: the function that builds the transaction with a step limit, or with the estimated one for None.
+        :param send: the coroutine function that sends a transaction and returns its result.
+        :return: the result of the last transaction.
+        """
+        transaction = build(None)
+        for retry in range(self._retry_count + 1):
+            tx_result = await send(transaction)
+            if tx_result["status"] == 1:
+                self.record_transaction(transaction, tx_result["stepUsed"])
+                return tx_result
+            if retry == self._retry_count or not is_out_of_step(tx_result):
+                return tx_result
+
+            step_limit = self.raise_limit(transaction)
+            if step_limit is None:
+                return tx_result
+            logger.debug(f"{transaction.method} ran out of {transaction.step_limit} steps, retry with {step_limit}")
+            self._retries += 1
+            transaction = build(step_limit)
+
+    def metrics(self) -> dict:
+        """Returns the state of the estimator.
+
+        :return: the methods with samples, the cached limits and the transactions sent again.
+        """
+        with self._lock:
+            return {"methods": sorted(self._samples), "cached_limits": len(self._limits), "retries": self._retries}
@@ -1,94 +1,93 @@
-import time
-from typing import List
+from typing import Any, List
 
 from coincurve import PrivateKey
-from iconsdk.builder.call_builder import Call, CallBuilder
-from iconsdk.builder.transaction_builder import CallTransaction, CallTransactionBuilder
-from iconsdk.icon_service import IconService
+from iconsdk.builder.transaction_builder import CallTransaction
 
 from didsdk.score import vc_score_parameter
+from didsdk.score.base_score import BaseScore
 
 
-class VCScore:
-    def __init__(self, iconservice: IconService, network_id: int, score_address: str):
-        self._iconservice: IconService = iconservice
-        self._network_id: int = network_id
-        self._score_address: str = score_address
-
-    def _build_call(self, method: str, from_address: str = None, params=None) -> Call:
-        builder = CallBuilder(from_=from_address, to=self._score_address, method=method, params=params)
-        return builder.build()
-
-    def _build_transaction(self, from_address: str, method: str, params: dict) -> CallTransaction:
-        timestamp = int(time.time() * 1_000_000)
-        builder = CallTransactionBuilder(
-            nid=self._network_id,
-            from_=from_address,
-            to=self._score_address,
-            step_limit=5_000_000,
-            timestamp=timestamp,
-            method=method,
-            params=params,
-        )
-        return builder.build()
-
+class VCScore(BaseScore):
     def register(
         self,
         from_address: str,
         credential: str,
         private_key: PrivateKey,
+        step_limit: int = None,
     ) -> CallTransaction:
         credential_jwt: str = vc_score_parameter.register_jwt(credential, private_key)
         params = {"credentialJwt": credential_jwt}
-        return self._build_transaction(from_address, method="register", params=params)
+        return self._build_transaction(from_address, method="register", params=params, step_limit=step_limit)
 
     def register_list(
         self,
         from_address: str,
         signed_credentials: List[str],
         private_key: PrivateKey,
+        step_limit: int = None,
     ) -> CallTransaction:
         credential_list = [
             vc_score_parameter.register_jwt(credential, private_key) for credential in signed_credentials
         ]
-        params = {"credentialJwtList": ",".join(credential_list)}
-        return self._build_transaction(from_address, method="registerList", params=params)
+        return self.register_jwt_list(from_address, credential_list, step_limit)
+
+    def register_jwt_list(
+        self, from_address: str, credential_jwts: List[str], step_limit: int = None
+    ) -> CallTransaction:
+        params = {"credentialJwtList": ",".join(credential_jwts)}
+        return self._build_transaction(from_address, method="registerList", params=params, step_limit=step_limit)
 
-    def revoke(self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey) -> CallTransaction:
+    def revoke(
+        self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey, step_limit: int = None
+    ) -> CallTransaction:
         credential_jwt: str = vc_score_parameter.revoke_jwt(credential, issuer_did, private_key)
         params = {"credentialJwt": credential_jwt}
-        return self._build_transaction(from_address, method="revoke", params=params)
+        return self._build_transaction(from_address, method="revoke", params=params, step_limit=step_limit)
 
     def revoke_did(
-        self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey
+        self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey, step_limit: int = None
     ) -> CallTransaction:
         credential_jwt: str = vc_score_parameter.revoke_jwt(credential, issuer_did, private_key)
         params = {"credentialJwt": credential_jwt}
-        return self._build_transaction(from_address, method="revokeDid", params=params)
+        return self._build_transaction(from_address, method="revokeDid", params=params, step_limit=step_limit)
 
     def revoke_vc_and_did(
-        self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey
+        self, from_address: str, credential: str, issuer_did: str, private_key: PrivateKey, step_limit: int = None
     ) -> CallTransaction:
         credential_jwt: str = vc_score_parameter.revoke_jwt(credential, issuer_did, private_key)
         params = {"credentialJwt": credential_jwt}
-        return self._build_transaction(from_address, method="revokeVcAndDid", params=params)
+        return self._build_transaction(from_address, method="revokeVcAndDid", params=params, step_limit=step_limit)
 
-    def get(self, sig: str) -> dict:
+    def get(self, sig: str, height: int = None) -> dict:
         params = {"sig": sig}
-        call = self._build_call(method="get", params=params)
-        return self._iconservice.call(call)
+        call = self._build_call(method="get", params=params, height=height)
+        return self._call(call)
 
-    def is_valid(self, sig: str) -> str:
+    async def get_async(self, sig: str, height: int = None) -> dict:
         params = {"sig": sig}
-        call = self._build_call(method="isValid", params=params)
-        return self._iconservice.call(call)
+        call = self._build_call(method="get", params=params, height=height)
+        return await self._call_async(call)
+
+    def is_valid(self, sig: str, height: int = None) -> str:
+        params = {"sig": sig}
+        call = self._build_call(method="isValid", params=params, height=height)
+        return self._call(call)
+
+    async def is_valid_async(self, sig: str, height: int = None) -> str:
+        params = {"sig": sig}
+        call = self._build_call(method="isValid", params=params, height=height)
+        return await self._call_async(call)
+
+    async def is_valid_many_async(self, sigs: List[str], height: int = None, window: int = None) -> List[Any]:
+        calls = [self._build_call(method="isValid", params={"sig": sig}, height=height) for sig in sigs]
+        return await self._call_many_async(calls, window)
 
-    def get_undertaker_list(self) -> str:
+    def get_undertaker_list(self, height: int = None) -> str:
         params = {}
-        call = self._build_call(method="getUndertakerList", params=params)
-        return self._iconservice.call(call)
+        call = self._build_call(method="getUndertakerList", params=params, height=height)
+        return self._call(call)
 
-    def get_reject_history(self, vc_id: str) -> str:
+    def get_reject_history(self, vc_id: str, height: int = None) -> str:
         params = {"vcId": vc_id}
-        call = self._build_call(method="getRejectHistory", params=params)
-        return self._iconservice.call(call)
+        call = self._build_call(method="getRejectHistory", params=params, height=height)
+        return self._call(call)
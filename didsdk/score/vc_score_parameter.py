@@ -7,14 +7,13 @@ from didsdk.jwt.jwt import Jwt, Payload
 
 def register_jwt(credential: str, private_key: PrivateKey) -> str:
     credential_jwt: Jwt = Jwt.decode(credential)
-    payload: Payload = credential_jwt.payload
-    credential_payload: dict = payload.as_dict()
+    credential_payload: Payload = credential_jwt.payload
     payload = Payload(
         {
-            "issuerDid": credential_payload["iss"],
+            "issuerDid": credential_payload.iss,
             "sig": credential_jwt.signature,
-            "issueDate": credential_payload["iat"],
-            "expiryDate": credential_payload["exp"],
+            "issueDate": credential_payload.iat,
+            "expiryDate": credential_payload.exp,
         }
     )
     jwt: Jwt = Jwt(credential_jwt.header, payload)
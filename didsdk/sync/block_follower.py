@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+from didsdk import settings
+from didsdk.sync.block_source import BlockSource
+
+
+class BlockFollower:
+    """The base class of the components that follow the transactions of a score block by block.
+
+    `sync()` reads the blocks after the checkpoint, and passes each successful transaction to the score
+    to `_apply_transaction()`. The checkpoint moves after every block, so a follower resumes from the block
+    after the last one it has applied.
+    """
+
+    def __init__(
+        self,
+        source: BlockSource,
+        score_address: str,
+        start_height: int = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create the instance.
+
+        :param source: the BlockSource object to read blocks.
+        :param score_address: the address of score to follow.
+        :param start_height: the height of the first block to read.
+        :param clock: the function that returns the current unix time in seconds.
+        """
+        self._source: BlockSource = source
+        self._score_address: str = score_address
+        self._checkpoint: int = start_height - 1
+        self._checkpoint_time: Optional[float] = None
+        self._last_height: Optional[int] = None
+        self._clock: Callable[[], float] = clock
+        # `_lock` is held while a block is applied, and `_sync_lock` while blocks are synced.
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def checkpoint(self) -> int:
+        """The height of the last block that has been applied."""
+        return self._checkpoint
+
+    @property
+    def lag(self) -> Optional[int]:
+        """The number of blocks behind the last block of the source, or None before the first sync."""
+        if self._last_height is None:
+            return None
+        return max(self._last_height - self._checkpoint, 0)
+
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        """The seconds since the block of the checkpoint was created, or None before the first block."""
+        if self._checkpoint_time is None:
+            return None
+        return max(self._clock() - self._checkpoint_time, 0.0)
+
+    @staticmethod
+    def _is_success(tx_result: dict) -> bool:
+        status = tx_result.get("status")
+        return (int(status, 16) if isinstance(status, str) else status) == 1
+
+    def _apply_transaction(self, method: str, params: dict, tx_result: dict, height: int):
+        """Applies a successful transaction to the score.
+
+        :param method: the name of score function.
+        :param params: the parameters of score function.
+        :param tx_result: the transaction result.
+        :param height: the height of block.
+        """
+        raise NotImplementedError
+
+    def _commit_block(self, height: int, time_stamp: int):
+        """Moves the checkpoint after all transactions of a block are applied.
+
+        :param height: the height of block.
+        :param time_stamp: the timestamp of block in microseconds.
+        """
+        self._checkpoint = height
+        self._checkpoint_time = time_stamp / 1_000_000
+
+    def _run(self, interval: float):
+        while not self._stop_event.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning(f"Failed to sync blocks after {self._checkpoint}: {e}")
+            self._stop_event.wait(interval)
+
+    def start(self, interval: float = None):
+        """Syncs in a background thread every `interval` seconds.
+
+        :param interval: the seconds between syncs. (default: `DIDSDK_SYNC_INTERVAL`)
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        interval = settings.DIDSDK_SYNC_INTERVAL if interval is None else interval
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def sync(self, max_blocks: int = None) -> int:
+        """Reads and applies the blocks after the checkpoint.
+
+        :param max_blocks: the maximum number of blocks to read. If None, until the last block.
+        :return: the number of blocks read.
+        """
+        with self._sync_lock:
+            self._last_height = self._source.get_last_height()
+            end_height = self._last_height
+            if max_blocks is not None:
+                end_height = min(end_height, self._checkpoint + max_blocks)
+
+            start_height = self._checkpoint + 1
+            for height in range(start_height, end_height + 1):
+                block = self._source.get_block(height)
+                transactions = []
+                for transaction in block["confirmed_transaction_list"]:
+                    data = transaction.get("data")
+                    if transaction.get("to") != self._score_address or not isinstance(data, dict):
+                        continue
+                    tx_result = self._source.get_transaction_result(transaction["txHash"])
+                    if self._is_success(tx_result):
+                        transactions.append((data["method"], data.get("params") or {}, tx_result))
+
+                with self._lock:
+                    for method, params, tx_result in transactions:
+                        self._apply_transaction(method, params, tx_result, height)
+                    self._commit_block(height, block["time_stamp"])
+            return max(end_height - start_height + 1, 0)
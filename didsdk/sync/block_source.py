@@ -0,0 +1,97 @@
+import abc
+import json
+from typing import Dict, List
+
+from iconsdk.icon_service import IconService
+
+
+class BlockSource(abc.ABC):
+    """A source of blocks and transaction results for the components that follow the blockchain."""
+
+    def get_last_height(self) -> int:
+        """Returns the height of the last block."""
+        raise NotImplementedError
+
+    def get_block(self, height: int) -> dict:
+        """Returns the block of the height.
+
+        :param height: the height of block.
+        :return: the block which has `height`, `time_stamp` and `confirmed_transaction_list`.
+        """
+        raise NotImplementedError
+
+    def get_transaction_result(self, tx_hash: str) -> dict:
+        """Returns the result of a transaction in a block.
+
+        :param tx_hash: the hash of transaction.
+        :return: the transaction result which has `status` and `eventLogs`.
+        """
+        raise NotImplementedError
+
+
+class IconBlockSource(BlockSource):
+    """This source reads blocks from an ICON node with the `IconService` object."""
+
+    def __init__(self, iconservice: IconService):
+        self._iconservice: IconService = iconservice
+
+    def get_last_height(self) -> int:
+        return self._iconservice.get_block("latest")["height"]
+
+    def get_block(self, height: int) -> dict:
+        return self._iconservice.get_block(height)
+
+    def get_transaction_result(self, tx_hash: str) -> dict:
+        return self._iconservice.get_transaction_result(tx_hash)
+
+
+class RecordedBlockSource(BlockSource):
+    """This source replays recorded blocks, so that a follower can be tested without a node."""
+
+    def __init__(self, blocks: List[dict], transaction_results: Dict[str, dict]):
+        """Create the instance.
+
+        :param blocks: the blocks ordered by height. The first one can be higher than 0.
+        :param transaction_results: the transaction results by the hash of transaction.
+        """
+        self._blocks: Dict[int, dict] = {block["height"]: block for block in blocks}
+        self._transaction_results: Dict[str, dict] = transaction_results
+
+    @classmethod
+    def record(cls, source: BlockSource, start_height: int = 0, end_height: int = None) -> "RecordedBlockSource":
+        """Records the blocks and the transaction results of another source.
+
+        :param source: the BlockSource object to record.
+        :param start_height: the height of the first block.
+        :param end_height: the height of the last block. If None, the last block of the source.
+        :return: the RecordedBlockSource object.
+        """
+        end_height = source.get_last_height() if end_height is None else end_height
+        blocks, transaction_results = [], {}
+        for height in range(start_height, end_height + 1):
+            block = source.get_block(height)
+            blocks.append(block)
+            for transaction in block["confirmed_transaction_list"]:
+                tx_hash = transaction["txHash"]
+                transaction_results[tx_hash] = source.get_transaction_result(tx_hash)
+        return cls(blocks, transaction_results)
+
+    @classmethod
+    def load(cls, path: str) -> "RecordedBlockSource":
+        with open(path, encoding="utf-8") as file:
+            recorded = json.load(file)
+        return cls(recorded["blocks"], recorded["transactionResults"])
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            blocks = [self._blocks[height] for height in sorted(self._blocks)]
+            json.dump({"blocks": blocks, "transactionResults": self._transaction_results}, file)
+
+    def get_last_height(self) -> int:
+        return max(self._blocks)
+
+    def get_block(self, height: int) -> dict:
+        return self._blocks[height]
+
+    def get_transaction_result(self, tx_hash: str) -> dict:
+        return self._transaction_results[tx_hash]
@@ -0,0 +1,169 @@
+import json
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from coincurve import PublicKey
+
+from didsdk.core.property_name import PropertyName
+from didsdk.document.document import Document
+from didsdk.exceptions import ResolveException
+from didsdk.jwt.jwt import Jwt
+from didsdk.sync.block_follower import BlockFollower
+from didsdk.sync.block_source import BlockSource
+
+
+class DocumentIndexer(BlockFollower):
+    """A local store of DID Documents built by replaying the transactions of the DID SCORE.
+
+    The documents and the checkpoint are kept in a SQLite database, so an indexer resumes
+    from the checkpoint after a restart. `read_document` and `get_public_key` can stand in for those of
+    `DidService`, but a document changed after the checkpoint is not changed in the store yet,
+    so check `lag` or `lag_seconds` before trusting it.
+    """
+
+    def __init__(
+        self,
+        source: BlockSource,
+        score_address: str,
+        path: str = ":memory:",
+        start_height: int = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create the instance.
+
+        :param source: the BlockSource object to read blocks.
+        :param score_address: the did score address deployed to the blockchain.
+        :param path: the path of SQLite database file.
+        :param start_height: the height of the first block to read, if the database has no checkpoint.
+        :param clock: the function that returns the current unix time in seconds.
+        """
+        super().__init__(source, score_address, start_height, clock)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS document (did TEXT PRIMARY KEY, json TEXT NOT NULL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), height INTEGER NOT NULL, time_stamp INTEGER NOT NULL)"
+            )
+        row = self._connection.execute("SELECT height, time_stamp FROM checkpoint WHERE id = 0").fetchone()
+        if row is not None:
+            self._checkpoint = row[0]
+            self._checkpoint_time = row[1] / 1_000_000
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM document").fetchone()[0]
+
+    @staticmethod
+    def _get_did(event_logs: list, event_name: str) -> Optional[str]:
+        for log in event_logs:
+            items = log["indexed"]
+            if items[0] == event_name:
+                return items[2]
+        return None
+
+    def _load(self, did: str) -> Optional[dict]:
+        row = self._connection.execute("SELECT json FROM document WHERE did = ?", (did,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _store(self, document: dict):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO document (did, json) VALUES (?, ?)", (document["id"], json.dumps(document))
+        )
+
+    def _apply_transaction(self, method: str, params: dict, tx_result: dict, height: int):
+        if method == "create":
+            did = self._get_did(tx_result["eventLogs"], "Create(Address,str,str)")
+            if did is None:
+                return
+            public_key = dict(json.loads(params["publicKey"]), created=height)
+            self._store(
+                {
+                    PropertyName.KEY_VERSION: Document.VERSION,
+                    PropertyName.KEY_DOCUMENT_ID: did,
+                    PropertyName.KEY_DOCUMENT_CREATED: height,
+                    PropertyName.KEY_DOCUMENT_PUBLICKEY: [public_key],
+                    PropertyName.KEY_DOCUMENT_AUTHENTICATION: [
+                        {PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY: public_key["id"]}
+                    ],
+                }
+            )
+        elif method == "update":
+            payload = Jwt.decode(params["jwt"]).payload
+            param = payload.get(PropertyName.KEY_TX_UPDATE_PARAM)
+            document = self._load(param[PropertyName.KEY_DOCUMENT_ID])
+            if document is None:
+                return
+
+            update_method = payload.get(PropertyName.KEY_TX_UPDATE_METHOD)
+            if update_method == PropertyName.KEY_TX_UPDATE_METHOD_ADDKEY:
+                public_key = dict(param[PropertyName.KEY_DOCUMENT_PUBLICKEY], created=height)
+                document[PropertyName.KEY_DOCUMENT_PUBLICKEY].append(public_key)
+                document[PropertyName.KEY_DOCUMENT_AUTHENTICATION].append(
+                    {PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY: public_key["id"]}
+                )
+            elif update_method == PropertyName.KEY_TX_UPDATE_METHOD_REVOKEKEY:
+                key_id = param[PropertyName.KEY_DOCUMENT_PUBLICKEY]
+                for public_key in document[PropertyName.KEY_DOCUMENT_PUBLICKEY]:
+                    if public_key["id"] == key_id:
+                        public_key[PropertyName.KEY_DOCUMENT_PUBLICKEY_REVOKED] = height
+                document[PropertyName.KEY_DOCUMENT_AUTHENTICATION] = [
+                    authentication
+                    for authentication in document[PropertyName.KEY_DOCUMENT_AUTHENTICATION]
+                    if authentication.get(PropertyName.KEY_DOCUMENT_AUTHENTICATION_PUBLICKEY) != key_id
+                ]
+            else:
+                return
+            document[PropertyName.KEY_DOCUMENT_UPDATED] = height
+            self._store(document)
+
+    def _commit_block(self, height: int, time_stamp: int):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO checkpoint (id, height, time_stamp) VALUES (0, ?, ?)", (height, time_stamp)
+        )
+        self._connection.commit()
+        super()._commit_block(height, time_stamp)
+
+    def close(self):
+        self.stop()
+        self._connection.close()
+
+    def get_document(self, did: str) -> Optional[Document]:
+        """Returns a DID Document in the store.
+
+        :param did: the id of a DID Document
+        :return: the Document object, or None if it is not in the store.
+        """
+        with self._lock:
+            document = self._load(did)
+        return Document.deserialize(document) if document else None
+
+    def get_public_key(self, did: str, key_id: str) -> PublicKey:
+        """Get a publicKey that matches the id of DID document and the id of publicKey.
+
+        :param did: the id of DID document
+        :param key_id: the id of publicKey
+        :return: the publicKey object
+        """
+        public_key_property = self.read_document(did).get_public_key_property(key_id)
+        return public_key_property.public_key if public_key_property else public_key_property
+
+    def read_document(self, did: str) -> Document:
+        """Get a DID Document from the store.
+
+        :param did: the id of a DID Document
+        :return: the Document object
+        """
+        document = self.get_document(did)
+        if document is None:
+            raise ResolveException(f"{did} is not found up to the block {self._checkpoint}.")
+        return document
+
+    def sync(self, max_blocks: int = None) -> int:
+        try:
+            return super().sync(max_blocks)
+        except BaseException:
+            with self._lock:
+                self._connection.rollback()
+            raise
@@ -0,0 +1,85 @@
+import time
+from typing import Callable, Optional, Set
+
+from didsdk.cache.bloom_filter import BloomFilter
+from didsdk.jwt.jwt import Jwt
+from didsdk.sync.block_follower import BlockFollower
+from didsdk.sync.block_source import BlockSource
+
+
+class RevocationMirror(BlockFollower):
+    """A local index of the VCs and the issuer DIDs revoked on the VC SCORE.
+
+    It follows the register and revoke transactions of the VC SCORE, and answers `is_revoked` without a node.
+    A VC that is revoked after the checkpoint is not revoked in the mirror yet,
+    so check `lag` or `lag_seconds` and fall back to `VCService.is_valid` if the mirror is too far behind.
+    """
+
+    def __init__(
+        self,
+        source: BlockSource,
+        score_address: str,
+        start_height: int = 0,
+        bloom_capacity: int = None,
+        bloom_error_rate: float = 0.001,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create the instance.
+
+        :param source: the BlockSource object to read blocks.
+        :param score_address: the vc score address deployed to the blockchain.
+        :param start_height: the height of the first block to read.
+        :param bloom_capacity: the expected number of revoked VCs. If given, a Bloom filter in front of
+            the index answers most of the lookups of VCs that are not revoked.
+        :param bloom_error_rate: the rate of false positives of the Bloom filter.
+        :param clock: the function that returns the current unix time in seconds.
+        """
+        super().__init__(source, score_address, start_height, clock)
+        self._revoked_sigs: Set[str] = set()
+        self._revoked_dids: Set[str] = set()
+        self._bloom_filter: Optional[BloomFilter] = (
+            BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        )
+        self._registered_count: int = 0
+
+    @property
+    def registered_count(self) -> int:
+        """The number of VCs registered since the start height."""
+        return self._registered_count
+
+    @property
+    def revoked_count(self) -> int:
+        return len(self._revoked_sigs)
+
+    def _apply_transaction(self, method: str, params: dict, tx_result: dict, height: int):
+        if method == "register":
+            self._registered_count += 1
+        elif method == "registerList":
+            self._registered_count += len(params["credentialJwtList"].split(","))
+        elif method in ("revoke", "revokeDid", "revokeVcAndDid"):
+            payload = Jwt.decode(params["credentialJwt"]).payload
+            if method != "revokeDid":
+                self._add_revoked_sig(payload.get("sig"))
+            if method != "revoke":
+                self._revoked_dids.add(payload.get("issuerDid"))
+
+    def _add_revoked_sig(self, sig: str):
+        self._revoked_sigs.add(sig)
+        if self._bloom_filter is not None:
+            self._bloom_filter.add(sig)
+
+    def is_did_revoked(self, did: str) -> bool:
+        return did in self._revoked_dids
+
+    def is_revoked(self, sig: str, issuer_did: str = None) -> bool:
+        """Checks whether a VC is revoked up to the checkpoint.
+
+        :param sig: the signature of credential.
+        :param issuer_did: the DID of the issuer. If given, the revocation of the issuer is also checked.
+        :return: True if the VC or its issuer is revoked.
+        """
+        if issuer_did is not None and issuer_did in self._revoked_dids:
+            return True
+        if self._bloom_filter is not None and not self._bloom_filter.might_contain(sig):
+            return False
+        return sig in self._revoked_sigs
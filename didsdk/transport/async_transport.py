@@ -0,0 +1,261 @@
+import abc
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+import aiohttp
+from iconsdk.builder.call_builder import Call
+from iconsdk.exception import HTTPError, JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.providers.url_map import URLMap
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.utils.converter import convert
+from iconsdk.utils.templates import TRANSACTION_RESULT
+from loguru import logger
+
+from didsdk import settings
+
+
+class AsyncTransport(abc.ABC):
+    """An awaitable interface to the JSON-RPC API of an ICON node.
+
+    `DidScore` and `VCScore` use it to read and write without blocking the event loop.
+    """
+
+    async def call(self, call: Call) -> Any:
+        """Calls a read-only function of a score.
+
+        :param call: the Call object made by `CallBuilder`.
+        :return: the value returned by the score function.
+        """
+        raise NotImplementedError
+
+    async def call_many(self, calls: List[Call], window: int = None) -> List[Any]:
+        """Calls read-only functions of scores together.
+
+        Unlike `call`, a failed call does not raise an error. Its exception is put in place of the value.
+        By default, the calls are sent one by one, and a transport can send them in fewer requests.
+
+        :param calls: the Call objects made by `CallBuilder`.
+        :param window: the maximum number of requests in flight. (default: `DIDSDK_TRANSPORT_MAX_WORKERS`)
+        :return: the values or the exceptions in the same order as `calls`.
+        """
+        semaphore = asyncio.Semaphore(window or settings.DIDSDK_TRANSPORT_MAX_WORKERS)
+
+        async def call(call_: Call) -> Any:
+            async with semaphore:
+                return await self.call(call_)
+
+        return await asyncio.gather(*[call(call_) for call_ in calls], return_exceptions=True)
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        """Sends a transaction.
+
+        :param signed_transaction: the SignedTransaction object.
+        :return: the hash of transaction.
+        """
+        raise NotImplementedError
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        """Get the transaction result that matches the hash of transaction.
+
+        :param tx_hash: the hash of transaction.
+        :return: the transaction result.
+        """
+        raise NotImplementedError
+
+    async def wait_transaction_result(self, tx_hash: str) -> dict:
+        """Waits for the transaction result like `get_transaction_result`, but the node holds the request
+        until the transaction is finalized, or its wait timeout passes.
+
+        :param tx_hash: the hash of transaction.
+        :return: the transaction result.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class ExecutorTransport(AsyncTransport):
+    """This transport runs the blocking `IconService` methods in a thread pool."""
+
+    def __init__(self, iconservice: IconService, max_workers: int = None):
+        """Create the instance.
+
+        :param iconservice: the IconService object.
+        :param max_workers: the number of threads. (default: `DIDSDK_TRANSPORT_MAX_WORKERS`)
+        """
+        self._iconservice: IconService = iconservice
+        self._max_workers: int = max_workers or settings.DIDSDK_TRANSPORT_MAX_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def iconservice(self) -> IconService:
+        return self._iconservice
+
+    async def _run(self, func, *args) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="didsdk-transport")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def call(self, call: Call) -> Any:
+        return await self._run(self._iconservice.call, call)
+
+    async def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        return await self._run(self._iconservice.get_transaction_result, tx_hash)
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        return await self._run(self._iconservice.send_transaction, signed_transaction)
+
+    async def wait_transaction_result(self, tx_hash: str) -> dict:
+        return await self._run(self._iconservice.wait_transaction_result, tx_hash)
+
+
+class AioHttpTransport(AsyncTransport):
+    """This transport sends JSON-RPC requests with `aiohttp`.
+
+    A session with persistent connections is created on the first request and reused until `close()`.
+    `call_many` sends the calls in JSON-RPC batch requests. If the node rejects a batch,
+    the transport falls back to single requests from then on. If a batch is not answered, for a timeout or
+    a connection error, the error is put in place of each value of the batch.
+    """
+
+    def __init__(self, url: str, timeout: float = 10, max_connections: int = 100):
+        """Create the instance.
+
+        :param url: the url of the node, as like <scheme>://<host>:<port>/api/v3
+        :param timeout: the timeout of a request in seconds.
+        :param max_connections: the maximum number of connections kept by the session.
+        """
+        self._url: URLMap = URLMap(url)
+        self._timeout: float = timeout
+        self._max_connections: int = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._request_ids = itertools.count(1)
+        self._batch_supported: bool = True
+
+    @property
+    def batch_supported(self) -> bool:
+        return self._batch_supported
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    def _make_request(self, method: str, params: dict = None) -> dict:
+        request = {"jsonrpc": "2.0", "method": method, "id": next(self._request_ids)}
+        if params:
+            request["params"] = params
+        return request
+
+    async def _post(self, method: str, body) -> Any:
+        session = await self._get_session()
+        async with session.post(self._url.for_rpc(method.split("_")[0]), data=json.dumps(body)) as response:
+            raw_response = await response.read()
+            try:
+                return json.loads(raw_response)
+            except json.JSONDecodeError:
+                raise HTTPError(raw_response.decode(), response.status)
+
+    @staticmethod
+    def _get_result(response: dict) -> Any:
+        if "error" in response:
+            error = response["error"]
+            raise JSONRPCException(error.get("message"), error.get("code"), error.get("data"))
+        return response["result"]
+
+    async def request(self, method: str, params: dict = None) -> Any:
+        """Sends a JSON-RPC request.
+
+        :param method: the name of JSON-RPC method.
+        :param params: the parameters of JSON-RPC method.
+        :return: the result of the response.
+        """
+        return self._get_result(await self._post(method, self._make_request(method, params)))
+
+    @staticmethod
+    def _make_call_params(call: Call) -> dict:
+        params = {"to": call.to, "dataType": "call", "data": {"method": call.method}}
+        if call.from_ is not None:
+            params["from"] = call.from_
+        if isinstance(call.params, dict):
+            params["data"]["params"] = call.params
+        if call.height is not None:
+            params["height"] = call.height
+        return params
+
+    async def _call_batch(self, calls: List[Call]) -> List[Any]:
+        requests = [self._make_request("icx_call", self._make_call_params(call)) for call in calls]
+        try:
+            responses = await self._post("icx_call", requests)
+        except HTTPError as e:
+            logger.debug(f"Failed to send a batch of {len(calls)} calls: {e}")
+            return await super().call_many(calls)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Failed to send a batch of {len(calls)} calls: {e!r}")
+            return [e] * len(calls)
+
+        if not isinstance(responses, list):
+            logger.debug(f"The node does not support batch requests: {responses}")
+            self._batch_supported = False
+            return await super().call_many(calls)
+
+        responses = {response.get("id"): response for response in responses}
+        results = []
+        for request in requests:
+            response = responses.get(request["id"])
+            try:
+                if response is None:
+                    raise JSONRPCException(f"No response to the request {request['id']} in a batch.")
+                results.append(self._get_result(response))
+            except JSONRPCException as e:
+                results.append(e)
+        return results
+
+    async def call(self, call: Call) -> Any:
+        return await self.request("icx_call", self._make_call_params(call))
+
+    async def call_many(self, calls: List[Call], window: int = None) -> List[Any]:
+        if not self._batch_supported or len(calls) < 2:
+            return await super().call_many(calls, window)
+
+        size = settings.DIDSDK_RPC_BATCH_SIZE
+        semaphore = asyncio.Semaphore(window or settings.DIDSDK_TRANSPORT_MAX_WORKERS)
+
+        async def call_batch(batch: List[Call]) -> List[Any]:
+            async with semaphore:
+                return await self._call_batch(batch)
+
+        batches = await asyncio.gather(
+            *[call_batch(calls[index : index + size]) for index in range(0, len(calls), size)]
+        )
+        return list(itertools.chain.from_iterable(batches))
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        result = await self.request("icx_getTransactionResult", {"txHash": tx_hash})
+        return convert(result, TRANSACTION_RESULT)
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        return await self.request("icx_sendTransaction", signed_transaction.signed_transaction_dict)
+
+    async def wait_transaction_result(self, tx_hash: str) -> dict:
+        result = await self.request("icx_waitTransactionResult", {"txHash": tx_hash})
+        return convert(result, TRANSACTION_RESULT)
@@ -0,0 +1,457 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Union
+
+import aiohttp
+import requests
+from iconsdk.builder.call_builder import Call
+from iconsdk.exception import HTTPError, IconServiceBaseException, JSONRPCException
+from iconsdk.signed_transaction import SignedTransaction
+
+from didsdk import settings
+from didsdk.exceptions import CircuitOpenException
+from didsdk.transport.async_transport import AsyncTransport
+
+# The JSON-RPC errors of a node which is overloaded or failing, not of the request.
+NODE_ERROR_CODES = {
+    JSONRPCException.RPC_INTERNAL_ERROR,
+    JSONRPCException.SYSTEM_ERROR,
+    JSONRPCException.SYSTEM_POOL_OVERFLOW,
+    JSONRPCException.SYSTEM_LACK_OF_RESOURCE,
+    JSONRPCException.SYSTEM_REQUEST_TIMEOUT,
+    JSONRPCException.SYSTEM_HARD_TIMEOUT,
+}
+
+
+def is_node_failure(error: BaseException) -> bool:
+    """Returns whether an error of a request means the node is unreachable, overloaded or failing.
+
+    The errors of a score, like an unknown DID, and of a pending transaction are answers of a healthy node.
+
+    :param error: the error raised by a request.
+    :return: True if the error counts as a failure of the node.
+    """
+    if isinstance(error, JSONRPCException):
+        return error.rpc_code in NODE_ERROR_CODES
+    return isinstance(error, (HTTPError, requests.RequestException, aiohttp.ClientError, OSError))
+
+
+class AdaptiveLimiter:
+    """Limits the requests in flight, and adjusts the limit from their latencies and errors in AIMD style.
+
+    While the limit is reached, a successful request raises it by 1/limit, which is one per a round
+    of requests (additive increase). A failed request, or one slower than `latency_target`, cuts it
+    by `backoff` (multiplicative decrease). The requests in flight together are cut once.
+
+    The limiter can be shared by threads and event loops.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = None,
+        min_limit: int = None,
+        max_limit: int = None,
+        latency_target: float = None,
+        backoff: float = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create the instance.
+
+        :param initial_limit: the limit to start with. (default: `DIDSDK_LIMITER_INITIAL_LIMIT`)
+        :param min_limit: the lowest limit. (default: `DIDSDK_LIMITER_MIN_LIMIT`)
+        :param max_limit: the highest limit. (default: `DIDSDK_LIMITER_MAX_LIMIT`)
+        :param latency_target: the seconds over which a request counts as congested.
+            (default: `DIDSDK_LIMITER_LATENCY_TARGET`)
+        :param backoff: the ratio of the limit kept after a cut. (default: `DIDSDK_LIMITER_BACKOFF`)
+        :param clock: the function that returns the current time in seconds.
+        """
+        self._min_limit: int = min_limit or settings.DIDSDK_LIMITER_MIN_LIMIT
+        self._max_limit: int = max_limit or settings.DIDSDK_LIMITER_MAX_LIMIT
+        if not 0 < self._min_limit <= self._max_limit:
+            raise ValueError("min_limit must be a positive number not greater than max_limit.")
+        initial_limit = initial_limit or settings.DIDSDK_LIMITER_INITIAL_LIMIT
+        self._limit: float = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._latency_target: float = latency_target or settings.DIDSDK_LIMITER_LATENCY_TARGET
+        self._backoff: float = backoff or settings.DIDSDK_LIMITER_BACKOFF
+        self._clock: Callable[[], float] = clock
+        self._in_flight: int = 0
+        # Whether the limit has been reached since the requests were last idle.
+        # The limit is raised only while it's used, as TCP raises the window of a busy sender.
+        self._saturated: bool = False
+        self._next_decrease_at: float = 0.0
+        self._latency: Optional[float] = None
+        self._successes: int = 0
+        self._failures: int = 0
+        self._decreases: int = 0
+        self._waiters: Deque[Union[threading.Event, tuple]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            self._saturated = self._saturated or self._in_flight >= int(self._limit)
+            return True
+        self._saturated = True
+        return False
+
+    def _wake_next(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+                return
+            loop, future = waiter
+            try:
+                loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+                return
+            except RuntimeError:
+                # The event loop of the waiter is closed.
+                continue
+
+    def acquire(self):
+        """Blocks until a request can be sent."""
+        while True:
+            with self._lock:
+                if self._try_acquire():
+                    return
+                event = threading.Event()
+                self._waiters.append(event)
+            event.wait()
+
+    async def acquire_async(self):
+        """Waits until a request can be sent without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_acquire():
+                    return
+                waiter = (loop, loop.create_future())
+                self._waiters.append(waiter)
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    else:
+                        self._wake_next()
+                raise
+
+    def release(self, latency: float, failed: bool = False):
+        """Releases a request, and adjusts the limit.
+
+        :param latency: the seconds the request took.
+        :param failed: whether the request failed because of the node.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._latency = latency if self._latency is None else self._latency * 0.8 + latency * 0.2
+            if failed:
+                self._failures += 1
+            else:
+                self._successes += 1
+
+            now = self._clock()
+            if failed or latency > self._latency_target:
+                if now >= self._next_decrease_at:
+                    self._limit = max(self._min_limit, self._limit * self._backoff)
+                    self._next_decrease_at = now + self._latency_target
+                    self._decreases += 1
+            elif self._saturated and self._limit < self._max_limit:
+                previous = int(self._limit)
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+                if int(self._limit) > previous:
+                    self._wake_next()
+            if self._in_flight == 0:
+                self._saturated = False
+            self._wake_next()
+
+    def metrics(self) -> dict:
+        """Returns the current state of the limiter.
+
+        :return: the limit, the requests in flight and waiting, the smoothed latency in seconds,
+            and the numbers of successes, failures and cuts of the limit.
+        """
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "latency": self._latency,
+                "successes": self._successes,
+                "failures": self._failures,
+                "decreases": self._decreases,
+            }
+
+
+class CircuitState(Enum):
+    # Requests are sent.
+    CLOSED = "closed"
+    # Requests fail fast until the reset timeout passes.
+    OPEN = "open"
+    # A request is sent to probe the node, and the others fail fast.
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails requests fast while the node keeps failing.
+
+    After `failure_threshold` consecutive failures, the circuit opens and a request raises
+    `CircuitOpenException` without being sent. After `reset_timeout` seconds, a request is sent
+    to probe the node. The circuit closes if it succeeds, and opens again if it fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = None,
+        reset_timeout: float = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create the instance.
+
+        :param failure_threshold: the consecutive failures that open the circuit.
+            (default: `DIDSDK_BREAKER_FAILURE_THRESHOLD`)
+        :param reset_timeout: the seconds until a request is sent again. (default: `DIDSDK_BREAKER_RESET_TIMEOUT`)
+        :param clock: the function that returns the current time in seconds.
+        """
+        self._failure_threshold: int = failure_threshold or settings.DIDSDK_BREAKER_FAILURE_THRESHOLD
+        self._reset_timeout: float = settings.DIDSDK_BREAKER_RESET_TIMEOUT if reset_timeout is None else reset_timeout
+        self._clock: Callable[[], float] = clock
+        self._state: CircuitState = CircuitState.CLOSED
+        self._consecutive_failures: int = 0
+        self._opened_at: float = 0.0
+        self._probing: bool = False
+        self._opens: int = 0
+        self._rejected: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._clock() >= self._opened_at + self._reset_timeout:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+        self._opens += 1
+
+    def allow(self):
+        """Checks whether a request can be sent.
+
+        :raise CircuitOpenException: if the circuit is open, or another request is probing the node.
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+            remaining = self._opened_at + self._reset_timeout - self._clock()
+            if remaining <= 0 and not self._probing:
+                self._state = CircuitState.HALF_OPEN
+                self._probing = True
+                return
+            self._rejected += 1
+            raise CircuitOpenException(
+                f"The circuit to the node is open after {self._consecutive_failures} failures."
+                + (f" Retry in {remaining:.1f} seconds." if remaining > 0 else " A request is probing the node.")
+            )
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._state = CircuitState.CLOSED
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+                self._open()
+
+    def record_cancel(self):
+        """Lets another request probe the node, if the probing request was cancelled."""
+        with self._lock:
+            self._probing = False
+
+    def metrics(self) -> dict:
+        """Returns the current state of the breaker.
+
+        :return: the state, the consecutive failures, and the numbers of opens and rejected requests.
+        """
+        state = self.state
+        with self._lock:
+            return {
+                "state": state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "opens": self._opens,
+                "rejected": self._rejected,
+            }
+
+
+class CallGuard:
+    """Guards the requests to a node with an `AdaptiveLimiter` and a `CircuitBreaker`.
+
+    Share an instance between `DidService` and `VCService`, or their scores, to control all their traffic
+    to the node together. While the circuit is open, a request raises `CircuitOpenException` at once,
+    and `DocumentCache` can serve the documents it has.
+    """
+
+    def __init__(self, limiter: AdaptiveLimiter = None, breaker: CircuitBreaker = None):
+        """Create the instance.
+
+        :param limiter: the AdaptiveLimiter object. If None, a new one is created.
+        :param breaker: the CircuitBreaker object. If None, a new one is created.
+        """
+        self._limiter: AdaptiveLimiter = limiter or AdaptiveLimiter()
+        self._breaker: CircuitBreaker = breaker or CircuitBreaker()
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        return self._limiter
+
+    def _record(self, started: float, failed: bool, limited: bool):
+        if limited:
+            self._limiter.release(time.monotonic() - started, failed=failed)
+        if failed:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+
+    def run(self, func: Callable[..., Any], *args) -> Any:
+        """Sends a request in the current thread.
+
+        :param func: the function that sends the request.
+        :param args: the arguments of the function.
+        :return: the value returned by the function.
+        """
+        self._breaker.allow()
+        self._limiter.acquire()
+        started = time.monotonic()
+        try:
+            result = func(*args)
+        except (Exception, IconServiceBaseException) as e:
+            self._record(started, is_node_failure(e), limited=True)
+            raise
+        self._record(started, False, limited=True)
+        return result
+
+    async def run_async(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        limited: bool = True,
+        is_failure: Callable[[BaseException], bool] = is_node_failure,
+        result_failed: Callable[[Any], bool] = None,
+    ) -> Any:
+        """Sends a request without blocking the event loop.
+
+        :param func: the coroutine function that sends the request.
+        :param args: the arguments of the function.
+        :param limited: whether the request takes a slot of the limiter.
+            A long poll, which the node holds on purpose, only passes the breaker.
+        :param is_failure: the function that tells whether an error counts as a failure of the node.
+        :param result_failed: the function that tells whether a returned value counts as a failure of the node.
+        :return: the value returned by the function.
+        """
+        self._breaker.allow()
+        try:
+            if limited:
+                await self._limiter.acquire_async()
+        except asyncio.CancelledError:
+            self._breaker.record_cancel()
+            raise
+
+        started = time.monotonic()
+        try:
+            result = await func(*args)
+        except asyncio.CancelledError:
+            if limited:
+                self._limiter.release(time.monotonic() - started)
+            self._breaker.record_cancel()
+            raise
+        except (Exception, IconServiceBaseException) as e:
+            self._record(started, is_failure(e), limited)
+            raise
+        self._record(started, result_failed is not None and result_failed(result), limited)
+        return result
+
+    def metrics(self) -> dict:
+        """Returns the current state of the limiter and the breaker.
+
+        :return: the metrics of `AdaptiveLimiter` under "limiter", and of `CircuitBreaker` under "breaker".
+        """
+        return {"limiter": self._limiter.metrics(), "breaker": self._breaker.metrics()}
+
+
+class GuardedTransport(AsyncTransport):
+    """This transport sends the requests of another transport through a `CallGuard`."""
+
+    def __init__(self, transport: AsyncTransport, guard: CallGuard):
+        """Create the instance.
+
+        :param transport: the AsyncTransport object that sends the requests.
+        :param guard: the CallGuard object.
+        """
+        self._transport: AsyncTransport = transport
+        self._guard: CallGuard = guard
+
+    @property
+    def guard(self) -> CallGuard:
+        return self._guard
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    async def call(self, call: Call) -> Any:
+        return await self._guard.run_async(self._transport.call, call)
+
+    @staticmethod
+    def _any_node_failure(results: List[Any]) -> bool:
+        return any(isinstance(result, BaseException) and is_node_failure(result) for result in results)
+
+    async def call_many(self, calls: List[Call], window: int = None) -> List[Any]:
+        # The calls count as a request, which fails if any of them failed because of the node.
+        return await self._guard.run_async(
+            self._transport.call_many, calls, window, result_failed=self._any_node_failure
+        )
+
+    async def close(self):
+        await self._transport.close()
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        return await self._guard.run_async(self._transport.get_transaction_result, tx_hash)
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        return await self._guard.run_async(self._transport.send_transaction, signed_transaction)
+
+    async def wait_transaction_result(self, tx_hash: str) -> dict:
+        return await self._guard.run_async(
+            self._transport.wait_transaction_result, tx_hash, limited=False, is_failure=self._is_long_poll_failure
+        )
+
+    @staticmethod
+    def _is_long_poll_failure(error: BaseException) -> bool:
+        # The node answers a timeout when the transaction is not finalized while it holds the request.
+        if isinstance(error, JSONRPCException) and error.rpc_code in (
+            JSONRPCException.SYSTEM_REQUEST_TIMEOUT,
+            JSONRPCException.SYSTEM_HARD_TIMEOUT,
+        ):
+            return False
+        return is_node_failure(error)
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar, Union
+
+from didsdk.exceptions import DeadlineExceededException
+
+T = TypeVar("T")
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar("didsdk_deadline", default=None)
+
+
+class Deadline:
+    """An absolute time by which an operation must finish.
+
+    The sub-calls of an operation share the time left: a transaction is sent, confirmed
+    and read back while the same deadline runs, and a sub-call still running at the deadline is cancelled.
+    """
+
+    def __init__(self, expires_at: float, clock: Callable[[], float] = time.monotonic):
+        """Create the instance.
+
+        :param expires_at: the time of the deadline, in the seconds of `clock`.
+        :param clock: the function that returns the current time in seconds.
+        """
+        self._expires_at: float = expires_at
+        self._clock: Callable[[], float] = clock
+
+    def __repr__(self):
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        """Returns the deadline in some seconds from now.
+
+        :param seconds: the time budget of the operation in seconds.
+        :param clock: the function that returns the current time in seconds.
+        :return: the Deadline object.
+        """
+        return cls(clock() + seconds, clock)
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def remaining(self) -> float:
+        """Returns the seconds left until the deadline, which is 0 after it."""
+        return max(0.0, self._expires_at - self._clock())
+
+    def timeout(self, timeout: float = None) -> float:
+        """Returns the seconds a sub-call can take.
+
+        :param timeout: the timeout of the sub-call itself in seconds, or None.
+        :return: the smaller one of the timeout and the seconds left.
+        """
+        return self.remaining() if timeout is None else min(timeout, self.remaining())
+
+    def check(self, operation: str):
+        """Raise DeadlineExceededException if the deadline has passed.
+
+        :param operation: the name of the operation for the error message.
+        """
+        if self.expired:
+            raise DeadlineExceededException(f"{operation} exceeded the deadline.")
+
+    async def run(self, awaitable: Awaitable[T], operation: str) -> T:
+        """Awaits a sub-call, and cancels it at the deadline.
+
+        :param awaitable: the coroutine or the future of the sub-call.
+        :param operation: the name of the operation for the error message.
+        :return: the result of the sub-call.
+        """
+        if self.expired:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            self.check(operation)
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError as e:
+            if isinstance(e, DeadlineExceededException) or not self.expired:
+                raise
+            raise DeadlineExceededException(f"{operation} exceeded the deadline.") from e
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Returns the deadline of the current context.
+
+    :return: the Deadline object, or None if there is no deadline.
+    """
+    return _current_deadline.get()
+
+
+def effective_deadline(deadline: Deadline = None) -> Optional[Deadline]:
+    """Returns the earlier one of a deadline and the deadline of the current context.
+
+    :param deadline: the deadline given to an operation, or None.
+    :return: the Deadline object, or None if there is no deadline.
+    """
+    current = _current_deadline.get()
+    if deadline is None or current is None:
+        return deadline or current
+    return deadline if deadline.expires_at <= current.expires_at else current
+
+
+async def run_within(deadline: Optional[Deadline], awaitable: Awaitable[T], operation: str) -> T:
+    """Awaits a sub-call within a deadline, or without a limit if the deadline is None.
+
+    :param deadline: the Deadline object, or None.
+    :param awaitable: the coroutine or the future of the sub-call.
+    :param operation: the name of the operation for the error message.
+    :return: the result of the sub-call.
+    """
+    if deadline is None:
+        return await awaitable
+    return await deadline.run(awaitable, operation)
+
+
+async def wait_within(
+    deadline: Optional[Deadline], wait: Callable[[float], Awaitable[T]], timeout: float, operation: str
+) -> T:
+    """Awaits a sub-call which takes its own timeout, like `TransactionTracker.wait`, within a deadline.
+
+    The timeout is cut to the time left, and the timeout caused by the cut raises `DeadlineExceededException`.
+
+    :param deadline: the Deadline object, or None.
+    :param wait: the coroutine function which takes the timeout in seconds.
+    :param timeout: the timeout of the sub-call itself in seconds.
+    :param operation: the name of the operation for the error message.
+    :return: the result of the sub-call.
+    """
+    if deadline is None:
+        return await wait(timeout)
+
+    deadline.check(operation)
+    cut = deadline.remaining() < timeout
+    try:
+        return await deadline.run(wait(deadline.timeout(timeout)), operation)
+    except asyncio.TimeoutError as e:
+        if not cut or isinstance(e, DeadlineExceededException):
+            raise
+        raise DeadlineExceededException(f"{operation} exceeded the deadline.") from e
+
+
+@contextmanager
+def deadline_scope(deadline: Union[Deadline, float]) -> Iterator[Deadline]:
+    """Set a deadline for the service operations in the block.
+
+    Every operation of `DidService` and `VCService` without an explicit deadline, like the reads
+    of a presentation verification, must finish by the deadline. It follows the context of the current
+    asyncio task like `snapshot`. A nested scope cannot extend the deadline of the outer one.
+
+    :param deadline: the Deadline object, or the seconds from now.
+    :return: the deadline of the block.
+    """
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline.after(deadline)
+    deadline = effective_deadline(deadline)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,227 @@
+import itertools
+import json
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional, Sequence, Union
+
+import requests
+from iconsdk.exception import HTTPError, JSONRPCException
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.providers.provider import Monitor, MonitorSpec, Provider
+from iconsdk.providers.url_map import URLMap
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from didsdk import settings
+
+# The read-only methods which can be sent to any node, and sent twice.
+READ_METHODS = {
+    "icx_call",
+    "icx_getBalance",
+    "icx_getBlockByHash",
+    "icx_getBlockByHeight",
+    "icx_getLastBlock",
+    "icx_getScoreApi",
+    "icx_getTotalSupply",
+    "icx_getTransactionByHash",
+    "icx_getTransactionResult",
+}
+
+
+class _Node:
+    def __init__(self, url: str, pool_size: int, latency_window: int):
+        self.full_url: str = url
+        self.url: URLMap = URLMap(url)
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+        self.in_flight: int = 0
+        self.requests: int = 0
+        self.errors: int = 0
+        self.hedges: int = 0
+        self.down_until: float = 0.0
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, max(0, math.ceil(percentile / 100 * len(latencies)) - 1))]
+
+
+class PooledHTTPProvider(Provider):
+    """This provider keeps persistent connections to one or more nodes for `IconService`.
+
+    A read request goes to the node with the fewest requests in flight and the lowest median latency.
+    If it's not answered within the `hedge_percentile` latency of the node, the same request is sent
+    to the next node, and the first answer wins. A node that fails to answer is skipped for `cooldown` seconds.
+    A transaction is sent to one node and never duplicated.
+    """
+
+    MIN_SAMPLES_FOR_HEDGE = 20
+
+    def __init__(
+        self,
+        urls: Union[str, Sequence[str]],
+        timeout: float = 10,
+        pool_size: int = None,
+        hedge_percentile: float = None,
+        cooldown: float = None,
+        latency_window: int = 256,
+    ):
+        """Create the instance.
+
+        :param urls: the url of a node, or the urls of the nodes, as like <scheme>://<host>:<port>/api/v3
+        :param timeout: the timeout of a request in seconds.
+        :param pool_size: the maximum number of connections to a node. (default: `DIDSDK_PROVIDER_POOL_SIZE`)
+        :param hedge_percentile: the latency percentile of a node to wait before a hedged request,
+            or 0 to never hedge. (default: `DIDSDK_PROVIDER_HEDGE_PERCENTILE`)
+        :param cooldown: the seconds a failed node is skipped. (default: `DIDSDK_PROVIDER_NODE_COOLDOWN`)
+        :param latency_window: the number of recent latencies to keep for a node.
+        """
+        urls = [urls] if isinstance(urls, str) else list(urls)
+        if not urls:
+            raise ValueError("At least one url is required.")
+
+        pool_size = pool_size or settings.DIDSDK_PROVIDER_POOL_SIZE
+        self._nodes: List[_Node] = [_Node(url, pool_size, latency_window) for url in urls]
+        self._timeout: float = timeout
+        self._hedge_percentile: float = (
+            settings.DIDSDK_PROVIDER_HEDGE_PERCENTILE if hedge_percentile is None else hedge_percentile
+        )
+        self._cooldown: float = settings.DIDSDK_PROVIDER_NODE_COOLDOWN if cooldown is None else cooldown
+        self._request_ids = itertools.count(1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return f"RPC connection to {', '.join(node.url.serverUri for node in self._nodes)}"
+
+    def _select(self, exclude: Sequence[_Node] = ()) -> Optional[_Node]:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [node for node in self._nodes if node not in exclude]
+            available = [node for node in candidates if node.down_until <= now] or candidates
+            if not available:
+                return None
+            node = min(available, key=lambda node_: (node_.in_flight, node_.latency_percentile(50) or 0.0))
+            node.in_flight += 1
+            node.requests += 1
+            return node
+
+    def _post(self, node: _Node, method: str, body: dict) -> requests.Response:
+        started = time.monotonic()
+        try:
+            response = node.session.post(
+                node.url.for_rpc(method.split("_")[0]),
+                data=json.dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout,
+            )
+        except requests.RequestException:
+            with self._lock:
+                node.errors += 1
+                node.down_until = time.monotonic() + self._cooldown
+            raise
+        else:
+            with self._lock:
+                node.latencies.append(time.monotonic() - started)
+            return response
+        finally:
+            with self._lock:
+                node.in_flight -= 1
+
+    def _hedge_delay(self, node: _Node) -> Optional[float]:
+        if not self._hedge_percentile or len(self._nodes) < 2:
+            return None
+        with self._lock:
+            if len(node.latencies) < self.MIN_SAMPLES_FOR_HEDGE:
+                return None
+            return node.latency_percentile(self._hedge_percentile)
+
+    def _submit(self, node: _Node, method: str, body: dict) -> Future:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=settings.DIDSDK_TRANSPORT_MAX_WORKERS, thread_name_prefix="didsdk-provider"
+                    )
+        return self._executor.submit(self._post, node, method, body)
+
+    def _read(self, node: _Node, method: str, body: dict) -> requests.Response:
+        hedge_delay = self._hedge_delay(node)
+        if hedge_delay is None:
+            try:
+                return self._post(node, method, body)
+            except requests.RequestException as e:
+                fallback = self._select(exclude=[node])
+                if fallback is None:
+                    raise
+                logger.debug(f"Failed to request {method} to {node.url.serverUri}, retry with another node: {e}")
+                return self._post(fallback, method, body)
+
+        futures = [self._submit(node, method, body)]
+        done, _ = wait(futures, timeout=hedge_delay)
+        if not done or futures[0].exception() is not None:
+            hedge_node = self._select(exclude=[node])
+            with self._lock:
+                hedge_node.hedges += 1
+            futures.append(self._submit(hedge_node, method, body))
+
+        pending = set(futures)
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None or not pending:
+                    return future.result()
+
+    def close(self):
+        """Closes the connections to the nodes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        for node in self._nodes:
+            node.session.close()
+
+    def make_monitor(self, spec: MonitorSpec, keep_alive: Optional[float] = None) -> Monitor:
+        return HTTPProvider(self._nodes[0].full_url).make_monitor(spec, keep_alive)
+
+    def make_request(self, method: str, params: Optional[Dict[str, Any]] = None, full_response: bool = False):
+        body = {"jsonrpc": "2.0", "method": method, "id": next(self._request_ids)}
+        if params:
+            body["params"] = params
+
+        node = self._select()
+        response = self._read(node, method, body) if method in READ_METHODS else self._post(node, method, body)
+        try:
+            content = json.loads(response.content)
+        except json.JSONDecodeError:
+            raise HTTPError(response.content.decode(), response.status_code)
+
+        if full_response:
+            return content
+        if response.ok:
+            return content["result"]
+        raise JSONRPCException(content["error"]["message"], content["error"]["code"], content["error"].get("data"))
+
+    def node_stats(self) -> List[dict]:
+        """Returns the statistics of each node.
+
+        :return: the url, the numbers of requests, errors and hedged requests, and the latency percentiles.
+        """
+        with self._lock:
+            return [
+                {
+                    "url": node.url.serverUri,
+                    "requests": node.requests,
+                    "errors": node.errors,
+                    "hedges": node.hedges,
+                    "p50": node.latency_percentile(50),
+                    "p95": node.latency_percentile(95),
+                }
+                for node in self._nodes
+            ]
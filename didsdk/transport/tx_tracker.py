@@ -0,0 +1,293 @@
+import asyncio
+import math
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, Iterable, Optional, Set
+
+from iconsdk.exception import JSONRPCException
+from loguru import logger
+
+from didsdk import settings
+from didsdk.exceptions import TransactionException
+from didsdk.transport.async_transport import AsyncTransport
+
+
+class ConfirmationMode(Enum):
+    # Poll `icx_getTransactionResult` with backoff.
+    POLL = "poll"
+    # Wait on `icx_waitTransactionResult`, which returns as soon as the transaction is finalized.
+    LONG_POLL = "long_poll"
+
+
+@dataclass
+class _PendingTransaction:
+    tx_hash: str
+    future: asyncio.Future
+    registered_at: float
+    next_poll_at: float
+    interval: float
+    retries_left: int
+    polling: bool = False
+    # The time by which the waiters give up, or None to wait until the retries run out
+    expires_at: Optional[float] = None
+    # The number of callers waiting for the result
+    waiters: int = 0
+
+
+class TransactionTracker:
+    """This class confirms the pending transactions of one or more services together.
+
+    A single poller task polls every transaction that is due, so thousands of pending transactions
+    do not run thousands of polling loops. The interval between polls of a transaction grows exponentially
+    from `DIDSDK_TX_SLEEP_TIME` up to `DIDSDK_TX_MAX_SLEEP_TIME`, and the first poll is delayed
+    by the median of the observed confirmation latencies.
+
+    In `ConfirmationMode.LONG_POLL`, each transaction waits on `icx_waitTransactionResult` instead, and is
+    requested again when the node times out. If the node does not support the method,
+    the tracker falls back to `ConfirmationMode.POLL`.
+    """
+
+    MIN_SAMPLES_FOR_ADAPTIVE_DELAY = 5
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        interval: float = None,
+        max_interval: float = None,
+        backoff_factor: float = None,
+        max_retries: int = None,
+        max_concurrent_polls: int = 64,
+        latency_window: int = 1024,
+        mode: ConfirmationMode = None,
+    ):
+        """Create the instance.
+
+        :param transport: the AsyncTransport object to get transaction results.
+        :param interval: the seconds between the first polls. (default: `DIDSDK_TX_SLEEP_TIME`)
+        :param max_interval: the maximum seconds between polls. (default: `DIDSDK_TX_MAX_SLEEP_TIME`)
+        :param backoff_factor: the multiplier of the interval after each poll. (default: `DIDSDK_TX_BACKOFF_FACTOR`)
+        :param max_retries: the number of polls for a pending transaction. (default: `DIDSDK_TX_RETRY_COUNT`)
+        :param max_concurrent_polls: the maximum number of polls in flight.
+        :param latency_window: the number of recent confirmation latencies to keep.
+        :param mode: the way to confirm transactions. (default: `DIDSDK_TX_CONFIRMATION_MODE`)
+        """
+        self._transport: AsyncTransport = transport
+        self._interval: float = settings.DIDSDK_TX_SLEEP_TIME if interval is None else interval
+        self._max_interval: float = settings.DIDSDK_TX_MAX_SLEEP_TIME if max_interval is None else max_interval
+        self._backoff_factor: float = backoff_factor or settings.DIDSDK_TX_BACKOFF_FACTOR
+        self._max_retries: int = max_retries or settings.DIDSDK_TX_RETRY_COUNT
+        self._max_concurrent_polls: int = max_concurrent_polls
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._mode: ConfirmationMode = mode or ConfirmationMode(settings.DIDSDK_TX_CONFIRMATION_MODE)
+        self._pending: Dict[str, _PendingTransaction] = {}
+        self._long_polls: Dict[str, _PendingTransaction] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._polls: Set[asyncio.Task] = set()
+
+    @property
+    def mode(self) -> ConfirmationMode:
+        return self._mode
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._long_polls)
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending.clear()
+            self._long_polls.clear()
+            self._poller = None
+            self._polls = set()
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_polls)
+
+    def _first_poll_delay(self) -> float:
+        if len(self._latencies) < self.MIN_SAMPLES_FOR_ADAPTIVE_DELAY:
+            return 0.0
+        return self.latency_percentiles((50,))[50]
+
+    async def _poll(self, pending: _PendingTransaction):
+        try:
+            async with self._semaphore:
+                tx_result = await self._transport.get_transaction_result(pending.tx_hash)
+            if not tx_result:
+                raise JSONRPCException("transaction result is None.")
+        except JSONRPCException as e:
+            logger.debug(f"{e}")
+            pending.retries_left -= 1
+            if pending.retries_left <= 0:
+                self._resolve(pending, exception=TransactionException(e))
+            else:
+                logger.debug(f"Remain to retry request for getting transaction result: {pending.retries_left}")
+                pending.next_poll_at = self._loop.time() + pending.interval
+                pending.interval = min(pending.interval * self._backoff_factor, self._max_interval)
+                if pending.expires_at is not None and pending.next_poll_at >= pending.expires_at:
+                    self._resolve(
+                        pending,
+                        exception=asyncio.TimeoutError(
+                            f"The next poll of {pending.tx_hash} is after the timeout of its waiters."
+                        ),
+                    )
+        except Exception as e:
+            self._resolve(pending, exception=e)
+        else:
+            self._latencies.append(self._loop.time() - pending.registered_at)
+            self._resolve(pending, result=tx_result)
+        finally:
+            pending.polling = False
+            self._wakeup.set()
+
+    async def _long_poll(self, pending: _PendingTransaction):
+        while self._mode == ConfirmationMode.LONG_POLL and not pending.future.done():
+            try:
+                tx_result = await self._transport.wait_transaction_result(pending.tx_hash)
+                if not tx_result:
+                    raise JSONRPCException("transaction result is None.")
+            except NotImplementedError:
+                self._fall_back_to_polling()
+            except JSONRPCException as e:
+                if e.rpc_code == JSONRPCException.RPC_METHOD_NOT_FOUND:
+                    self._fall_back_to_polling()
+                    continue
+
+                logger.debug(f"{e}")
+                pending.retries_left -= 1
+                if pending.retries_left <= 0:
+                    self._resolve(pending, exception=TransactionException(e))
+                    return
+                if e.rpc_code not in (JSONRPCException.SYSTEM_REQUEST_TIMEOUT, JSONRPCException.SYSTEM_HARD_TIMEOUT):
+                    await asyncio.sleep(pending.interval)
+                    pending.interval = min(pending.interval * self._backoff_factor, self._max_interval)
+            except Exception as e:
+                self._resolve(pending, exception=e)
+                return
+            else:
+                self._latencies.append(self._loop.time() - pending.registered_at)
+                self._resolve(pending, result=tx_result)
+                return
+
+        if not pending.future.done():
+            self._schedule(pending)
+
+    def _fall_back_to_polling(self):
+        if self._mode == ConfirmationMode.LONG_POLL:
+            logger.info("icx_waitTransactionResult is not supported by the node. Poll transaction results instead.")
+            self._mode = ConfirmationMode.POLL
+
+    def _schedule(self, pending: _PendingTransaction):
+        self._long_polls.pop(pending.tx_hash, None)
+        self._pending[pending.tx_hash] = pending
+        self._wakeup.set()
+        if self._poller is None:
+            self._poller = self._loop.create_task(self._run())
+
+    def _start(self, coroutine):
+        task = self._loop.create_task(coroutine)
+        self._polls.add(task)
+        task.add_done_callback(self._polls.discard)
+
+    def _resolve(self, pending: _PendingTransaction, result: dict = None, exception: BaseException = None):
+        self._pending.pop(pending.tx_hash, None)
+        self._long_polls.pop(pending.tx_hash, None)
+        if pending.future.done():
+            return
+        if exception is not None:
+            pending.future.set_exception(exception)
+        else:
+            pending.future.set_result(result)
+
+    async def _run(self):
+        while self._pending:
+            self._wakeup.clear()
+            now = self._loop.time()
+            next_poll_at = math.inf
+            for pending in list(self._pending.values()):
+                if pending.polling:
+                    continue
+                if pending.next_poll_at <= now:
+                    pending.polling = True
+                    self._start(self._poll(pending))
+                else:
+                    next_poll_at = min(next_poll_at, pending.next_poll_at)
+
+            timeout = None if next_poll_at == math.inf else next_poll_at - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._poller = None
+
+    def latency_percentiles(self, percentiles: Iterable[int] = (50, 90, 99)) -> Dict[int, float]:
+        """Returns the percentiles of the recent confirmation latencies.
+
+        :param percentiles: the percentiles to calculate.
+        :return: the latency in seconds by each percentile. It's empty if nothing was confirmed.
+        """
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {}
+        return {
+            percentile: latencies[min(len(latencies) - 1, max(0, math.ceil(percentile / 100 * len(latencies)) - 1))]
+            for percentile in percentiles
+        }
+
+    async def wait(self, tx_hash: str, timeout: float = None) -> dict:
+        """Wait until the transaction is confirmed.
+
+        :param tx_hash: the hash of transaction.
+        :param timeout: the seconds to wait for the confirmation. If None, wait until the retries run out.
+            A poll that would be sent after the timeout of every waiter is skipped, and the timeout is raised at once.
+            The other waiters of the transaction keep waiting when a waiter times out.
+        :return: the transaction result.
+        """
+        self._bind_loop()
+        now = self._loop.time()
+        expires_at = None if timeout is None else now + timeout
+        pending = self._pending.get(tx_hash) or self._long_polls.get(tx_hash)
+        if pending is not None:
+            if pending.expires_at is not None:
+                pending.expires_at = None if expires_at is None else max(pending.expires_at, expires_at)
+        else:
+            pending = _PendingTransaction(
+                tx_hash=tx_hash,
+                future=self._loop.create_future(),
+                registered_at=now,
+                next_poll_at=now + self._first_poll_delay(),
+                interval=self._interval,
+                retries_left=self._max_retries,
+                expires_at=expires_at,
+            )
+            if self._mode == ConfirmationMode.LONG_POLL:
+                self._long_polls[tx_hash] = pending
+                self._start(self._long_poll(pending))
+            else:
+                self._schedule(pending)
+
+        pending.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.future), timeout=timeout)
+        finally:
+            pending.waiters -= 1
+            if pending.waiters == 0 and not pending.future.done():
+                self._forget(pending)
+
+    def _forget(self, pending: _PendingTransaction):
+        """Stop confirming a transaction after its last waiter gave up.
+
+        :param pending: the _PendingTransaction object without waiters.
+        """
+        if self._pending.get(pending.tx_hash) is pending:
+            del self._pending[pending.tx_hash]
+        if self._long_polls.get(pending.tx_hash) is pending:
+            del self._long_polls[pending.tx_hash]
+        pending.future.cancel()
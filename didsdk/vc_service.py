@@ -1,16 +1,47 @@
 import asyncio
-from typing import List
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
 
 from coincurve import PrivateKey
-from iconsdk.exception import JSONRPCException
+from iconsdk.builder.transaction_builder import CallTransaction
+from iconsdk.exception import IconServiceBaseException
 from iconsdk.icon_service import IconService
 from iconsdk.signed_transaction import SignedTransaction, Transaction
 from iconsdk.wallet.wallet import KeyWallet, Wallet
-from loguru import logger
 
 from didsdk import settings
-from didsdk.exceptions import TransactionException, VCException
+from didsdk.cache.ttl_cache import TTLCache
+from didsdk.exceptions import VCException
+from didsdk.jwt.jwt import Jwt
+from didsdk.register_coalescer import RegisterCoalescer
+from didsdk.score import vc_score_parameter
+from didsdk.score.snapshot import pinned_height
+from didsdk.score.step_estimator import StepEstimator
 from didsdk.score.vc_score import VCScore
+from didsdk.transport.async_transport import AsyncTransport
+from didsdk.transport.call_guard import CallGuard
+from didsdk.transport.deadline import (
+    Deadline,
+    effective_deadline,
+    run_within,
+    wait_within,
+)
+from didsdk.transport.tx_tracker import ConfirmationMode, TransactionTracker
+from didsdk.wallet_pool import WalletPool, lease_wallet
+
+
+@dataclass
+class RegisterResult:
+    """The outcome of a credential registration in `VCService.register_bulk`."""
+
+    credential: str
+    tx_hash: Optional[str] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        return self.tx_hash is not None and self.error is None
 
 
 class VCService:
@@ -19,160 +50,544 @@ class VCService:
     In order to register and revoke verifiable credentials,
     a transaction is required and this class uses `iconsdk.icon_service.IconService`.
     https://github.com/icon-project/icon-sdk-python
+
+    An async operation takes a `Deadline`, or follows the one set by `deadline_scope`.
+    Its sub-calls share the time left, and `DeadlineExceededException` is raised when it runs out.
     """
 
-    def __init__(self, iconservice: IconService, network_id: int, score_address: str, timeout: int = 15_000):
+    VALID_STATUS = "0x1"
+    # The number of credentials in the first chunk of `register_bulk`, which measures the step cost.
+    PROBE_CHUNK_SIZE = 8
+    # The ratio of the step limit that a chunk is expected to use at most.
+    STEP_MARGIN = 0.9
+
+    def __init__(
+        self,
+        iconservice: IconService,
+        network_id: int,
+        score_address: str,
+        timeout: int = 15_000,
+        transport: AsyncTransport = None,
+        tracker: TransactionTracker = None,
+        confirmation_mode: ConfirmationMode = None,
+        coalesce_registrations: bool = False,
+        status_cache_ttl: float = None,
+        pinned_cache: TTLCache = None,
+        guard: CallGuard = None,
+    ):
         """Create the instance.
 
         :param iconservice: the IconService object.
         :param network_id: the network ID of the blockchain.
         :param score_address: the vc score address deployed to the blockchain.
-        :param timeout: the specified timeout, in milliseconds.
+        :param timeout: the specified timeout of a transaction confirmation, in milliseconds.
+        :param transport: the AsyncTransport object for the async methods.
+            If None, the IconService object is run in a thread pool.
+        :param tracker: the TransactionTracker object that confirms transactions.
+            It can be shared by services to poll their pending transactions together.
+            If None, a new one is created with the transport.
+        :param confirmation_mode: the way the new tracker confirms transactions.
+            It's ignored if `tracker` is given. (default: `DIDSDK_TX_CONFIRMATION_MODE`)
+        :param coalesce_registrations: if True, concurrent `register` calls are merged into
+            `registerList` transactions by `RegisterCoalescer`.
+        :param status_cache_ttl: the seconds a valid status of VC is cached. Invalid statuses are never cached,
+            and the revocations sent by this service invalidate the cache. If 0, `is_valid` is not cached.
+            (default: `DIDSDK_VC_STATUS_CACHE_TTL`)
+        :param pinned_cache: the cache of the reads at a block height, which can be shared by services.
+            If None, a new one is created.
+        :param guard: the CallGuard object which limits the requests and the transactions to the node,
+            and fails them fast while the node is failing. It can be shared by services.
+            If None, they are sent as they are.
         """
         self._iconservice: IconService = iconservice
         self._network_id: int = network_id
-        self._vc_score: VCScore = VCScore(self._iconservice, self._network_id, score_address)
+        self._vc_score: VCScore = VCScore(
+            self._iconservice, self._network_id, score_address, transport, pinned_cache, guard
+        )
+        self._transport: AsyncTransport = self._vc_score.transport
         self._timeout: int = timeout
+        self._tracker: TransactionTracker = tracker or TransactionTracker(self._transport, mode=confirmation_mode)
+        self._register_coalescer: Optional[RegisterCoalescer] = (
+            RegisterCoalescer(self._register, self._register_list) if coalesce_registrations else None
+        )
 
-    async def _get_transaction_result(self, tx_hash: str) -> dict:
-        response = None
-        retry_times = settings.DIDSDK_TX_RETRY_COUNT
-        while response is None and retry_times > 0:
-            try:
-                tx_result = self._iconservice.get_transaction_result(tx_hash)
-                if not tx_result:
-                    raise JSONRPCException("transaction result is None.")
-            except JSONRPCException as e:
-                logger.debug(f"{e}")
+        status_cache_ttl = settings.DIDSDK_VC_STATUS_CACHE_TTL if status_cache_ttl is None else status_cache_ttl
+        self._status_cache: Optional[TTLCache] = (
+            TTLCache(max_size=settings.DIDSDK_VC_STATUS_CACHE_SIZE, ttl=status_cache_ttl) if status_cache_ttl else None
+        )
+        # The lookups in flight of each VC: the token of the VC's generation and the number of lookups.
+        # A revocation drops the token, so that a lookup started before it does not cache the status it read.
+        self._status_loads: Dict[str, List] = {}
+        self._status_lock = threading.Lock()
+
+    @property
+    def guard(self) -> Optional[CallGuard]:
+        """The CallGuard object of the requests, whose `metrics()` show the state of the node."""
+        return self._vc_score.guard
+
+    @property
+    def step_estimator(self) -> StepEstimator:
+        """The StepEstimator object of the transactions, which learns the step limit of each method."""
+        return self._vc_score.step_estimator
 
-                if retry_times == 0:
-                    raise TransactionException(e)
+    @property
+    def status_cache(self) -> Optional[TTLCache]:
+        return self._status_cache
 
-                retry_times -= 1
-                logger.debug(f"Remain to retry request for getting transaction result: {retry_times}")
+    @property
+    def register_coalescer(self) -> Optional[RegisterCoalescer]:
+        return self._register_coalescer
 
-                await asyncio.sleep(settings.DIDSDK_TX_SLEEP_TIME)
-                continue
+    async def _get_transaction_result(self, tx_hash: str, deadline: Deadline = None) -> dict:
+        """Get the transaction result that matches the hash of transaction.
 
-            return tx_result
+        The transaction is registered with `TransactionTracker` and confirmed together with the others.
 
-    def _send_transaction(self, transaction: Transaction, wallet: Wallet) -> str:
+        :param tx_hash: the hash of transaction.
+        :param deadline: the Deadline object of the operation.
+        :return: the transaction result.
+        """
+        return await wait_within(
+            deadline,
+            lambda timeout: self._tracker.wait(tx_hash, timeout=timeout),
+            self._timeout / 1000,
+            "getTransactionResult",
+        )
+
+    async def _send_transaction(self, transaction: Transaction, wallet: Wallet, deadline: Deadline = None) -> str:
         """Sends a transaction.
 
         :param transaction: the Transaction object.
         :param wallet: the wallet for transaction.
+        :param deadline: the Deadline object of the operation.
         :return: the hash of transaction.
         """
         signed_tx = SignedTransaction(transaction, wallet)
-        return self._iconservice.send_transaction(signed_tx)
+        return await run_within(deadline, self._transport.send_transaction(signed_tx), "sendTransaction")
+
+    async def _transact(
+        self, build: Callable[[Optional[int]], CallTransaction], wallet: Wallet, deadline: Deadline = None
+    ) -> dict:
+        """Sends a transaction and waits for the result, and sends it again with a higher step limit
+        while it runs out of steps.
+
+        :param build: the function that builds the transaction with a step limit, or the estimated one for None.
+        :param wallet: the wallet for transaction.
+        :param deadline: the Deadline object of the operation.
+        :return: the transaction result.
+        """
+
+        async def send(transaction: CallTransaction) -> dict:
+            tx_hash = await self._send_transaction(transaction, wallet, deadline)
+            return await self._get_transaction_result(tx_hash, deadline)
+
+        return await self._vc_score.step_estimator.run(build, send)
+
+    async def _send_revocation(
+        self,
+        build: Callable[[Optional[int]], CallTransaction],
+        wallet: Wallet,
+        sig: Optional[str],
+        deadline: Deadline = None,
+    ) -> dict:
+        """Sends a revocation transaction, and invalidates the cached status of the revoked VCs.
+
+        :param build: the function that builds the transaction with a step limit, or the estimated one for None.
+        :param wallet: the wallet for transaction.
+        :param sig: the signature of the revoked VC, or None if all VCs of an issuer are revoked.
+        :param deadline: the Deadline object of the operation.
+        :return: the transaction result.
+        """
+        try:
+            tx_result = await self._transact(build, wallet, deadline)
+        finally:
+            if self._status_cache is not None:
+                with self._status_lock:
+                    if sig is None:
+                        self._status_loads.clear()
+                        self._status_cache.clear()
+                    else:
+                        self._status_loads.pop(sig, None)
+                        self._status_cache.invalidate(sig)
+
+        if tx_result["status"] != 1:
+            raise VCException(tx_result["failure"]["message"])
+        return tx_result
+
+    async def _register(
+        self, wallet: Union[KeyWallet, WalletPool], credential: str, private_key: PrivateKey, deadline: Deadline = None
+    ) -> dict:
+        async with lease_wallet(wallet) as wallet:
+            tx_result = await self._transact(
+                lambda step_limit: self._vc_score.register(wallet.get_address(), credential, private_key, step_limit),
+                wallet,
+                deadline,
+            )
+        if tx_result["status"] != 1:
+            raise VCException(tx_result["failure"]["message"])
+        return tx_result
+
+    async def _register_list(
+        self,
+        wallet: Union[KeyWallet, WalletPool],
+        credential_list: List[str],
+        private_key: PrivateKey,
+        deadline: Deadline = None,
+    ) -> dict:
+        async with lease_wallet(wallet) as wallet:
+            tx_result = await self._transact(
+                lambda step_limit: self._vc_score.register_list(
+                    wallet.get_address(), credential_list, private_key, step_limit
+                ),
+                wallet,
+                deadline,
+            )
+        if tx_result["status"] != 1:
+            raise VCException(tx_result["failure"]["message"])
+        return tx_result
 
     async def register(
         self,
-        wallet: KeyWallet,
+        wallet: Union[KeyWallet, WalletPool],
         credential: str,
         private_key: PrivateKey,
+        deadline: Deadline = None,
     ) -> dict:
         """Register VC
 
-        :param wallet: the wallet for transaction
+        If the registrations are coalesced, the transaction result may include the other VCs.
+        The shared transaction goes on after the deadline of a caller.
+
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param credential: signed credential
         :param private_key: Key to sign credential
+        :param deadline: the Deadline object by which the registration is confirmed.
         :return: the Document object
         """
-        transaction = self._vc_score.register(wallet.get_address(), credential, private_key)
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
-        if tx_result["status"] != 1:
-            raise VCException(tx_result["failure"]["message"])
-        return tx_result
+        deadline = effective_deadline(deadline)
+        if self._register_coalescer is not None:
+            return await run_within(
+                deadline, self._register_coalescer.register(wallet, credential, private_key), "register"
+            )
+        return await self._register(wallet, credential, private_key, deadline)
 
     async def register_list(
         self,
-        wallet: KeyWallet,
+        wallet: Union[KeyWallet, WalletPool],
         credential_list: List[str],
         private_key: PrivateKey,
+        deadline: Deadline = None,
     ) -> dict:
         """Register VC list
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param credential_list: signed credential list
         :param private_key: Key to sign credential
+        :param deadline: the Deadline object by which the registration is confirmed.
         :return: the Document object
         """
-        transaction = self._vc_score.register_list(wallet.get_address(), credential_list, private_key)
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
-        if tx_result["status"] != 1:
-            raise VCException(tx_result["failure"]["message"])
-        return tx_result
+        return await self._register_list(wallet, credential_list, private_key, effective_deadline(deadline))
 
-    async def revoke(self, wallet: KeyWallet, credential: str, issuer_did: str, private_key: PrivateKey) -> dict:
+    def _chunk_credentials(self, credential_jwts: Dict[int, str], step_limit: int, max_bytes: int) -> List[List[int]]:
+        """Splits the credentials into chunks of which the step cost and the payload size fit in a transaction.
+
+        :param credential_jwts: the credential JWTs to register by the index of `register_bulk` argument.
+        :param step_limit: the step limit of a transaction.
+        :param max_bytes: the maximum size of `credentialJwtList` of a transaction.
+        :return: the indexes of each chunk.
+        """
+        chunks, chunk, size = [], [], 0
+        for index, credential_jwt in credential_jwts.items():
+            next_size = size + len(credential_jwt) + 1
+            estimated_step = self._vc_score.step_estimator.estimate("registerList", next_size)
+            if estimated_step is None:
+                is_full = len(chunk) >= self.PROBE_CHUNK_SIZE
+            else:
+                is_full = estimated_step > step_limit * self.STEP_MARGIN
+            if chunk and (is_full or next_size > max_bytes):
+                chunks.append(chunk)
+                chunk, next_size = [], len(credential_jwt) + 1
+            chunk.append(index)
+            size = next_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def register_bulk(
+        self,
+        wallet: Union[KeyWallet, WalletPool],
+        credentials: List[str],
+        private_key: PrivateKey,
+        window: int = None,
+        step_limit: int = None,
+        max_bytes: int = None,
+        deadline: Deadline = None,
+    ) -> List[RegisterResult]:
+        """Register a large number of VCs with `registerList` transactions.
+
+        The credentials are split into chunks by the step cost measured from the confirmed transactions
+        and by the payload size, and the chunks are sent while at most `window` of them are unconfirmed.
+        A failed chunk is split in half and sent again, until the failed credential is found.
+
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
+        :param credentials: signed credential list
+        :param private_key: Key to sign credential
+        :param window: the maximum number of unconfirmed transactions. (default: `DIDSDK_TX_WINDOW_SIZE`)
+        :param step_limit: the step limit of a transaction. (default: `BaseScore.DEFAULT_STEP_LIMIT`)
+        :param max_bytes: the maximum size of a chunk. (default: `DIDSDK_TX_MAX_PAYLOAD_BYTES`)
+        :param deadline: the Deadline object by which the chunks are confirmed.
+            The credentials not confirmed by then have `DeadlineExceededException` as their error.
+        :return: the RegisterResult objects in the same order as `credentials`.
+        """
+        deadline = effective_deadline(deadline)
+        step_limit = step_limit or self._vc_score.DEFAULT_STEP_LIMIT
+        max_bytes = max_bytes or settings.DIDSDK_TX_MAX_PAYLOAD_BYTES
+        semaphore = asyncio.Semaphore(window or settings.DIDSDK_TX_WINDOW_SIZE)
+        results = [RegisterResult(credential=credential) for credential in credentials]
+        credential_jwts: Dict[int, str] = {}
+        for index, credential in enumerate(credentials):
+            try:
+                credential_jwts[index] = vc_score_parameter.register_jwt(credential, private_key)
+            except Exception as e:
+                results[index].error = e
+
+        async def submit(chunk: List[int]):
+            chunk_jwts = [credential_jwts[index] for index in chunk]
+            async with semaphore:
+                async with lease_wallet(wallet) as leased:
+                    try:
+                        transaction = self._vc_score.register_jwt_list(leased.get_address(), chunk_jwts, step_limit)
+                        tx_hash = await self._send_transaction(transaction, leased, deadline)
+                    except IconServiceBaseException as e:
+                        error = e
+                    except Exception as e:
+                        # The deadline or the transport failed, which splitting the chunk does not fix.
+                        for index in chunk:
+                            results[index].error = e
+                        return
+                    else:
+                        try:
+                            tx_result = await self._get_transaction_result(tx_hash, deadline)
+                        except (Exception, IconServiceBaseException) as e:
+                            for index in chunk:
+                                results[index].error = e
+                            return
+
+                        if tx_result["status"] == 1:
+                            self._vc_score.step_estimator.record_transaction(transaction, tx_result["stepUsed"])
+                            for index in chunk:
+                                results[index].tx_hash = tx_hash
+                            return
+                        error = VCException(tx_result["failure"]["message"])
+
+            if len(chunk) == 1:
+                results[chunk[0]].error = error
+                return
+            middle = len(chunk) // 2
+            await asyncio.gather(submit(chunk[:middle]), submit(chunk[middle:]))
+
+        if not self._vc_score.step_estimator.has_samples("registerList") and credential_jwts:
+            probe = self._chunk_credentials(credential_jwts, step_limit, max_bytes)[0]
+            await submit(probe)
+            credential_jwts_to_send = {index: jwt for index, jwt in credential_jwts.items() if index not in probe}
+        else:
+            credential_jwts_to_send = credential_jwts
+
+        chunks = self._chunk_credentials(credential_jwts_to_send, step_limit, max_bytes)
+        await asyncio.gather(*[submit(chunk) for chunk in chunks])
+        return results
+
+    async def revoke(
+        self,
+        wallet: Union[KeyWallet, WalletPool],
+        credential: str,
+        issuer_did: str,
+        private_key: PrivateKey,
+        deadline: Deadline = None,
+    ) -> dict:
         """revoke vc
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param credential: registered credential
         :param issuer_did: the issuer did
         :param private_key: Key to sign credential
+        :param deadline: the Deadline object by which the revocation is confirmed.
         """
 
-        transaction = self._vc_score.revoke(
-            from_address=wallet.get_address(), credential=credential, issuer_did=issuer_did, private_key=private_key
-        )
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
-        if tx_result["status"] != 1:
-            raise VCException(tx_result["failure"]["message"])
-        return tx_result
-
-    async def revoke_did(self, wallet: KeyWallet, credential: str, issuer_did: str, private_key: PrivateKey) -> dict:
+        async with lease_wallet(wallet) as wallet:
+            return await self._send_revocation(
+                lambda step_limit: self._vc_score.revoke(
+                    wallet.get_address(), credential, issuer_did, private_key, step_limit
+                ),
+                wallet,
+                sig=Jwt.decode(credential).signature,
+                deadline=effective_deadline(deadline),
+            )
+
+    async def revoke_did(
+        self,
+        wallet: Union[KeyWallet, WalletPool],
+        credential: str,
+        issuer_did: str,
+        private_key: PrivateKey,
+        deadline: Deadline = None,
+    ) -> dict:
         """revoke did
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param credential: registered credential
         :param issuer_did: the issuer did
         :param private_key: Key to sign credential
+        :param deadline: the Deadline object by which the revocation is confirmed.
         """
 
-        transaction = self._vc_score.revoke_did(
-            from_address=wallet.get_address(), credential=credential, issuer_did=issuer_did, private_key=private_key
-        )
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
-        if tx_result["status"] != 1:
-            raise VCException(tx_result["failure"]["message"])
-        return tx_result
+        async with lease_wallet(wallet) as wallet:
+            return await self._send_revocation(
+                lambda step_limit: self._vc_score.revoke_did(
+                    wallet.get_address(), credential, issuer_did, private_key, step_limit
+                ),
+                wallet,
+                sig=None,
+                deadline=effective_deadline(deadline),
+            )
 
     async def revoke_vc_and_did(
-        self, wallet: KeyWallet, credential: str, issuer_did: str, private_key: PrivateKey
+        self,
+        wallet: Union[KeyWallet, WalletPool],
+        credential: str,
+        issuer_did: str,
+        private_key: PrivateKey,
+        deadline: Deadline = None,
     ) -> dict:
         """revoke vc and did
 
-        :param wallet: the wallet for transaction
+        :param wallet: the wallet for transaction, or the WalletPool object to lease it from.
         :param credential: registered credential
         :param issuer_did: the issuer did
         :param private_key: Key to sign credential
+        :param deadline: the Deadline object by which the revocation is confirmed.
         """
 
-        transaction = self._vc_score.revoke_vc_and_did(
-            from_address=wallet.get_address(), credential=credential, issuer_did=issuer_did, private_key=private_key
-        )
-        tx_hash = self._send_transaction(transaction, wallet)
-        tx_result = await asyncio.wait_for(self._get_transaction_result(tx_hash), timeout=self._timeout)
-        if tx_result["status"] != 1:
-            raise VCException(tx_result["failure"]["message"])
-        return tx_result
+        async with lease_wallet(wallet) as wallet:
+            return await self._send_revocation(
+                lambda step_limit: self._vc_score.revoke_vc_and_did(
+                    wallet.get_address(), credential, issuer_did, private_key, step_limit
+                ),
+                wallet,
+                sig=None,
+                deadline=effective_deadline(deadline),
+            )
 
     def get(self, sig: str) -> dict:
         """Get the registered VC info"""
 
         return self._vc_score.get(sig)
 
+    async def get_async(self, sig: str, deadline: Deadline = None) -> dict:
+        """Get the registered VC info without blocking the event loop"""
+
+        return await run_within(effective_deadline(deadline), self._vc_score.get_async(sig), "get")
+
+    def _begin_status_load(self, sig: str) -> Optional[object]:
+        if self._status_cache is None or pinned_height() is not None:
+            return None
+        with self._status_lock:
+            load = self._status_loads.get(sig)
+            if load is None:
+                load = self._status_loads[sig] = [object(), 0]
+            load[1] += 1
+            return load[0]
+
+    def _end_status_load(self, sig: str, token: Optional[object], status: str = None):
+        """Cache a valid status unless the VC was revoked by this service while it was read.
+
+        :param sig: credential signature
+        :param token: the token returned by `_begin_status_load`, or None if the status is not cached.
+        :param status: the read status, or None if the read failed.
+        """
+        if token is None:
+            return
+        with self._status_lock:
+            load = self._status_loads.get(sig)
+            if load is None or load[0] is not token:
+                return
+            load[1] -= 1
+            if load[1] == 0:
+                del self._status_loads[sig]
+            if status == self.VALID_STATUS:
+                self._status_cache.put(sig, status)
+
+    def _get_cached_status(self, sig: str) -> Optional[str]:
+        if self._status_cache is None or pinned_height() is not None:
+            return None
+        return self._status_cache.get(sig)
+
     def is_valid(self, sig: str) -> str:
         """Check the registered VC info's status
 
         :param sig: credential signature
         """
-        return self._vc_score.is_valid(sig)
+        status = self._get_cached_status(sig)
+        if status is None:
+            token = self._begin_status_load(sig)
+            try:
+                status = self._vc_score.is_valid(sig)
+            finally:
+                self._end_status_load(sig, token, status)
+        return status
+
+    async def is_valid_async(self, sig: str, deadline: Deadline = None) -> str:
+        """Check the registered VC info's status without blocking the event loop
+
+        :param sig: credential signature
+        :param deadline: the Deadline object by which the status is returned.
+        """
+        status = self._get_cached_status(sig)
+        if status is None:
+            token = self._begin_status_load(sig)
+            try:
+                status = await run_within(effective_deadline(deadline), self._vc_score.is_valid_async(sig), "is_valid")
+            finally:
+                self._end_status_load(sig, token, status)
+        return status
+
+    async def is_valid_many(self, sigs: List[str], window: int = None, deadline: Deadline = None) -> List[str]:
+        """Check the statuses of VCs together.
+
+        The statuses not in the status cache are read by `AsyncTransport.call_many`,
+        which sends them in JSON-RPC batch requests with `AioHttpTransport`.
+
+        :param sigs: credential signatures
+        :param window: the maximum number of requests in flight. (default: `DIDSDK_TRANSPORT_MAX_WORKERS`)
+        :param deadline: the Deadline object by which the statuses are returned.
+        :return: the statuses in the same order as `sigs`.
+        """
+        statuses = {}
+        for sig in dict.fromkeys(sigs):
+            status = self._get_cached_status(sig)
+            if status is not None:
+                statuses[sig] = status
+
+        missing = [sig for sig in dict.fromkeys(sigs) if sig not in statuses]
+        tokens = [self._begin_status_load(sig) for sig in missing]
+        results = []
+        try:
+            if missing:
+                results = await run_within(
+                    effective_deadline(deadline),
+                    self._vc_score.is_valid_many_async(missing, window=window),
+                    "is_valid_many",
+                )
+        finally:
+            for index, (sig, token) in enumerate(zip(missing, tokens)):
+                status = results[index] if index < len(results) else None
+                self._end_status_load(sig, token, None if isinstance(status, BaseException) else status)
+
+        for sig, status in zip(missing, results):
+            if isinstance(status, BaseException):
+                raise status
+            statuses[sig] = status
+        return [statuses[sig] for sig in sigs]
 
     def get_undertaker_list(self):
         """Get the undertaker list"""
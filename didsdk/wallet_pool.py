@@ -0,0 +1,167 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, List, Optional, Sequence, Set, Union
+
+from iconsdk.exception import IconServiceBaseException
+from iconsdk.wallet.wallet import Wallet
+
+from didsdk import settings
+
+
+class _PooledWallet:
+    def __init__(self, wallet: Wallet):
+        self.wallet: Wallet = wallet
+        self.in_flight: int = 0
+        self.pending: Set[str] = set()
+        self.sent: int = 0
+        self.failed: int = 0
+
+
+class _LeasedWallet(Wallet):
+    """The wallet lent to an operation, which records the hash of every transaction it signs as pending."""
+
+    def __init__(self, pooled: _PooledWallet):
+        self._pooled: _PooledWallet = pooled
+        self.tx_hashes: Set[str] = set()
+
+    def get_address(self) -> str:
+        return self._pooled.wallet.get_address()
+
+    def sign(self, data: bytes) -> bytes:
+        # `SignedTransaction` signs the hash of the transaction, which is its id in the node.
+        tx_hash = "0x" + data.hex()
+        self.tx_hashes.add(tx_hash)
+        self._pooled.pending.add(tx_hash)
+        self._pooled.sent += 1
+        return self._pooled.wallet.sign(data)
+
+
+class WalletPool:
+    """This class spreads transactions across wallets, which must be funded to pay for the steps.
+
+    A write method of `DidService` or `VCService` given a pool leases the wallet with the fewest operations
+    in flight, and returns it when the transactions of the operation are confirmed. While every wallet has
+    `max_in_flight` operations, the next one waits for a wallet to be returned.
+    The transactions signed by a leased wallet are pending until it's returned.
+    """
+
+    def __init__(self, wallets: Sequence[Wallet], max_in_flight: int = None):
+        """Create the instance.
+
+        :param wallets: the wallets to send transactions with.
+        :param max_in_flight: the maximum number of operations in flight per wallet.
+            (default: `DIDSDK_WALLET_MAX_IN_FLIGHT`)
+        """
+        if not wallets:
+            raise ValueError("At least one wallet is required.")
+        addresses = [wallet.get_address() for wallet in wallets]
+        if len(set(addresses)) != len(addresses):
+            raise ValueError("The wallets must have different addresses.")
+
+        self._wallets: List[_PooledWallet] = [_PooledWallet(wallet) for wallet in wallets]
+        self._max_in_flight: int = max_in_flight or settings.DIDSDK_WALLET_MAX_IN_FLIGHT
+        self._next: int = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def __len__(self) -> int:
+        return len(self._wallets)
+
+    @property
+    def addresses(self) -> List[str]:
+        return [pooled.wallet.get_address() for pooled in self._wallets]
+
+    @property
+    def in_flight(self) -> int:
+        return sum(pooled.in_flight for pooled in self._wallets)
+
+    def _select(self) -> Optional[_PooledWallet]:
+        # Start from the wallet next to the last one, so that idle wallets take turns.
+        count = len(self._wallets)
+        candidates = [self._wallets[(self._next + offset) % count] for offset in range(count)]
+        pooled = min(candidates, key=lambda candidate: candidate.in_flight)
+        if pooled.in_flight >= self._max_in_flight:
+            return None
+        self._next = (self._wallets.index(pooled) + 1) % count
+        return pooled
+
+    def _wake_next(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Wallet]:
+        """Lends a wallet until the block ends.
+
+        :return: the wallet, which records the transactions it signs as pending.
+        """
+        pooled = self._select()
+        while pooled is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_next()
+                raise
+            pooled = self._select()
+
+        pooled.in_flight += 1
+        leased = _LeasedWallet(pooled)
+        try:
+            yield leased
+        except (Exception, IconServiceBaseException):
+            pooled.failed += 1
+            raise
+        finally:
+            pooled.in_flight -= 1
+            pooled.pending.difference_update(leased.tx_hashes)
+            self._wake_next()
+
+    def pending(self, address: str = None) -> Set[str]:
+        """Returns the hashes of the transactions not confirmed yet.
+
+        :param address: the address of a wallet, or None for all wallets.
+        :return: the hashes of the pending transactions.
+        """
+        return {
+            tx_hash
+            for pooled in self._wallets
+            if address is None or pooled.wallet.get_address() == address
+            for tx_hash in pooled.pending
+        }
+
+    def wallet_stats(self) -> List[dict]:
+        """Returns the statistics of each wallet.
+
+        :return: the address, the operations in flight, the pending transactions,
+            and the numbers of signed transactions and failed operations.
+        """
+        return [
+            {
+                "address": pooled.wallet.get_address(),
+                "in_flight": pooled.in_flight,
+                "pending": len(pooled.pending),
+                "sent": pooled.sent,
+                "failed": pooled.failed,
+            }
+            for pooled in self._wallets
+        ]
+
+
+@asynccontextmanager
+async def lease_wallet(wallet: Union[Wallet, WalletPool]) -> AsyncIterator[Wallet]:
+    """Lends a wallet from a pool until the block ends, or uses the given wallet as it is.
+
+    :param wallet: the Wallet object or the WalletPool object.
+    :return: the wallet to send transactions with.
+    """
+    if isinstance(wallet, WalletPool):
+        async with wallet.lease() as leased:
+            yield leased
+    else:
+        yield wallet
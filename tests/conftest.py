@@ -3,6 +3,8 @@ from typing import List
 
 import pytest
 from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
 from iconsdk.wallet.wallet import KeyWallet
 
 from didsdk.core.algorithm_provider import AlgorithmProvider, AlgorithmType
@@ -21,6 +23,7 @@ from didsdk.protocol.json_ld.json_ld_param import JsonLdParam
 from didsdk.protocol.json_ld.revocation_service import RevocationService
 from didsdk.vc_service import VCService
 from tests.utils.icon_service_factory import IconServiceFactory
+from tests.utils.local_rpc_server import LocalRpcServer
 
 
 @pytest.fixture
@@ -228,6 +231,17 @@ def vc_service_testnet() -> VCService:
     )
 
 
+@pytest.fixture
+def local_rpc_server() -> LocalRpcServer:
+    with LocalRpcServer() as server:
+        yield server
+
+
+@pytest.fixture
+def local_iconservice(local_rpc_server: LocalRpcServer) -> IconService:
+    return IconService(HTTPProvider(local_rpc_server.url))
+
+
 @pytest.fixture
 def test_wallet_keys() -> dict:
     return {
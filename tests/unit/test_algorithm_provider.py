@@ -0,0 +1,50 @@
+import pytest
+from coincurve import PrivateKey, PublicKey
+from ecdsa.curves import NIST256p, SECP256k1
+
+from didsdk.core.algorithm import Algorithm
+from didsdk.core.algorithm_provider import AlgorithmProvider, AlgorithmType
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+
+
+class HmacLikeAlgorithm(Algorithm):
+    @property
+    def type(self) -> AlgorithmType:
+        return AlgorithmType.ES256
+
+    def sign(self, private_key: PrivateKey, data: bytes) -> bytes:
+        return b"signed:" + data[:4]
+
+    def verify(self, public_key: PublicKey, data: bytes, signature: bytes) -> bool:
+        return signature == b"signed:" + data[:4]
+
+
+class TestAlgorithmProvider:
+    def test_shared_instance(self):
+        # WHEN get the algorithm of a type twice, by the type and by the name
+        # THEN the same instance is returned.
+        assert AlgorithmProvider.create(AlgorithmType.ES256K) is AlgorithmProvider.create("ES256K")
+        with pytest.raises(ValueError):
+            AlgorithmProvider.create(AlgorithmType.RS256)
+
+    def test_lookup_type(self):
+        assert AlgorithmType.from_identifier("Secp256k1VerificationKey") == AlgorithmType.ES256K
+        assert AlgorithmType.from_ecdsa_curve(SECP256k1) == AlgorithmType.ES256K
+        assert AlgorithmType.from_ecdsa_curve(NIST256p.name) == AlgorithmType.ES256
+        with pytest.raises(ValueError):
+            AlgorithmType.from_identifier("Ed25519VerificationKey2018")
+
+    def test_register(self, monkeypatch):
+        # GIVEN an algorithm registered for ES256
+        monkeypatch.setattr(AlgorithmProvider, "_algorithms", dict(AlgorithmProvider._algorithms))
+        monkeypatch.setattr(AlgorithmProvider, "_builtins_loaded", AlgorithmProvider._builtins_loaded)
+        AlgorithmProvider.register(HmacLikeAlgorithm())
+
+        # WHEN sign and verify a token of ES256
+        jwt = Jwt(Header(alg=AlgorithmType.ES256.name, kid="did:icon:01:1234#key1"), Payload({"sub": "someone"}))
+        token = jwt.sign(PrivateKey())
+
+        # THEN the registered algorithm is used.
+        assert Jwt.decode(token).verify(PrivateKey().public_key).success
+        assert AlgorithmProvider.create("ES256K") is not None
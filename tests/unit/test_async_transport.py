@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.document import Document
+from didsdk.document.encoding import EncodeType
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import (
+    AioHttpTransport,
+    AsyncTransport,
+    ExecutorTransport,
+)
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestAsyncTransport:
+    KEY_ID = "key1"
+
+    @pytest.fixture
+    def public_key_param(self) -> str:
+        private_key = PrivateKey()
+        key_provider = KeyProvider(self.KEY_ID, AlgorithmType.ES256K, private_key.public_key, private_key)
+        return DidScoreParameter.create(key_provider, EncodeType.BASE64)
+
+    @pytest.fixture(params=["executor", "aiohttp"])
+    def transport(self, request, local_rpc_server: LocalRpcServer, local_iconservice: IconService) -> AsyncTransport:
+        if request.param == "executor":
+            return ExecutorTransport(local_iconservice)
+        return AioHttpTransport(local_rpc_server.url)
+
+    async def test_create_and_read_document(
+        self,
+        local_rpc_server: LocalRpcServer,
+        local_iconservice: IconService,
+        transport: AsyncTransport,
+        public_key_param,
+    ):
+        # GIVEN a DidService with an async transport
+        did_service = DidService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS, transport=transport
+        )
+
+        # WHEN create a DID document and read it
+        document: Document = await did_service.create(KeyWallet.create(), public_key_param)
+        read_document = await did_service.read_document_async(document.id)
+
+        # THEN both of them are the same document.
+        assert read_document.id == document.id
+        assert read_document.get_public_key_property(self.KEY_ID)
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 1
+        await transport.close()
+
+    async def test_call_error(self, local_rpc_server: LocalRpcServer, transport: AsyncTransport, local_iconservice):
+        # GIVEN a DidService with an async transport
+        did_service = DidService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS, transport=transport
+        )
+
+        # WHEN read a document that does not exist
+        # THEN raise the JSON-RPC error of the node.
+        with pytest.raises(JSONRPCException):
+            await did_service.read_document_async("did:icon:02:unknown")
+        await transport.close()
+
+    async def test_concurrent_reads(self, local_iconservice: IconService, public_key_param):
+        # GIVEN a slow node and a created DID document
+        with LocalRpcServer(latency=0.05) as server:
+            transport = AioHttpTransport(server.url)
+            did_service = DidService(
+                local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS, transport=transport
+            )
+            document: Document = await did_service.create(KeyWallet.create(), public_key_param)
+
+            # WHEN read the document concurrently
+            count = 40
+            started = time.monotonic()
+            documents = await asyncio.gather(*[did_service.read_document_async(document.id) for _ in range(count)])
+            elapsed = time.monotonic() - started
+
+            # THEN the reads share the event loop instead of running one by one.
+            assert all(read_document.id == document.id for read_document in documents)
+            assert elapsed < count * server.latency / 4
+            await transport.close()
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk import settings
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.jwt.jwt import Jwt
+from didsdk.score.did_score import DidScore
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import AioHttpTransport
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+async def create_documents(did_service: DidService, count: int) -> list:
+    dids = []
+    for _ in range(count):
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+        document = await did_service.create(
+            KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+        )
+        dids.append(document.id)
+    return dids
+
+
+class TestBatchCalls:
+    @pytest.mark.parametrize("batch", [True, False], ids=["batch", "no-batch"])
+    async def test_read_documents(self, batch: bool):
+        # GIVEN documents in a node that supports batch requests or not
+        with LocalRpcServer(batch=batch) as server:
+            transport = AioHttpTransport(server.url)
+            did_service = DidService(
+                IconService(HTTPProvider(server.url)),
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+            )
+            dids = await create_documents(did_service, 5)
+            request_count = server.http_request_count
+
+            # WHEN read them with a duplicated one
+            documents = await did_service.read_documents(dids + [dids[0]])
+
+            # THEN they are read in one request, or one by one after the batch is rejected.
+            assert [document.id for document in documents] == dids + [dids[0]]
+            assert server.http_request_count - request_count == (1 if batch else 6)
+            assert transport.batch_supported == batch
+            await transport.close()
+
+    async def test_is_valid_many(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService, monkeypatch):
+        # GIVEN registered credentials, and batches of at most 2 calls
+        monkeypatch.setattr(settings, "DIDSDK_RPC_BATCH_SIZE", 2)
+        transport = AioHttpTransport(local_rpc_server.url)
+        vc_service = VCService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS, transport=transport
+        )
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 4)
+        await vc_service.register_list(KeyWallet.create(), credentials[:3], private_key)
+        request_count = local_rpc_server.http_request_count
+
+        # WHEN check the statuses of them
+        statuses = await vc_service.is_valid_many([Jwt.decode(credential).signature for credential in credentials])
+
+        # THEN they are checked in 2 requests.
+        assert statuses == ["0x1", "0x1", "0x1", "0x0"]
+        assert local_rpc_server.http_request_count - request_count == 2
+        await transport.close()
+
+    async def test_error_in_batch(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a document and an unknown DID
+        transport = AioHttpTransport(local_rpc_server.url)
+        did_service = DidService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS, transport=transport
+        )
+        dids = await create_documents(did_service, 1)
+        unknown_did = "did:icon:02:" + "00" * 24
+
+        # WHEN read them in a batch
+        did_score = DidScore(local_iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS, transport)
+        results = await did_score.get_did_documents_async([dids[0], unknown_did])
+
+        # THEN only the unknown one fails.
+        assert dids[0] in results[0]
+        assert isinstance(results[1], JSONRPCException)
+
+        # WHEN read them as documents
+        # THEN the error is raised.
+        with pytest.raises(JSONRPCException):
+            await did_service.read_documents([dids[0], unknown_did])
+        await transport.close()
+
+    async def test_transport_error_in_batch(self, monkeypatch):
+        # GIVEN a node slower than the timeout of the transport, and batches of at most 2 calls
+        monkeypatch.setattr(settings, "DIDSDK_RPC_BATCH_SIZE", 2)
+        with LocalRpcServer(latency=0.5) as server:
+            transport = AioHttpTransport(server.url, timeout=0.1)
+            did_score = DidScore(IconService(HTTPProvider(server.url)), 2, LocalRpcServer.DID_SCORE_ADDRESS, transport)
+            unknown_dids = ["did:icon:02:" + f"{index:02x}" * 24 for index in range(3)]
+
+            # WHEN read documents in batches
+            results = await did_score.get_did_documents_async(unknown_dids)
+
+            # THEN the timeout is put in place of each document instead of being raised.
+            assert len(results) == 3
+            assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+            await transport.close()
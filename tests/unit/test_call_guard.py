@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.document_cache import DocumentCache
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import CircuitOpenException
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.call_guard import (
+    AdaptiveLimiter,
+    CallGuard,
+    CircuitBreaker,
+    CircuitState,
+    is_node_failure,
+)
+from tests.unit.test_document_cache import FakeClock
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestCallGuard:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    def test_is_node_failure(self):
+        assert is_node_failure(ConnectionError())
+        assert is_node_failure(JSONRPCException("busy", JSONRPCException.SYSTEM_POOL_OVERFLOW))
+        assert not is_node_failure(JSONRPCException("unknown DID", LocalRpcServer.SCORE_ERROR))
+        assert not is_node_failure(JSONRPCException("pending", JSONRPCException.SYSTEM_TX_PENDING))
+
+    def test_limit_aimd(self, clock):
+        # GIVEN a limiter of 4 requests
+        limiter = AdaptiveLimiter(initial_limit=4, min_limit=1, max_limit=8, latency_target=1, clock=clock)
+
+        # WHEN as many requests as the limit succeed for 4 rounds
+        for _ in range(4):
+            count = limiter.limit
+            for _ in range(count):
+                limiter.acquire()
+            for _ in range(count):
+                limiter.release(latency=0.1)
+
+        # THEN the limit grows about one per round.
+        assert limiter.limit == 7
+
+        # WHEN the requests in flight fail together
+        for _ in range(limiter.limit):
+            limiter.acquire()
+        for _ in range(7):
+            limiter.release(latency=0.1, failed=True)
+
+        # THEN the limit is cut in half once.
+        assert limiter.limit == 3
+        assert limiter.metrics()["decreases"] == 1
+
+        # WHEN a request is slower than the target after a while
+        clock.now += 1
+        limiter.acquire()
+        limiter.release(latency=1.5)
+
+        # THEN the limit is cut again.
+        assert limiter.limit == 1
+
+    def test_acquire_waits(self):
+        # GIVEN a limiter of 1 request in flight
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        # WHEN another thread acquires it
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        # THEN it waits until the request is released.
+        assert not acquired.wait(0.1)
+        assert limiter.metrics()["waiting"] == 1
+        limiter.release(latency=0.01)
+        assert acquired.wait(1)
+        thread.join()
+
+    async def test_run_async_limits_concurrency(self):
+        # GIVEN a guard of 2 requests in flight
+        guard = CallGuard(limiter=AdaptiveLimiter(initial_limit=2, max_limit=2))
+        running, peak = 0, 0
+
+        async def request(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        # WHEN run 10 requests together
+        results = await asyncio.gather(*[guard.run_async(request, value) for value in range(10)])
+
+        # THEN at most 2 of them are in flight.
+        assert results == list(range(10))
+        assert peak == 2
+        assert guard.metrics()["limiter"]["successes"] == 10
+
+    def test_circuit_breaker(self, clock):
+        # GIVEN a breaker which opens after 2 failures
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        guard = CallGuard(breaker=breaker)
+
+        def fail():
+            raise ConnectionError("refused")
+
+        # WHEN requests fail twice
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                guard.run(fail)
+
+        # THEN the next request fails fast.
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenException):
+            guard.run(lambda: "sent")
+
+        # WHEN the reset timeout passes
+        clock.now += 10
+
+        # THEN a request probes the node, and the circuit closes after it succeeds.
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert guard.run(lambda: "sent") == "sent"
+        assert guard.metrics()["breaker"] == {"state": "closed", "consecutive_failures": 0, "opens": 1, "rejected": 1}
+
+    def test_score_error_is_not_failure(self):
+        # GIVEN a breaker which opens after a failure
+        guard = CallGuard(breaker=CircuitBreaker(failure_threshold=1))
+
+        def fail():
+            raise JSONRPCException("unknown DID", LocalRpcServer.SCORE_ERROR)
+
+        # WHEN a score raises an error
+        with pytest.raises(JSONRPCException):
+            guard.run(fail)
+
+        # THEN the circuit stays closed.
+        assert guard.breaker.state == CircuitState.CLOSED
+
+    async def test_serve_cached_document_while_open(self, clock):
+        # GIVEN a DidService with a guard, and a document cache which serves a document for 100 seconds on error
+        with LocalRpcServer() as server:
+            guard = CallGuard(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30))
+            did_service = DidService(
+                IconService(HTTPProvider(server.url)),
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                document_cache=DocumentCache(ttl=10, stale_ttl=0, error_ttl=100, clock=clock),
+                guard=guard,
+            )
+            private_key = PrivateKey()
+            key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+            document = await did_service.create(
+                KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+            )
+
+        # WHEN the document expires and the node goes down
+        clock.now += 20
+        assert did_service.read_document(document.id).id == document.id
+        started = time.monotonic()
+        await did_service.read_document_async(document.id)
+        elapsed = time.monotonic() - started
+
+        # THEN the expired document is served, and the read after the failure fails fast.
+        assert guard.breaker.state == CircuitState.OPEN
+        assert guard.metrics()["breaker"]["rejected"] == 1
+        assert elapsed < 0.1
+
+        # WHEN the error period passes
+        clock.now += 100
+
+        # THEN the error is raised.
+        with pytest.raises(CircuitOpenException):
+            did_service.read_document(document.id)
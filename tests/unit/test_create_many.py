@@ -0,0 +1,96 @@
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.signed_transaction import SignedTransaction
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.score.did_score import DidScore
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import AioHttpTransport
+from didsdk.transport.tx_tracker import TransactionTracker
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class WindowCheckingTransport(AioHttpTransport):
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.tracker: TransactionTracker = None
+        self.max_pending_count = 0
+
+    async def send_transaction(self, signed_transaction: SignedTransaction) -> str:
+        self.max_pending_count = max(self.max_pending_count, self.tracker.pending_count)
+        return await super().send_transaction(signed_transaction)
+
+
+class TestCreateMany:
+    @staticmethod
+    def create_public_key_param(key_id: str) -> str:
+        private_key = PrivateKey()
+        key_provider = KeyProvider(key_id, AlgorithmType.ES256K, private_key.public_key, private_key)
+        return DidScoreParameter.create(key_provider, EncodeType.BASE64)
+
+    async def test_create_many(self, local_iconservice: IconService):
+        # GIVEN public keys with an invalid one, and a node that confirms a transaction after 0.1 seconds
+        with LocalRpcServer(confirm_delay=0.1) as server:
+            transport = WindowCheckingTransport(server.url)
+            tracker = TransactionTracker(transport, interval=0.05)
+            transport.tracker = tracker
+            did_service = DidService(
+                local_iconservice,
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                tracker=tracker,
+            )
+            public_keys = [self.create_public_key_param(f"key{index}") for index in range(20)]
+            public_keys[7] = "invalid public key"
+
+            # WHEN create DID documents with a wallet and the window of 5 transactions
+            results = await did_service.create_many(KeyWallet.create(), public_keys, window=5)
+
+            # THEN the results are in order, and the invalid one fails without stopping the others.
+            assert [result.public_key for result in results] == public_keys
+            assert not results[7].success
+            assert isinstance(results[7].error, TypeError)
+            for index, result in enumerate(results):
+                if index == 7:
+                    continue
+                assert result.success
+                assert server.documents[result.did]["publicKey"][0]["id"] == f"key{index}"
+            assert server.method_counts["icx_sendTransaction"] == 19
+            assert transport.max_pending_count < 5
+            await transport.close()
+
+    async def test_create_many_with_wallets(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a DidService and a wallet for each public key
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        public_keys = [self.create_public_key_param("key1") for _ in range(3)]
+        wallets = [KeyWallet.create() for _ in range(3)]
+
+        # WHEN create DID documents
+        results = await did_service.create_many(wallets, public_keys)
+
+        # THEN a document is created for each public key.
+        assert all(result.success for result in results)
+        assert len({result.did for result in results}) == 3
+        assert all(result.did in local_rpc_server.documents for result in results)
+
+        # WHEN the number of wallets does not match
+        # THEN raise ValueError.
+        with pytest.raises(ValueError):
+            await did_service.create_many(wallets[:2], public_keys)
+
+    def test_unique_timestamps(self, local_iconservice: IconService):
+        # GIVEN a DidScore
+        did_score = DidScore(local_iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS)
+        from_address = KeyWallet.create().get_address()
+
+        # WHEN build transactions in a tight loop
+        transactions = [did_score.create(from_address, public_key="{}") for _ in range(100)]
+
+        # THEN every transaction has its own timestamp.
+        assert len({transaction.timestamp for transaction in transactions}) == 100
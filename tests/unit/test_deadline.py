@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import DeadlineExceededException
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import AioHttpTransport
+from didsdk.transport.deadline import Deadline, current_deadline, deadline_scope
+from didsdk.vc_service import VCService
+from tests.unit.test_batch_calls import create_documents
+from tests.unit.test_document_cache import FakeClock
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestDeadline:
+    def test_remaining(self):
+        # GIVEN a deadline in 10 seconds
+        clock = FakeClock()
+        deadline = Deadline.after(10, clock=clock)
+
+        # WHEN time passes
+        clock.now += 4
+
+        # THEN the time left is shared by the sub-calls.
+        assert deadline.remaining() == 6
+        assert deadline.timeout(15) == 6
+        assert deadline.timeout(1) == 1
+        assert not deadline.expired
+
+        # WHEN the deadline passes
+        clock.now += 6
+
+        # THEN it's expired, and the error is caught as asyncio.TimeoutError too.
+        assert deadline.expired
+        with pytest.raises(DeadlineExceededException):
+            deadline.check("read_document")
+        with pytest.raises(asyncio.TimeoutError):
+            deadline.check("read_document")
+
+    async def test_run_cancels_sub_call(self):
+        # GIVEN a sub-call slower than the deadline
+        cancelled = asyncio.Event()
+
+        async def sub_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        # WHEN run it within the deadline
+        # THEN it's cancelled at the deadline.
+        with pytest.raises(DeadlineExceededException):
+            await Deadline.after(0.05).run(sub_call(), "sub_call")
+        assert cancelled.is_set()
+
+    def test_nested_scope(self):
+        # GIVEN a scope of 1 second
+        with deadline_scope(1) as outer:
+            # WHEN open a scope of a longer deadline in it
+            with deadline_scope(10) as inner:
+                # THEN the outer deadline still applies.
+                assert inner is outer
+                assert current_deadline() is outer
+        assert current_deadline() is None
+
+    async def test_create_skips_retries_after_deadline(self):
+        # GIVEN a node which confirms a transaction after 5 seconds
+        with LocalRpcServer(confirm_delay=5) as server:
+            transport = AioHttpTransport(server.url)
+            did_service = DidService(
+                IconService(HTTPProvider(server.url)),
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+            )
+
+            private_key = PrivateKey()
+            key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+            public_key_param = DidScoreParameter.create(key_provider, EncodeType.BASE64)
+
+            # WHEN create a DID document with a deadline of 0.5 seconds
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                await did_service.create(KeyWallet.create(), public_key_param, deadline=Deadline.after(0.5))
+            elapsed = time.monotonic() - started
+
+            # THEN it gives up as soon as the next poll would be after the deadline.
+            assert elapsed < 0.5
+            assert server.method_counts["icx_getTransactionResult"] == 1
+            await transport.close()
+
+    async def test_verification_in_scope(self):
+        # GIVEN documents and credential statuses in a slow node
+        with LocalRpcServer(batch=False) as server:
+            transport = AioHttpTransport(server.url)
+            iconservice = IconService(HTTPProvider(server.url))
+            did_service = DidService(iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS, transport=transport)
+            vc_service = VCService(iconservice, 2, LocalRpcServer.VC_SCORE_ADDRESS, transport=transport)
+            dids = await create_documents(did_service, 2)
+            server.latency = 0.2
+
+            # WHEN verify them in a scope of 0.3 seconds
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                with deadline_scope(0.3):
+                    await did_service.read_documents(dids)
+                    await vc_service.is_valid_many(["0x" + "00" * 32])
+
+            # THEN the verification stops at the deadline.
+            assert time.monotonic() - started < 0.4
+            await transport.close()
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import time
+
+import pytest
+from coincurve import PrivateKey
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.did_service import DidService
+from didsdk.document.document import Document
+from didsdk.document.document_cache import DocumentCache
+from didsdk.document.encoding import EncodeType
+from didsdk.document.publickey_property import PublicKeyProperty
+from didsdk.score.did_score import DidScore
+from tests.utils.icon_service_factory import IconServiceFactory
+
+
+def create_document_json(did: str, key_ids: list) -> str:
+    public_keys = [
+        PublicKeyProperty(
+            id=key_id,
+            type=[AlgorithmType.ES256K.value.identifier],
+            public_key=PrivateKey().public_key,
+            encode_type=EncodeType.BASE64,
+            created=1,
+        ).as_dict()
+        for key_id in key_ids
+    ]
+    return json.dumps(
+        {
+            "version": "1.0",
+            "id": did,
+            "created": 1,
+            "publicKey": public_keys,
+            "authentication": [{"publicKey": key_id} for key_id in key_ids],
+        }
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDocumentCache:
+    DID = "did:icon:02:d99d9fb27815cf698f52e72c5323f1ac51a422957341d819"
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    def test_get_or_load(self, clock):
+        # GIVEN an empty cache and a loader
+        cache = DocumentCache(max_size=10, ttl=60, stale_ttl=0, clock=clock)
+        loaded = []
+
+        def loader(did: str) -> Document:
+            loaded.append(did)
+            return Document.deserialize(create_document_json(did, ["key1"]))
+
+        # WHEN read the same document twice
+        first = cache.get_or_load(self.DID, loader)
+        second = cache.get_or_load(self.DID, loader)
+
+        # THEN the loader is called only once.
+        assert first is second
+        assert loaded == [self.DID]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_serve_stale_while_revalidate(self, clock):
+        # GIVEN an expired document in its stale period
+        cache = DocumentCache(max_size=10, ttl=60, stale_ttl=60, clock=clock)
+        old = cache.get_or_load(self.DID, lambda did: Document.deserialize(create_document_json(did, ["key1"])))
+        clock.now = 90
+
+        # WHEN read the document
+        new_document = Document.deserialize(create_document_json(self.DID, ["key1", "key2"]))
+        document = cache.get_or_load(self.DID, lambda did: new_document)
+
+        # THEN the stale document is returned and replaced in the background.
+        assert document is old
+        for _ in range(100):
+            if cache.get(self.DID) is new_document:
+                break
+            time.sleep(0.01)
+        assert cache.get(self.DID) is new_document
+
+    async def test_invalidate_during_revalidation(self, clock):
+        # GIVEN an expired document in its stale period, and a reload which is slower than an update
+        cache = DocumentCache(max_size=10, ttl=60, stale_ttl=60, clock=clock)
+        cache.put(Document.deserialize(create_document_json(self.DID, ["key1"])))
+        clock.now = 90
+        loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader(did: str) -> Document:
+            loading.set()
+            await release.wait()
+            return Document.deserialize(create_document_json(did, ["key1"]))
+
+        await cache.get_or_load_async(self.DID, slow_loader)
+        await loading.wait()
+
+        # WHEN the document is invalidated before the reload finishes
+        cache.invalidate(self.DID)
+        release.set()
+        await asyncio.gather(*cache._tasks)
+
+        # THEN the reloaded document is not put back.
+        assert self.DID not in cache
+        assert cache.get(self.DID) is None
+
+    async def test_invalidate_during_load(self, clock):
+        # GIVEN a read of a document not cached, which is slower than an update
+        cache = DocumentCache(max_size=10, ttl=60, clock=clock)
+        loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader(did: str) -> Document:
+            loading.set()
+            await release.wait()
+            return Document.deserialize(create_document_json(did, ["key1"]))
+
+        read = asyncio.create_task(cache.get_or_load_async(self.DID, slow_loader))
+        await loading.wait()
+
+        # WHEN the document is invalidated before the read finishes
+        cache.invalidate(self.DID)
+        release.set()
+        document = await read
+
+        # THEN the read returns the document, but does not cache it.
+        assert document.id == self.DID
+        assert self.DID not in cache
+
+        # WHEN read it again
+        cache.get_or_load(self.DID, lambda did: Document.deserialize(create_document_json(did, ["key1"])))
+
+        # THEN it's cached.
+        assert self.DID in cache
+        assert cache._loads == {}
+
+    def test_did_service_read_document(self, mocker):
+        # GIVEN a DidService with a document cache
+        did_service = DidService(
+            IconServiceFactory.create_local(),
+            network_id=2,
+            score_address="cx26484cf9cb42b6eebbf537fbfe6b7df3f86c5079",
+            document_cache=DocumentCache(),
+        )
+        get_did_document = mocker.patch.object(
+            DidScore, "get_did_document", return_value=create_document_json(self.DID, ["key1"])
+        )
+
+        # WHEN read the document and the public key of it
+        document = did_service.read_document(self.DID)
+        public_key = did_service.get_public_key(self.DID, "key1")
+
+        # THEN the blockchain is read only once.
+        assert document.get_public_key_property("key1").public_key == public_key
+        assert get_did_document.call_count == 1
+        assert did_service.document_cache.stats.hit_rate == 0.5
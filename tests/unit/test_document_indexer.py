@@ -0,0 +1,86 @@
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.did_key_holder import DidKeyHolder
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import ResolveException
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.sync.block_source import IconBlockSource, RecordedBlockSource
+from didsdk.sync.document_indexer import DocumentIndexer
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestDocumentIndexer:
+    @pytest.fixture
+    async def recorded(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService) -> dict:
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        wallet = KeyWallet.create()
+        dids, private_keys = [], []
+        for _ in range(2):
+            private_key = PrivateKey()
+            key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+            document = await did_service.create(wallet, DidScoreParameter.create(key_provider, EncodeType.BASE64))
+            dids.append(document.id)
+            private_keys.append(private_key)
+
+        key_holder = DidKeyHolder(did=dids[1], key_id="key1", type=AlgorithmType.ES256K, private_key=private_keys[1])
+        new_private_key = PrivateKey()
+        new_key_provider = KeyProvider("key2", AlgorithmType.ES256K, new_private_key.public_key, new_private_key)
+        jwt = DidScoreParameter.add_key(key_holder, new_key_provider, EncodeType.HEX)
+        await did_service.add_public_key(wallet, key_holder.sign(jwt))
+        await did_service.revoke_key(wallet, key_holder.sign(DidScoreParameter.revoke_key(key_holder, "key1")))
+
+        return {
+            "source": RecordedBlockSource.record(IconBlockSource(local_iconservice)),
+            "documents": {did: did_service.read_document(did) for did in dids},
+        }
+
+    def test_index_documents(self, recorded: dict):
+        # GIVEN an indexer of the recorded blocks
+        indexer = DocumentIndexer(recorded["source"], LocalRpcServer.DID_SCORE_ADDRESS)
+
+        # WHEN sync all blocks
+        indexer.sync()
+
+        # THEN the documents are the same as the documents read from the node.
+        assert len(indexer) == 2
+        assert indexer.lag == 0
+        for did, document in recorded["documents"].items():
+            indexed_document = indexer.read_document(did)
+            assert indexed_document.serialize() == document.serialize()
+        updated_did = list(recorded["documents"])[1]
+        assert indexer.read_document(updated_did).get_public_key_property("key1").is_revoked()
+        assert (
+            indexer.get_public_key(updated_did, "key2")
+            == recorded["documents"][updated_did].public_key["key2"].public_key
+        )
+
+        # WHEN read a document that does not exist
+        # THEN raise ResolveException.
+        with pytest.raises(ResolveException):
+            indexer.read_document("did:icon:02:unknown")
+        indexer.close()
+
+    def test_resume_from_checkpoint(self, recorded: dict, tmp_path):
+        # GIVEN an indexer that has synced some blocks into a file
+        path = str(tmp_path / "documents.db")
+        indexer = DocumentIndexer(recorded["source"], LocalRpcServer.DID_SCORE_ADDRESS, path=path)
+        indexer.sync(max_blocks=2)
+        assert indexer.checkpoint == 1
+        assert indexer.lag == recorded["source"].get_last_height() - 1
+        indexer.close()
+
+        # WHEN open the file again and sync
+        indexer = DocumentIndexer(recorded["source"], LocalRpcServer.DID_SCORE_ADDRESS, path=path)
+        assert indexer.checkpoint == 1
+        assert indexer.sync() == recorded["source"].get_last_height() - 1
+
+        # THEN the indexer resumes from the checkpoint.
+        for did, document in recorded["documents"].items():
+            assert indexer.read_document(did).serialize() == document.serialize()
+        indexer.close()
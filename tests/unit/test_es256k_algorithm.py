@@ -0,0 +1,38 @@
+import pytest
+from coincurve import PrivateKey, PublicKey
+
+from didsdk.core.es256k_algorithm import ES256KAlgorithm
+
+# The order of secp256k1
+CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+class TestES256KAlgorithm:
+    @pytest.fixture
+    def algorithm(self) -> ES256KAlgorithm:
+        return ES256KAlgorithm()
+
+    def test_verify(self, algorithm: ES256KAlgorithm, private_key: PrivateKey):
+        # GIVEN a signature of data
+        signature = algorithm.sign(private_key, b"data")
+
+        # THEN it's verified only with the key and the data.
+        assert algorithm.verify(private_key.public_key, b"data", signature)
+        assert not algorithm.verify(private_key.public_key, b"other data", signature)
+        assert not algorithm.verify(PrivateKey().public_key, b"data", signature)
+        assert not algorithm.verify(private_key.public_key, b"data", signature[:64])
+
+    def test_verify_higher_s(self, algorithm: ES256KAlgorithm, private_key: PrivateKey):
+        # GIVEN a signature in the higher-S form, which the recovery accepts
+        signature = algorithm.sign(private_key, b"data")
+        s = int.from_bytes(signature[32:64], "big")
+        signature = signature[:32] + (CURVE_ORDER - s).to_bytes(32, "big") + bytes([signature[64] ^ 1])
+        assert PublicKey.from_signature_and_message(signature, b"data") == private_key.public_key
+
+        # THEN it's verified with the key as well.
+        assert algorithm.verify(private_key.public_key, b"data", signature)
+
+    def test_recover_public_key(self, algorithm: ES256KAlgorithm, private_key: PrivateKey):
+        signature = algorithm.sign(private_key, b"data")
+        assert algorithm.recover_public_key(b"data", signature) == private_key.public_key
+        assert algorithm.recover_public_key(b"data", b"invalid") is None
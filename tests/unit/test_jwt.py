@@ -1,8 +1,11 @@
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
+from coincurve import PrivateKey
 
 from didsdk.document.encoding import Base64URLEncoder
+from didsdk.exceptions import JwtException
 from didsdk.jwt.elements import Payload
 from didsdk.jwt.jwt import Jwt, VerifyResult
 
@@ -21,6 +24,34 @@ class TestJwt:
         assert compact == jwt_from_encoded_token.compact()
         assert jwt_from_encoded_token.signature in Base64URLEncoder.add_padding(encoded_token.split(".")[2])
 
+    def test_lazy_decode(self, jwt_object, private_key):
+        # GIVEN a signed token
+        encoded_token = jwt_object.sign(private_key)
+
+        # WHEN decode it and read the kid and the signature
+        jwt = Jwt.decode(encoded_token)
+        kid = jwt.header.kid
+        signature = jwt.signature
+
+        # THEN the payload is not parsed until it's read.
+        assert kid == jwt_object.header.kid
+        assert signature == encoded_token.split(".")[2]
+        assert jwt._payload is None
+        assert jwt.payload.as_dict() == jwt_object.payload.as_dict()
+        assert jwt.encoded_token == encoded_token.split(".")
+        assert jwt.verify(private_key.public_key).success
+
+        # WHEN decode a token with a malformed payload
+        header, _, signature = encoded_token.split(".")
+        jwt = Jwt.decode(f"{header}.malformed.{signature}")
+
+        # THEN it raises when the payload is read.
+        assert jwt.header.kid == kid
+        with pytest.raises(ValueError):
+            _ = jwt.payload
+        with pytest.raises(JwtException):
+            Jwt.decode(f"{encoded_token}.{signature}")
+
     def test_verify(self, jwt_object, private_key):
         # GIVEN a Jwt object contains an encoded token
         encoded_token = jwt_object.sign(private_key)
@@ -51,3 +82,34 @@ class TestJwt:
         # the gap between now and expiration
         # and the result after verifying expiration.
         assert (jwt_object.payload.exp > now) == jwt_object.verify_expired().success
+
+    def test_verify_many(self, jwt_object, private_key):
+        # GIVEN tokens with a key, a key in bytes, a wrong key, and a malformed token
+        tokens = [Jwt(jwt_object.header, jwt_object.payload).sign(private_key) for _ in range(5)]
+        items = [
+            (tokens[0], private_key.public_key),
+            (Jwt.decode(tokens[1]), private_key.public_key.format()),
+            (tokens[2], PrivateKey().public_key),
+            ("malformed", private_key.public_key),
+            (tokens[4], private_key.public_key.format()),
+        ]
+
+        # WHEN verify them in chunks of 2 tokens
+        results = Jwt.verify_many(items, chunk_size=2)
+
+        # THEN the results are in the same order, and the malformed one fails without raising.
+        assert [result.success for result in results] == [True, True, False, False, True]
+        assert results[2].fail_message == "JWT signature does not match."
+
+    def test_verify_many_in_processes(self, jwt_object, private_key):
+        # GIVEN tokens signed by a key
+        tokens = [Jwt(jwt_object.header, jwt_object.payload).sign(private_key) for _ in range(4)]
+
+        # WHEN verify them in a process pool
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = Jwt.verify_many(
+                [(token, private_key.public_key) for token in tokens], executor=executor, chunk_size=2
+            )
+
+        # THEN the keys are sent as bytes, and the tokens are verified.
+        assert all(result.success for result in results)
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.did_key_holder import DidKeyHolder
+from didsdk.core.key_provider import KeyProvider
+from didsdk.credential import CredentialVersion
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import ResolveException
+from didsdk.jwt.jwt import Jwt
+from didsdk.protocol.claim_message_type import ClaimRequestType
+from didsdk.protocol.claim_request import ClaimRequest
+from didsdk.score.did_score_parameter import DidScoreParameter
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestKeyResolver:
+    @pytest.fixture
+    async def created(self, local_iconservice: IconService) -> dict:
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+        document = await did_service.create(
+            KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+        )
+        key_holder = DidKeyHolder(did=document.id, key_id="key1", type=AlgorithmType.ES256K, private_key=private_key)
+        return {"did_service": did_service, "key_holder": key_holder}
+
+    @staticmethod
+    def create_request(key_holder: DidKeyHolder) -> ClaimRequest:
+        request = ClaimRequest.from_(
+            type_=ClaimRequestType.REQ_CREDENTIAL,
+            did=key_holder.did,
+            algorithm=key_holder.type,
+            public_key_id=key_holder.key_id,
+            response_id=key_holder.did,
+            request_date=int(time.time()),
+            version=CredentialVersion.v1_0,
+        )
+        return ClaimRequest.from_jwt(Jwt.decode(key_holder.sign(request.jwt)))
+
+    async def test_verify_with_resolver(self, local_rpc_server: LocalRpcServer, created: dict):
+        # GIVEN signed requests and the key resolver of a DidService
+        did_service: DidService = created["did_service"]
+        requests = [self.create_request(created["key_holder"]) for _ in range(3)]
+        call_count = local_rpc_server.method_counts["icx_call"]
+
+        # WHEN verify them with only the resolver
+        results = [request.verify(resolver=did_service.key_resolver) for request in requests]
+
+        # THEN they are verified with a read of the document.
+        assert all(result.success for result in results)
+        assert local_rpc_server.method_counts["icx_call"] - call_count == 1
+        assert did_service.key_resolver.stats.hits == 2
+
+    async def test_revoked_key(self, created: dict):
+        # GIVEN a request signed with a key, and the key is revoked after that
+        did_service: DidService = created["did_service"]
+        key_holder: DidKeyHolder = created["key_holder"]
+        request = self.create_request(key_holder)
+        assert request.verify(resolver=did_service.key_resolver).success
+        new_private_key = PrivateKey()
+        new_key_provider = KeyProvider("key2", AlgorithmType.ES256K, new_private_key.public_key, new_private_key)
+        wallet = KeyWallet.create()
+        await did_service.add_public_key(
+            wallet, key_holder.sign(DidScoreParameter.add_key(key_holder, new_key_provider, EncodeType.BASE64))
+        )
+        await did_service.revoke_key(wallet, key_holder.sign(DidScoreParameter.revoke_key(key_holder, "key1")))
+
+        # WHEN verify the request again
+        result = request.verify(resolver=did_service.key_resolver)
+
+        # THEN it fails because the key is revoked.
+        assert not result.success
+        assert result.fail_message == f"{key_holder.kid} is revoked."
+
+    async def test_resolve(self, created: dict):
+        # GIVEN the key resolver of a DidService
+        did_service: DidService = created["did_service"]
+        key_holder: DidKeyHolder = created["key_holder"]
+
+        # WHEN resolve the kid asynchronously
+        public_key_property = await did_service.key_resolver.resolve_async(key_holder.kid)
+
+        # THEN the public key and its metadata are returned.
+        assert public_key_property.public_key == key_holder.private_key.public_key
+        assert public_key_property.created
+        assert not public_key_property.is_revoked()
+
+        # WHEN resolve an unknown key or a wrong kid
+        # THEN raise ResolveException.
+        with pytest.raises(ResolveException):
+            did_service.key_resolver.resolve(f"{key_holder.did}#unknown")
+        with pytest.raises(ResolveException):
+            did_service.key_resolver.resolve(key_holder.did)
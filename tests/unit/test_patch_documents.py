@@ -0,0 +1,78 @@
+import json
+
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.did_key_holder import DidKeyHolder
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.document import Document
+from didsdk.document.document_cache import DocumentCache
+from didsdk.document.encoding import EncodeType
+from didsdk.score.did_score_parameter import DidScoreParameter
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestPatchDocuments:
+    @staticmethod
+    def assert_same_document(document: Document, server: LocalRpcServer):
+        assert json.loads(document.serialize()) == server.documents[document.id]
+
+    async def test_patch_documents(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a DidService that patches documents in its document cache
+        did_service = DidService(
+            local_iconservice,
+            network_id=2,
+            score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+            document_cache=DocumentCache(),
+            patch_documents=True,
+        )
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+
+        # WHEN create a document, add a key to it and revoke the first key
+        document = await did_service.create(wallet, DidScoreParameter.create(key_provider, EncodeType.BASE64))
+        self.assert_same_document(document, local_rpc_server)
+
+        key_holder = DidKeyHolder(did=document.id, key_id="key1", type=AlgorithmType.ES256K, private_key=private_key)
+        new_private_key = PrivateKey()
+        new_key_provider = KeyProvider("key2", AlgorithmType.ES256K, new_private_key.public_key, new_private_key)
+        jwt = DidScoreParameter.add_key(key_holder, new_key_provider, EncodeType.HEX)
+        document = await did_service.add_public_key(wallet, key_holder.sign(jwt))
+        self.assert_same_document(document, local_rpc_server)
+
+        jwt = DidScoreParameter.revoke_key(key_holder, "key1")
+        document = await did_service.revoke_key(wallet, key_holder.sign(jwt))
+
+        # THEN the documents are the same as the ones in the blockchain without reading them,
+        # and the revoked key is removed from the authentication.
+        self.assert_same_document(document, local_rpc_server)
+        assert document.authentication == [{"publicKey": "key2"}]
+        assert did_service.document_cache.get(document.id) is document
+        assert local_rpc_server.method_counts["icx_call"] == 0
+
+    async def test_consistency_check(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService, mocker):
+        # GIVEN a DidService that checks the patched documents
+        did_service = DidService(
+            local_iconservice,
+            network_id=2,
+            score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+            patch_documents=True,
+            consistency_check=True,
+        )
+        warning = mocker.patch("didsdk.did_service.logger.warning")
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+
+        # WHEN create a document
+        document = await did_service.create(
+            KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+        )
+
+        # THEN the document is read from the blockchain, and it matches the patched one.
+        self.assert_same_document(document, local_rpc_server)
+        assert local_rpc_server.method_counts["icx_call"] == 1
+        warning.assert_not_called()
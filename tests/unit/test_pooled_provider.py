@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+
+from didsdk.did_service import DidService
+from didsdk.transport.pooled_provider import PooledHTTPProvider
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestPooledHTTPProvider:
+    @pytest.fixture
+    def servers(self):
+        with LocalRpcServer() as first, LocalRpcServer() as second:
+            yield first, second
+
+    def test_spread_reads(self, servers):
+        # GIVEN a DidService with a provider of two nodes that answer slowly
+        for server in servers:
+            server.latency = 0.05
+        provider = PooledHTTPProvider([server.url for server in servers])
+        did_service = DidService(IconService(provider), network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+
+        # WHEN read concurrently
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            versions = list(executor.map(lambda _: did_service.get_version(), range(20)))
+
+        # THEN both nodes answer.
+        assert versions == ["1.0.0"] * 20
+        assert all(server.method_counts["icx_call"] > 0 for server in servers)
+        assert sum(stats["requests"] for stats in provider.node_stats()) == 20
+        provider.close()
+
+    def test_hedged_read(self, servers):
+        # GIVEN a provider that has learned the latencies of a fast node and a slower node
+        fast, slow = servers
+        slow.latency = 0.02
+        provider = PooledHTTPProvider([fast.url, slow.url])
+        iconservice = IconService(provider)
+        for _ in range(PooledHTTPProvider.MIN_SAMPLES_FOR_HEDGE * 2):
+            iconservice.get_block("latest")
+
+        hedges = provider.node_stats()[1]["hedges"]
+
+        # WHEN the fast node stalls
+        fast.latency = 1.0
+        started = time.monotonic()
+        block = iconservice.get_block("latest")
+        elapsed = time.monotonic() - started
+
+        # THEN the hedged request to the other node answers first.
+        assert block["height"] == 0
+        assert elapsed < 0.5
+        assert provider.node_stats()[1]["hedges"] - hedges == 1
+        provider.close()
+
+    def test_failover(self, servers):
+        # GIVEN a provider of a node that is down and a node that is up
+        down, up = servers
+        urls = [down.url, up.url]
+        down.stop()
+        provider = PooledHTTPProvider(urls)
+        iconservice = IconService(provider)
+
+        # WHEN read twice
+        blocks = [iconservice.get_block("latest") for _ in range(2)]
+
+        # THEN the node that is up answers, and the failed node is skipped after the error.
+        assert [block["height"] for block in blocks] == [0, 0]
+        assert [stats["errors"] for stats in provider.node_stats()] == [1, 0]
+        assert up.method_counts["icx_getLastBlock"] == 2
+        provider.close()
+
+    def test_score_error(self, servers):
+        # GIVEN a provider
+        provider = PooledHTTPProvider([server.url for server in servers])
+        did_service = DidService(IconService(provider), network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+
+        # WHEN read an unknown document
+        # THEN raise the error of the node without trying another node.
+        with pytest.raises(JSONRPCException):
+            did_service.read_document("did:icon:02:" + "00" * 24)
+        assert sum(server.method_counts["icx_call"] for server in servers) == 1
+        provider.close()
@@ -1,9 +1,19 @@
 import time
 
 import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
 
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
 from didsdk.credential import Credential, CredentialVersion
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import JwtException
 from didsdk.presentation import Presentation
+from didsdk.score.did_score_parameter import DidScoreParameter
+from tests.utils.local_rpc_server import LocalRpcServer
 
 
 class TestPresentation:
@@ -118,6 +128,90 @@ class TestPresentation:
         assert presentation.jti == payload.jti
         assert presentation.version == payload.version
 
+    async def test_verify_credentials(self, local_iconservice: IconService, dids, vc_claim_for_v1):
+        # GIVEN an issuer DID in the node, and a presentation of 3 credentials of which one is signed by another key
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+        document = await did_service.create(
+            KeyWallet.create(), DidScoreParameter.create(key_provider, EncodeType.BASE64)
+        )
+        credential = Credential(
+            algorithm=AlgorithmType.ES256K.name,
+            key_id="key1",
+            did=document.id,
+            target_did=dids["target_did"],
+            version=CredentialVersion.v1_0,
+            claim=vc_claim_for_v1,
+        )
+        issued = int(time.time())
+        presentation = Presentation(
+            algorithm=AlgorithmType.ES256K.name, key_id="key1", did=dids["target_did"], version=CredentialVersion.v1_0
+        )
+        for signer in [private_key, PrivateKey(), private_key]:
+            presentation.add_credential(credential.as_jwt(issued, issued + 60).sign(signer))
+
+        # WHEN verify the credentials with the key resolver of the DidService
+        results = presentation.verify_credentials(did_service.key_resolver)
+
+        # THEN only the one signed by another key fails.
+        assert [result.success for result in results] == [True, False, True]
+
+        # WHEN the holder signs the presentation, and a verifier verifies it with the credentials
+        holder_key = PrivateKey()
+        signed = Presentation.from_encoded_jwt(presentation.as_jwt(issued, issued + 60).sign(holder_key))
+        result = signed.verify(holder_key.public_key, resolver=did_service.key_resolver)
+
+        # THEN the credentials are verified in the batch with the presentation, and the forged one fails it.
+        assert not result.success
+        assert result.fail_message == "credential[1]: JWT signature does not match."
+        assert not signed.verify(PrivateKey().public_key, resolver=did_service.key_resolver).success
+
+        # WHEN the holder presents only the credentials of the issuer
+        presentation = Presentation(
+            algorithm=AlgorithmType.ES256K.name, key_id="key1", did=dids["target_did"], version=CredentialVersion.v1_0
+        )
+        presentation.add_credential(credential.as_jwt(issued, issued + 60).sign(private_key))
+        signed = Presentation.from_encoded_jwt(presentation.as_jwt(issued, issued + 60).sign(holder_key))
+
+        # THEN the presentation is verified.
+        assert signed.verify(holder_key.public_key, resolver=did_service.key_resolver).success
+
+    async def test_verify_requires_resolver(self, local_iconservice: IconService, dids, vc_claim_for_v1):
+        # GIVEN a signed presentation of a credential forged by a random key, for an issuer not in the node
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        credential = Credential(
+            algorithm=AlgorithmType.ES256K.name,
+            key_id="key1",
+            did=dids["did"],
+            target_did=dids["target_did"],
+            version=CredentialVersion.v1_0,
+            claim=vc_claim_for_v1,
+        )
+        issued = int(time.time())
+        presentation = Presentation(
+            algorithm=AlgorithmType.ES256K.name, key_id="key1", did=dids["target_did"], version=CredentialVersion.v1_0
+        )
+        presentation.add_credential(credential.as_jwt(issued, issued + 60).sign(PrivateKey()))
+        holder_key = PrivateKey()
+        signed = Presentation.from_encoded_jwt(presentation.as_jwt(issued, issued + 60).sign(holder_key))
+
+        # WHEN verify it without a key resolver
+        # THEN raise JwtException instead of checking only the expirations.
+        with pytest.raises(JwtException):
+            signed.verify()
+        with pytest.raises(JwtException):
+            signed.verify(holder_key.public_key)
+        with pytest.raises(JwtException):
+            signed.verify_credentials(None)
+
+        # WHEN verify it with a key resolver which can't resolve the issuer
+        result = signed.verify(holder_key.public_key, resolver=did_service.key_resolver)
+
+        # THEN the credential fails.
+        assert not result.success
+        assert result.fail_message.startswith("credential[0]: ")
+
     # TODO After knowing it's usage of the method `get_plain_params`.
     def test_get_plain_params(self):
         pass
@@ -0,0 +1,86 @@
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.exceptions import VCException
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestRegisterBulk:
+    async def test_register_bulk(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN credentials of which one is already registered
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 60)
+        await vc_service.register(wallet, credentials[25], private_key)
+
+        # WHEN register them with the step limit that allows about 15 credentials in a transaction
+        results = await vc_service.register_bulk(wallet, credentials, private_key, window=4, step_limit=300_000)
+
+        # THEN only the registered one fails, and the others are registered in chunks.
+        assert [result.credential for result in results] == credentials
+        assert isinstance(results[25].error, VCException)
+        assert all(result.success for index, result in enumerate(results) if index != 25)
+        assert len(local_rpc_server.credentials) == 60
+        assert len({result.tx_hash for result in results if result.success}) < 15
+
+    async def test_step_cost_is_measured(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService that has registered credentials in bulk
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        await vc_service.register_bulk(wallet, CredentialFactory.create_list(private_key, 20), private_key)
+        sent_count = local_rpc_server.method_counts["icx_sendTransaction"]
+
+        # WHEN register a lot of credentials with the default step limit
+        credentials = CredentialFactory.create_list(private_key, 100)
+        results = await vc_service.register_bulk(wallet, credentials, private_key)
+
+        # THEN they are registered in a transaction.
+        assert all(result.success for result in results)
+        assert local_rpc_server.method_counts["icx_sendTransaction"] - sent_count == 1
+
+    async def test_invalid_credential(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN credentials with an invalid one
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 3)
+        credentials[1] = "invalid credential"
+
+        # WHEN register them
+        results = await vc_service.register_bulk(KeyWallet.create(), credentials, private_key)
+
+        # THEN the invalid one fails before sending a transaction.
+        assert results[1].error
+        assert results[1].tx_hash is None
+        assert results[0].success and results[2].success
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 1
+
+    async def test_transport_error(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService whose connection is reset at the second transaction
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        send_transaction = vc_service._transport.send_transaction
+        sent = []
+
+        async def reset_second(signed_tx):
+            sent.append(signed_tx)
+            if len(sent) == 2:
+                raise ConnectionResetError("reset by peer")
+            return await send_transaction(signed_tx)
+
+        vc_service._transport.send_transaction = reset_second
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 60)
+
+        # WHEN register them in chunks
+        results = await vc_service.register_bulk(
+            KeyWallet.create(), credentials, private_key, window=1, step_limit=300_000
+        )
+
+        # THEN only the credentials of the failed chunk get the error, and the other chunks are registered.
+        failed = [result for result in results if not result.success]
+        assert failed and all(isinstance(result.error, ConnectionResetError) for result in failed)
+        assert len(local_rpc_server.credentials) == 60 - len(failed)
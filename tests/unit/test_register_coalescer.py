@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk import settings
+from didsdk.exceptions import VCException
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestRegisterCoalescer:
+    @pytest.fixture
+    def vc_service(self, local_iconservice: IconService) -> VCService:
+        return VCService(
+            local_iconservice,
+            network_id=2,
+            score_address=LocalRpcServer.VC_SCORE_ADDRESS,
+            coalesce_registrations=True,
+        )
+
+    async def test_concurrent_registrations(self, local_rpc_server: LocalRpcServer, vc_service: VCService):
+        # GIVEN credentials to register concurrently
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 30)
+
+        # WHEN register each of them
+        tx_results = await asyncio.gather(
+            *[vc_service.register(wallet, credential, private_key) for credential in credentials]
+        )
+
+        # THEN they are registered in a transaction.
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 1
+        assert len({tx_result["txHash"] for tx_result in tx_results}) == 1
+        assert len(local_rpc_server.credentials) == 30
+        assert vc_service.register_coalescer.pending_count == 0
+
+    async def test_max_batch(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService, monkeypatch):
+        # GIVEN a VCService that coalesces at most 10 registrations
+        monkeypatch.setattr(settings, "DIDSDK_REGISTER_COALESCE_MAX_BATCH", 10)
+        vc_service = VCService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS, coalesce_registrations=True
+        )
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 25)
+
+        # WHEN register 25 credentials concurrently
+        await asyncio.gather(*[vc_service.register(wallet, credential, private_key) for credential in credentials])
+
+        # THEN they are sent in 3 transactions.
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 3
+        assert len(local_rpc_server.credentials) == 25
+
+    async def test_failed_batch(self, local_rpc_server: LocalRpcServer, vc_service: VCService):
+        # GIVEN credentials of which one is already registered
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 5)
+        await vc_service.register(wallet, credentials[2], private_key)
+
+        # WHEN register them concurrently
+        tx_results = await asyncio.gather(
+            *[vc_service.register(wallet, credential, private_key) for credential in credentials],
+            return_exceptions=True,
+        )
+
+        # THEN only the caller of the registered one gets the error.
+        assert isinstance(tx_results[2], VCException)
+        assert all(tx_result["status"] == 1 for index, tx_result in enumerate(tx_results) if index != 2)
+        assert len(local_rpc_server.credentials) == 5
+
+    async def test_different_wallets(self, local_rpc_server: LocalRpcServer, vc_service: VCService):
+        # GIVEN two wallets
+        wallets = [KeyWallet.create(), KeyWallet.create()]
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 6)
+
+        # WHEN register credentials with them concurrently
+        tx_results = await asyncio.gather(
+            *[
+                vc_service.register(wallets[index % 2], credential, private_key)
+                for index, credential in enumerate(credentials)
+            ]
+        )
+
+        # THEN the registrations of a wallet are sent in a transaction.
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 2
+        assert all(
+            tx_result["eventLogs"][0]["indexed"][1] == wallets[index % 2].get_address()
+            for index, tx_result in enumerate(tx_results)
+        )
+
+    async def test_unconfirmed_batch(self, local_rpc_server: LocalRpcServer, vc_service: VCService, monkeypatch):
+        # GIVEN a transaction result which is not confirmed in time
+        async def wait(tx_hash: str, timeout: float = None) -> dict:
+            raise asyncio.TimeoutError()
+
+        monkeypatch.setattr(vc_service._tracker, "wait", wait)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 5)
+
+        # WHEN register them concurrently
+        tx_results = await asyncio.gather(
+            *[vc_service.register(wallet, credential, private_key) for credential in credentials],
+            return_exceptions=True,
+        )
+
+        # THEN every caller gets the timeout, and the credentials are not sent again one by one.
+        assert all(isinstance(tx_result, asyncio.TimeoutError) for tx_result in tx_results)
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 1
+        assert len(local_rpc_server.credentials) == 5
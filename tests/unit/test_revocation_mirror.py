@@ -0,0 +1,116 @@
+import time
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.cache.bloom_filter import BloomFilter
+from didsdk.jwt.jwt import Jwt
+from didsdk.sync.block_source import IconBlockSource, RecordedBlockSource
+from didsdk.sync.revocation_mirror import RevocationMirror
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestRevocationMirror:
+    REVOKED_ISSUER_DID = "did:icon:02:" + "2b" * 24
+
+    @pytest.fixture
+    async def recorded(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService, tmp_path) -> dict:
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 4)
+        revoked_issuer_credential = CredentialFactory.create(private_key, self.REVOKED_ISSUER_DID)
+        await vc_service.register_list(wallet, credentials, private_key)
+        await vc_service.register(wallet, revoked_issuer_credential, private_key)
+        await vc_service.revoke(wallet, credentials[0], CredentialFactory.ISSUER_DID, private_key)
+        await vc_service.revoke_did(wallet, revoked_issuer_credential, self.REVOKED_ISSUER_DID, private_key)
+        # a failed transaction is not applied.
+        with pytest.raises(Exception):
+            await vc_service.revoke(wallet, CredentialFactory.create(private_key), "did:icon:02:unknown", private_key)
+
+        path = tmp_path / "blocks.json"
+        RecordedBlockSource.record(IconBlockSource(local_iconservice)).dump(str(path))
+        return {
+            "source": RecordedBlockSource.load(str(path)),
+            "sigs": [Jwt.decode(credential).signature for credential in credentials],
+            "revoked_issuer_sig": Jwt.decode(revoked_issuer_credential).signature,
+        }
+
+    @pytest.mark.parametrize("bloom_capacity", [None, 1000])
+    def test_is_revoked(self, recorded: dict, bloom_capacity: int):
+        # GIVEN a mirror of the recorded blocks
+        recorded_source: RecordedBlockSource = recorded["source"]
+        mirror = RevocationMirror(recorded_source, LocalRpcServer.VC_SCORE_ADDRESS, bloom_capacity=bloom_capacity)
+
+        # WHEN sync all blocks
+        count = mirror.sync()
+
+        # THEN the revoked VCs and DIDs are in the mirror.
+        sigs = recorded["sigs"]
+        assert count == recorded_source.get_last_height() + 1
+        assert mirror.lag == 0
+        assert mirror.registered_count == 5
+        assert mirror.revoked_count == 1
+        assert mirror.is_revoked(sigs[0])
+        assert not any(mirror.is_revoked(sig, CredentialFactory.ISSUER_DID) for sig in sigs[1:])
+        revoked_issuer_sig = recorded["revoked_issuer_sig"]
+        assert not mirror.is_revoked(revoked_issuer_sig)
+        assert mirror.is_revoked(revoked_issuer_sig, self.REVOKED_ISSUER_DID)
+        assert mirror.is_did_revoked(self.REVOKED_ISSUER_DID)
+
+    def test_lag_and_checkpoint(self, recorded: dict):
+        # GIVEN a mirror that starts from the block of the first revocation
+        recorded_source: RecordedBlockSource = recorded["source"]
+        last_height = recorded_source.get_last_height()
+        mirror = RevocationMirror(recorded_source, LocalRpcServer.VC_SCORE_ADDRESS, start_height=last_height - 2)
+        assert mirror.lag is None and mirror.lag_seconds is None
+
+        # WHEN sync a block
+        assert mirror.sync(max_blocks=1) == 1
+
+        # THEN the mirror reports the lag.
+        assert mirror.checkpoint == last_height - 2
+        assert mirror.lag == 2
+        assert 0 <= mirror.lag_seconds < 60
+        assert mirror.registered_count == 0
+
+        # WHEN sync the rest
+        mirror.sync()
+
+        # THEN the mirror catches up from the checkpoint.
+        assert mirror.checkpoint == last_height
+        assert mirror.lag == 0
+        assert mirror.is_did_revoked(self.REVOKED_ISSUER_DID)
+
+    def test_follow_node(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a mirror that follows a node in the background
+        mirror = RevocationMirror(IconBlockSource(local_iconservice), LocalRpcServer.VC_SCORE_ADDRESS)
+        mirror.start(interval=0.01)
+        try:
+            deadline = time.monotonic() + 5
+            while mirror.lag != 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # THEN the mirror catches up with the node.
+            assert mirror.checkpoint == len(local_rpc_server.blocks) - 1
+        finally:
+            mirror.stop()
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        # GIVEN a Bloom filter with items
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"item-{index}" for index in range(1000)]
+        for item in items:
+            bloom_filter.add(item)
+
+        # THEN every added item is in the filter, and most of the others are not.
+        assert all(item in bloom_filter for item in items)
+        false_positives = sum(f"other-{index}" in bloom_filter for index in range(10000))
+        assert false_positives < 300
+        assert len(bloom_filter) == 1000
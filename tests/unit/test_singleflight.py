@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from didsdk.cache.singleflight import SingleFlight
+from didsdk.did_service import DidService
+from didsdk.document.document_cache import DocumentCache
+from didsdk.score.did_score import DidScore
+from tests.unit.test_document_cache import create_document_json
+from tests.utils.icon_service_factory import IconServiceFactory
+
+
+class TestSingleFlight:
+    DID = "did:icon:02:" + "ab" * 24
+
+    @pytest.fixture
+    def did_service(self) -> DidService:
+        return DidService(
+            IconServiceFactory.create_local(),
+            network_id=2,
+            score_address="cx26484cf9cb42b6eebbf537fbfe6b7df3f86c5079",
+        )
+
+    def test_do(self):
+        # GIVEN a SingleFlight and a slow function
+        flight = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(threading.get_ident())
+            time.sleep(0.1)
+            return object()
+
+        # WHEN call it with the same key from threads at once
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: flight.do("key", load), range(8)))
+
+        # THEN the function is called once and every caller gets its value.
+        assert len(calls) == 1
+        assert all(value is values[0] for value in values)
+        assert flight.shared_count == 7
+        assert len(flight) == 0
+
+    def test_do_error(self):
+        # GIVEN a SingleFlight and a slow function that fails
+        flight = SingleFlight()
+
+        def load():
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        # WHEN call it with the same key from threads at once
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, "key", load) for _ in range(4)]
+
+        # THEN every caller gets the error, and the next call starts a new one.
+        assert all(isinstance(future.exception(), ValueError) for future in futures)
+        assert flight.do("key", lambda: 1) == 1
+
+    async def test_do_async(self):
+        # GIVEN a SingleFlight and a slow coroutine function
+        flight = SingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return object()
+
+        # WHEN await it with the same key from tasks at once, and cancel one of them
+        tasks = [asyncio.create_task(flight.do_async("key", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # THEN the call is not cancelled, and the others get its value.
+        assert len(calls) == 1
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert all(result is results[1] for result in results[1:])
+        assert len(flight) == 0
+
+    async def test_forget(self):
+        # GIVEN a call in flight
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.do_async("key", lambda: asyncio.sleep(0.05, result="old")))
+        await asyncio.sleep(0)
+
+        # WHEN forget the key and call again
+        flight.forget("key")
+        second = await flight.do_async("key", lambda: asyncio.sleep(0, result="new"))
+
+        # THEN the new caller does not wait for the old call.
+        assert second == "new"
+        assert await first == "old"
+
+    def test_read_document(self, did_service: DidService, mocker):
+        # GIVEN a DidService and a slow blockchain
+        def get_did_document(did: str) -> str:
+            time.sleep(0.1)
+            return create_document_json(did, ["key1"])
+
+        get_did_document = mocker.patch.object(DidScore, "get_did_document", side_effect=get_did_document)
+
+        # WHEN read the document and the public key in it from threads at once
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            documents = [executor.submit(did_service.read_document, self.DID) for _ in range(3)]
+            public_keys = [executor.submit(did_service.get_public_key, self.DID, "key1") for _ in range(3)]
+
+        # THEN the blockchain is read only once.
+        assert get_did_document.call_count == 1
+        assert all(future.result() is documents[0].result() for future in documents)
+        assert all(future.result() == public_keys[0].result() for future in public_keys)
+
+    async def test_read_document_async(self, mocker):
+        # GIVEN a DidService with a document cache that has expired, and a slow blockchain
+        did_service = DidService(
+            IconServiceFactory.create_local(),
+            network_id=2,
+            score_address="cx26484cf9cb42b6eebbf537fbfe6b7df3f86c5079",
+            document_cache=DocumentCache(ttl=0, stale_ttl=0),
+        )
+
+        async def get_did_document_async(did: str) -> str:
+            await asyncio.sleep(0.05)
+            return create_document_json(did, ["key1"])
+
+        get_did_document_async = mocker.patch.object(
+            DidScore, "get_did_document_async", side_effect=get_did_document_async
+        )
+
+        # WHEN read the document from tasks at once
+        documents = await asyncio.gather(*[did_service.read_document_async(self.DID) for _ in range(10)])
+
+        # THEN the blockchain is read only once.
+        assert get_did_document_async.call_count == 1
+        assert all(document is documents[0] for document in documents)
+        assert did_service.read_flight.shared_count == 9
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from iconsdk.icon_service import IconService
+
+from didsdk.did_service import DidService
+from didsdk.document.document_cache import DocumentCache
+from didsdk.score.did_score import DidScore
+from didsdk.score.snapshot import pinned_height, snapshot
+from didsdk.vc_service import VCService
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestSnapshot:
+    DID = "did:icon:02:" + "1a" * 24
+    SIG = "ab" * 32
+
+    def test_pinned_read(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a DidScore
+        did_score = DidScore(local_iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS)
+
+        # WHEN read the version at a height twice, and at the latest state
+        versions = [did_score.get_version(height=5) for _ in range(2)]
+        did_score.get_version()
+
+        # THEN the read at the height is sent once and cached.
+        assert versions == ["1.0.0", "1.0.0"]
+        assert local_rpc_server.call_heights == ["0x5", None]
+        assert len(did_score.pinned_cache) == 1
+
+    async def test_snapshot(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService with a status cache
+        vc_service = VCService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS, status_cache_ttl=60
+        )
+
+        # WHEN check a status in a snapshot twice
+        with snapshot(7):
+            statuses = [vc_service.is_valid(self.SIG), await vc_service.is_valid_async(self.SIG)]
+        assert pinned_height() is None
+
+        # THEN both are pinned to the height, and they are read once.
+        assert statuses == ["0x0", "0x0"]
+        assert local_rpc_server.call_heights == ["0x7"]
+
+    async def test_concurrent_snapshots(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a DidScore
+        did_score = DidScore(local_iconservice, 2, LocalRpcServer.DID_SCORE_ADDRESS)
+
+        async def read_version(height: int):
+            with snapshot(height):
+                await asyncio.sleep(0.01)
+                return await did_score.get_version_async()
+
+        # WHEN tasks read in their own snapshots at once
+        await asyncio.gather(*[read_version(height) for height in range(1, 4)])
+
+        # THEN each task reads at its height.
+        assert sorted(local_rpc_server.call_heights) == ["0x1", "0x2", "0x3"]
+
+    def test_snapshot_bypasses_document_cache(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a DidService with a cached document
+        did_service = DidService(
+            local_iconservice,
+            network_id=2,
+            score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+            document_cache=DocumentCache(),
+        )
+        local_rpc_server.documents[self.DID] = {
+            "version": "1.0",
+            "id": self.DID,
+            "created": 1,
+            "publicKey": [],
+            "authentication": [],
+        }
+        did_service.read_document(self.DID)
+
+        # WHEN read the document in a snapshot
+        with snapshot(1):
+            did_service.read_document(self.DID)
+
+        # THEN the document is read at the height instead of the cache.
+        assert local_rpc_server.call_heights == [None, "0x1"]
+
+        # WHEN pin to an invalid height
+        # THEN raise ValueError.
+        with pytest.raises(ValueError):
+            with snapshot(-1):
+                pass
@@ -0,0 +1,71 @@
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.score.step_estimator import StepEstimator, is_out_of_step
+from didsdk.score.vc_score import VCScore
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestStepEstimator:
+    def test_step_limit(self):
+        # GIVEN an estimator without samples
+        estimator = StepEstimator(margin=1.5, bucket_bytes=100)
+        assert estimator.step_limit("registerList", 150) is None
+
+        # WHEN a transaction of 100 bytes used 1,000 steps
+        estimator.record("registerList", 100, 1_000)
+
+        # THEN the limit of a bucket is proportional to its top with the margin, and it's cached.
+        assert estimator.step_limit("registerList", 150) == 3_000
+        assert estimator.step_limit("registerList", 50) == 1_500
+        assert estimator.metrics()["cached_limits"] == 2
+
+        # WHEN a transaction of 300 bytes used 2,000 steps
+        estimator.record("registerList", 300, 2_000)
+
+        # THEN the limits follow the line through the samples.
+        assert estimator.metrics()["cached_limits"] == 0
+        assert estimator.estimate("registerList", 500) == 3_000
+        assert estimator.step_limit("registerList", 150) == 2_250
+
+    def test_is_out_of_step(self):
+        assert is_out_of_step({"status": 0, "failure": {"code": 0xA, "message": "OutOfStep"}})
+        assert is_out_of_step({"status": 0, "failure": {"code": "0x20", "message": "Out of step"}})
+        assert not is_out_of_step({"status": 0, "failure": {"code": "0x20", "message": "Reverted"}})
+        assert not is_out_of_step({"status": 1})
+
+    async def test_estimated_limit(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService which has registered a VC
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 2)
+        await vc_service.register(wallet, credentials[0], private_key)
+
+        # WHEN build the next registration
+        transaction = vc_service._vc_score.register(wallet.get_address(), credentials[1], private_key)
+
+        # THEN its step limit is estimated instead of the default one.
+        assert transaction.step_limit < VCScore.DEFAULT_STEP_LIMIT
+        assert vc_service.step_estimator.metrics()["methods"] == ["register"]
+
+    async def test_retry_out_of_step(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService whose estimator gives a half of the steps needed
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        vc_service._vc_score._step_estimator = StepEstimator(margin=0.5)
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 2)
+        await vc_service.register(wallet, credentials[0], private_key)
+
+        # WHEN register a VC
+        tx_result = await vc_service.register(wallet, credentials[1], private_key)
+
+        # THEN the transaction runs out of steps, and is sent again with the doubled limit.
+        assert tx_result["status"] == 1
+        assert vc_service.step_estimator.metrics()["retries"] == 1
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 3
+        assert len(local_rpc_server.credentials) == 2
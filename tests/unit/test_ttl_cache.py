@@ -0,0 +1,73 @@
+import pytest
+
+from didsdk.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    def test_get_and_expire(self, clock):
+        # GIVEN a cache with a ttl of 10 seconds
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+        cache.put("a", 1)
+
+        # WHEN the ttl passes
+        # THEN the entry is only served before it expires
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_stale_entry(self, clock):
+        # GIVEN a cache that keeps expired entries for 5 seconds
+        cache = TTLCache(ttl=10, stale_ttl=5, clock=clock)
+        cache.put("a", 1)
+
+        # WHEN the entry is expired but still in the stale period
+        clock.now = 12
+        entry = cache.lookup("a")
+
+        # THEN it is returned as a stale entry until the stale period ends.
+        assert entry.value == 1
+        assert not entry.is_fresh(clock.now)
+        assert cache.get("a") is None
+        clock.now = 15
+        assert cache.lookup("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        # GIVEN a full cache
+        cache = TTLCache(max_size=2, ttl=None, clock=clock)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # WHEN the oldest entry is used and a new entry is added
+        cache.get("a")
+        cache.put("c", 3)
+
+        # THEN the least recently used entry is evicted.
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_invalidate(self, clock):
+        cache = TTLCache(ttl=None, clock=clock)
+        cache.put(("did", 1), "x")
+        cache.put(("did", 2), "y")
+        cache.put(("other", 1), "z")
+
+        assert cache.invalidate(("did", 1))
+        assert cache.invalidate_if(lambda key, value: key[0] == "did") == 1
+        assert len(cache) == 1
@@ -0,0 +1,214 @@
+import asyncio
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.providers.http_provider import HTTPProvider
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.exceptions import TransactionException
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.transport.async_transport import (
+    AioHttpTransport,
+    AsyncTransport,
+    ExecutorTransport,
+)
+from didsdk.transport.tx_tracker import ConfirmationMode, TransactionTracker
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class PendingTransport(AsyncTransport):
+    def __init__(self):
+        self.count = 0
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        self.count += 1
+        raise JSONRPCException("Pending transaction", -31003)
+
+
+class ConfirmingTransport(AsyncTransport):
+    def __init__(self, confirm_after: int):
+        self.count = 0
+        self.confirm_after = confirm_after
+
+    async def get_transaction_result(self, tx_hash: str) -> dict:
+        self.count += 1
+        if self.count < self.confirm_after:
+            raise JSONRPCException("Pending transaction", -31003)
+        return {"txHash": tx_hash, "status": 1}
+
+
+class TestTransactionTracker:
+    @pytest.fixture
+    def public_key_param(self) -> str:
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+        return DidScoreParameter.create(key_provider, EncodeType.BASE64)
+
+    async def test_confirm_many_transactions(self, local_iconservice: IconService, public_key_param):
+        # GIVEN a node that confirms a transaction after 0.2 seconds and a shared tracker
+        with LocalRpcServer(confirm_delay=0.2) as server:
+            transport = AioHttpTransport(server.url)
+            tracker = TransactionTracker(transport, interval=0.05, max_interval=0.2, max_retries=20)
+            did_service = DidService(
+                local_iconservice,
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                tracker=tracker,
+            )
+
+            # WHEN create DID documents concurrently
+            count = 30
+            documents = await asyncio.gather(
+                *[did_service.create(KeyWallet.create(), public_key_param) for _ in range(count)]
+            )
+
+            # THEN all of them are confirmed and the latencies are reported.
+            assert len({document.id for document in documents}) == count
+            assert tracker.pending_count == 0
+            percentiles = tracker.latency_percentiles()
+            assert set(percentiles) == {50, 90, 99}
+            assert server.confirm_delay <= percentiles[50] <= percentiles[90] <= percentiles[99]
+            await transport.close()
+
+    async def test_first_poll_is_delayed_by_median_latency(self, local_iconservice: IconService, public_key_param):
+        # GIVEN a tracker that has observed enough confirmations
+        with LocalRpcServer(confirm_delay=0.2) as server:
+            transport = AioHttpTransport(server.url)
+            tracker = TransactionTracker(transport, interval=0.05, max_interval=0.2, max_retries=20)
+            did_service = DidService(
+                local_iconservice,
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                tracker=tracker,
+            )
+            for _ in range(TransactionTracker.MIN_SAMPLES_FOR_ADAPTIVE_DELAY):
+                await did_service.create(KeyWallet.create(), public_key_param)
+            polls = server.method_counts["icx_getTransactionResult"]
+
+            # WHEN create another DID document
+            await did_service.create(KeyWallet.create(), public_key_param)
+
+            # THEN the transaction is polled once or twice, not from the moment it was sent.
+            assert server.method_counts["icx_getTransactionResult"] - polls <= 2
+            await transport.close()
+
+    async def test_retries_run_out(self):
+        # GIVEN a transaction that is never confirmed
+        transport = PendingTransport()
+        tracker = TransactionTracker(transport, interval=0.01, max_retries=3)
+
+        # WHEN wait for the transaction
+        # THEN raise TransactionException after polling `max_retries` times.
+        with pytest.raises(TransactionException):
+            await tracker.wait("0x" + "00" * 32)
+        assert transport.count == 3
+        assert tracker.pending_count == 0
+
+    async def test_waiter_timeout_does_not_stop_others(self):
+        # GIVEN a transaction confirmed at the 5th poll, and two waiters of which one gives up in 50 milliseconds
+        tracker = TransactionTracker(ConfirmingTransport(confirm_after=5), interval=0.02, max_retries=10)
+        tx_hash = "0x" + "00" * 32
+        patient = asyncio.create_task(tracker.wait(tx_hash))
+        await asyncio.sleep(0)
+
+        # WHEN the second waiter times out
+        with pytest.raises(asyncio.TimeoutError):
+            await tracker.wait(tx_hash, timeout=0.05)
+
+        # THEN the first one still gets the result.
+        assert tracker.pending_count == 1
+        assert (await patient)["status"] == 1
+        assert tracker.pending_count == 0
+
+    async def test_timeout_in_milliseconds(self, local_iconservice: IconService, public_key_param):
+        # GIVEN a DidService with 300 milliseconds timeout and a slow node
+        with LocalRpcServer(confirm_delay=5) as server:
+            transport = AioHttpTransport(server.url)
+            did_service = DidService(
+                local_iconservice,
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                timeout=300,
+                transport=transport,
+            )
+
+            # WHEN create a DID document
+            # THEN raise TimeoutError before the transaction is confirmed.
+            with pytest.raises(asyncio.TimeoutError):
+                await did_service.create(KeyWallet.create(), public_key_param)
+            await transport.close()
+
+    @pytest.mark.parametrize("transport_type", ["executor", "aiohttp"])
+    async def test_long_poll(self, transport_type: str, public_key_param):
+        # GIVEN a node that confirms a transaction after 0.3 seconds and a DidService in long-poll mode
+        with LocalRpcServer(confirm_delay=0.3) as server:
+            iconservice = IconService(HTTPProvider(server.url))
+            transport = ExecutorTransport(iconservice) if transport_type == "executor" else AioHttpTransport(server.url)
+            tracker = TransactionTracker(transport, mode=ConfirmationMode.LONG_POLL)
+            did_service = DidService(
+                iconservice,
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                tracker=tracker,
+            )
+
+            # WHEN create a DID document
+            await did_service.create(KeyWallet.create(), public_key_param)
+
+            # THEN the result is returned as soon as it is finalized, without any sleep between polls.
+            assert server.method_counts["icx_waitTransactionResult"] == 1
+            assert server.method_counts["icx_getTransactionResult"] == 0
+            assert tracker.latency_percentiles((50,))[50] < server.confirm_delay + 0.2
+            await transport.close()
+
+    async def test_long_poll_is_requested_again_after_node_timeout(self, public_key_param):
+        # GIVEN a node that holds a long-poll request for 0.1 seconds at most
+        with LocalRpcServer(confirm_delay=0.25, wait_timeout=0.1) as server:
+            transport = AioHttpTransport(server.url)
+            did_service = DidService(
+                IconService(HTTPProvider(server.url)),
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                confirmation_mode=ConfirmationMode.LONG_POLL,
+            )
+
+            # WHEN create a DID document
+            document = await did_service.create(KeyWallet.create(), public_key_param)
+
+            # THEN the request is issued again until the transaction is finalized.
+            assert document.id in server.documents
+            assert server.method_counts["icx_waitTransactionResult"] == 3
+            await transport.close()
+
+    async def test_fall_back_to_polling(self, public_key_param):
+        # GIVEN a node that does not support `icx_waitTransactionResult`
+        with LocalRpcServer(long_poll=False) as server:
+            transport = AioHttpTransport(server.url)
+            tracker = TransactionTracker(transport, mode=ConfirmationMode.LONG_POLL)
+            did_service = DidService(
+                IconService(HTTPProvider(server.url)),
+                network_id=2,
+                score_address=LocalRpcServer.DID_SCORE_ADDRESS,
+                transport=transport,
+                tracker=tracker,
+            )
+
+            # WHEN create DID documents
+            await did_service.create(KeyWallet.create(), public_key_param)
+            await did_service.create(KeyWallet.create(), public_key_param)
+
+            # THEN the tracker polls the transaction results instead.
+            assert tracker.mode == ConfirmationMode.POLL
+            assert server.method_counts["icx_waitTransactionResult"] == 1
+            assert server.method_counts["icx_getTransactionResult"] == 2
+            await transport.close()
@@ -0,0 +1,92 @@
+import asyncio
+
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.jwt.jwt import Jwt
+from didsdk.vc_service import VCService
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestVCStatusCache:
+    async def test_is_valid_many(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN registered credentials and an unknown credential
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 3)
+        await vc_service.register_list(KeyWallet.create(), credentials, private_key)
+        sigs = [Jwt.decode(credential).signature for credential in credentials]
+        unknown_sig = Jwt.decode(CredentialFactory.create(private_key)).signature
+
+        # WHEN check the statuses with a duplicated signature
+        statuses = await vc_service.is_valid_many(sigs + [unknown_sig, sigs[0]])
+
+        # THEN the statuses are in order, and the duplicated one is requested once.
+        assert statuses == ["0x1", "0x1", "0x1", "0x0", "0x1"]
+        assert local_rpc_server.method_counts["icx_call"] == 4
+
+    async def test_status_cache(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService that caches the statuses and registered credentials
+        vc_service = VCService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS, status_cache_ttl=60
+        )
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 2)
+        await vc_service.register_list(wallet, credentials, private_key)
+        sigs = [Jwt.decode(credential).signature for credential in credentials]
+        unknown_sig = Jwt.decode(CredentialFactory.create(private_key)).signature
+
+        # WHEN check the statuses twice
+        assert await vc_service.is_valid_many(sigs + [unknown_sig]) == ["0x1", "0x1", "0x0"]
+        assert vc_service.is_valid(sigs[0]) == "0x1"
+        assert await vc_service.is_valid_many(sigs + [unknown_sig]) == ["0x1", "0x1", "0x0"]
+
+        # THEN only the invalid status is requested again.
+        assert local_rpc_server.method_counts["icx_call"] == 4
+
+        # WHEN revoke a credential
+        await vc_service.revoke(wallet, credentials[0], CredentialFactory.ISSUER_DID, private_key)
+
+        # THEN its status is not served from the cache.
+        assert vc_service.is_valid(sigs[0]) == "0x0"
+        assert vc_service.is_valid(sigs[1]) == "0x1"
+        assert local_rpc_server.method_counts["icx_call"] == 5
+
+        # WHEN revoke the issuer DID
+        await vc_service.revoke_did(wallet, credentials[1], CredentialFactory.ISSUER_DID, private_key)
+
+        # THEN the cache is cleared.
+        assert len(vc_service.status_cache) == 0
+        assert await vc_service.is_valid_async(sigs[1]) == "0x0"
+
+    async def test_revoke_during_lookup(self, local_iconservice: IconService, monkeypatch):
+        # GIVEN a registered credential, and a lookup of its status which read it before a revocation
+        vc_service = VCService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS, status_cache_ttl=60
+        )
+        wallet = KeyWallet.create()
+        private_key = PrivateKey()
+        credential = CredentialFactory.create(private_key)
+        await vc_service.register(wallet, credential, private_key)
+        sig = Jwt.decode(credential).signature
+        released = asyncio.Event()
+
+        async def is_valid_async(sig_: str) -> str:
+            await released.wait()
+            return "0x1"
+
+        monkeypatch.setattr(vc_service._vc_score, "is_valid_async", is_valid_async)
+        lookup = asyncio.create_task(vc_service.is_valid_async(sig))
+        await asyncio.sleep(0)
+
+        # WHEN revoke the credential, and then the lookup returns
+        await vc_service.revoke(wallet, credential, CredentialFactory.ISSUER_DID, private_key)
+        released.set()
+        assert await lookup == "0x1"
+
+        # THEN the status read before the revocation is not cached.
+        assert sig not in vc_service.status_cache
+        assert vc_service.is_valid(sig) == "0x0"
@@ -0,0 +1,111 @@
+import time
+
+from coincurve import PrivateKey
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.did_key_holder import DidKeyHolder
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+from didsdk.jwt.verify_cache import VerifyCache
+from didsdk.score.did_score_parameter import DidScoreParameter
+from tests.unit.test_document_cache import FakeClock
+from tests.unit.test_key_resolver import TestKeyResolver
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+def create_token(header: Header, payload: Payload, private_key: PrivateKey, exp: int) -> Jwt:
+    payload.put(Payload.EXPIRATION, exp)
+    return Jwt.decode(Jwt(header, payload).sign(private_key))
+
+
+class TestVerifyCache:
+    def test_verify(self, header: Header, payload: Payload, private_key: PrivateKey):
+        # GIVEN a cache, and a token which expires in 100 seconds
+        clock = FakeClock()
+        cache = VerifyCache(ttl=300, clock=clock)
+        jwt = create_token(header, payload, private_key, int(time.time()) + 100)
+
+        # WHEN verify it twice, and with another key
+        assert jwt.verify(private_key.public_key, cache=cache).success
+        assert jwt.verify(private_key.public_key, cache=cache).success
+        assert not jwt.verify(PrivateKey().public_key, cache=cache).success
+
+        # THEN the signature is verified once with the key, and a mismatch is not cached.
+        assert len(cache) == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.hit_rate == 1 / 3
+
+        # WHEN the token expires
+        clock.now += 101
+
+        # THEN it's not in the cache anymore, even though the ttl of the cache is longer.
+        assert not cache.contains(jwt, private_key.public_key)
+
+    def test_hit_verifies_expiration(self, header: Header, payload: Payload, private_key: PrivateKey):
+        # GIVEN a token cached before its expiration
+        exp = int(time.time()) - 10
+        cache = VerifyCache(wall_clock=lambda: exp - 60)
+        jwt = create_token(header, payload, private_key, exp)
+        cache.put(jwt, private_key.public_key)
+
+        # WHEN verify it after its expiration
+        result = jwt.verify(private_key.public_key, cache=cache)
+
+        # THEN the cache hit still fails.
+        assert cache.stats.hits == 1
+        assert result.fail_message == "The expiration date has expired."
+
+        # WHEN put a token already expired
+        cache = VerifyCache()
+        cache.put(jwt, private_key.public_key)
+
+        # THEN it's not cached.
+        assert len(cache) == 0
+
+    def test_verify_many(self, header: Header, payload: Payload, private_key: PrivateKey):
+        # GIVEN tokens verified in a batch with a cache
+        cache = VerifyCache()
+        tokens = [create_token(header, payload, private_key, int(time.time()) + 100 + i) for i in range(4)]
+        items = [(".".join(token.encoded_token), private_key.public_key) for token in tokens]
+        assert all(result.success for result in Jwt.verify_many(items, chunk_size=2, cache=cache))
+
+        # WHEN verify them again
+        results = Jwt.verify_many(items, chunk_size=2, cache=cache)
+
+        # THEN they are all in the cache.
+        assert all(result.success for result in results)
+        assert cache.stats.hits == 4
+        assert len(cache) == 4
+
+    async def test_revoked_key(self, local_iconservice: IconService):
+        # GIVEN a DidService with a cache, and a request verified with its key resolver
+        cache = VerifyCache()
+        did_service = DidService(
+            local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS, verify_cache=cache
+        )
+        private_key = PrivateKey()
+        key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+        wallet = KeyWallet.create()
+        document = await did_service.create(wallet, DidScoreParameter.create(key_provider, EncodeType.BASE64))
+        key_holder = DidKeyHolder(did=document.id, key_id="key1", type=AlgorithmType.ES256K, private_key=private_key)
+        request = TestKeyResolver.create_request(key_holder)
+        assert request.verify(resolver=did_service.key_resolver).success
+        assert request.verify(resolver=did_service.key_resolver).success
+        assert cache.stats.hits == 1
+
+        # WHEN revoke the key
+        new_private_key = PrivateKey()
+        new_key_provider = KeyProvider("key2", AlgorithmType.ES256K, new_private_key.public_key, new_private_key)
+        await did_service.add_public_key(
+            wallet, key_holder.sign(DidScoreParameter.add_key(key_holder, new_key_provider, EncodeType.BASE64))
+        )
+        await did_service.revoke_key(wallet, key_holder.sign(DidScoreParameter.revoke_key(key_holder, "key1")))
+
+        # THEN the tokens verified with the key are removed.
+        assert len(cache) == 0
+        assert not request.verify(resolver=did_service.key_resolver).success
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from coincurve import PrivateKey
+from iconsdk.exception import JSONRPCException
+from iconsdk.icon_service import IconService
+from iconsdk.wallet.wallet import KeyWallet
+
+from didsdk.core.algorithm_provider import AlgorithmType
+from didsdk.core.key_provider import KeyProvider
+from didsdk.did_service import DidService
+from didsdk.document.encoding import EncodeType
+from didsdk.score.did_score_parameter import DidScoreParameter
+from didsdk.vc_service import VCService
+from didsdk.wallet_pool import WalletPool
+from tests.utils.credential_factory import CredentialFactory
+from tests.utils.local_rpc_server import LocalRpcServer
+
+
+class TestWalletPool:
+    def test_invalid_wallets(self):
+        wallet = KeyWallet.create()
+        with pytest.raises(ValueError):
+            WalletPool([])
+        with pytest.raises(ValueError):
+            WalletPool([wallet, wallet])
+
+    async def test_lease(self):
+        # GIVEN a pool of 2 wallets with 2 operations in flight per wallet
+        pool = WalletPool([KeyWallet.create(), KeyWallet.create()], max_in_flight=2)
+        running, peak = 0, 0
+        addresses = set()
+
+        async def operation():
+            nonlocal running, peak
+            async with pool.lease() as wallet:
+                addresses.add(wallet.get_address())
+                running += 1
+                peak = max(peak, running)
+                wallet.sign(bytes(32))
+                assert pool.pending(wallet.get_address()) == {"0x" + "00" * 32}
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        # WHEN run 10 operations together
+        await asyncio.gather(*[operation() for _ in range(10)])
+
+        # THEN both wallets are used, at most 4 operations are in flight, and nothing is pending after them.
+        assert addresses == set(pool.addresses)
+        assert peak == 4
+        assert pool.in_flight == 0
+        assert pool.pending() == set()
+        assert [stats["sent"] for stats in pool.wallet_stats()] == [5, 5]
+
+    async def test_failed_lease(self):
+        # GIVEN a pool of a wallet
+        pool = WalletPool([KeyWallet.create()])
+
+        # WHEN an operation fails
+        with pytest.raises(ConnectionError):
+            async with pool.lease():
+                raise ConnectionError("refused")
+
+        # THEN the wallet is returned with the failure counted.
+        assert pool.wallet_stats()[0]["failed"] == 1
+        assert pool.in_flight == 0
+
+    async def test_register_bulk(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a pool of 3 wallets
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        pool = WalletPool([KeyWallet.create() for _ in range(3)])
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 60)
+
+        # WHEN register the credentials in chunks with the pool
+        results = await vc_service.register_bulk(pool, credentials, private_key, window=4, step_limit=300_000)
+
+        # THEN the chunks are spread across the wallets.
+        assert all(result.success for result in results)
+        assert len(local_rpc_server.credentials) == 60
+        assert all(stats["sent"] > 0 for stats in pool.wallet_stats())
+        assert pool.pending() == set()
+
+    async def test_register_bulk_send_fails(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a pool of 2 wallets, and a node which rejects every transaction
+        vc_service = VCService(local_iconservice, network_id=2, score_address=LocalRpcServer.VC_SCORE_ADDRESS)
+        pool = WalletPool([KeyWallet.create(), KeyWallet.create()])
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 4)
+
+        async def send_transaction(signed_tx):
+            raise JSONRPCException("rejected")
+
+        vc_service._transport.send_transaction = send_transaction
+
+        # WHEN register the credentials with the pool
+        results = await vc_service.register_bulk(pool, credentials, private_key)
+
+        # THEN each of them fails with the error of the node after the chunks are split, and the wallets are returned.
+        assert all(isinstance(result.error, JSONRPCException) for result in results)
+        assert pool.in_flight == 0
+
+    async def test_coalesced_registrations(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a VCService that coalesces registrations, and a pool of 2 wallets
+        vc_service = VCService(
+            local_iconservice,
+            network_id=2,
+            score_address=LocalRpcServer.VC_SCORE_ADDRESS,
+            coalesce_registrations=True,
+        )
+        pool = WalletPool([KeyWallet.create(), KeyWallet.create()])
+        private_key = PrivateKey()
+        credentials = CredentialFactory.create_list(private_key, 20)
+
+        # WHEN register each of them with the pool
+        await asyncio.gather(*[vc_service.register(pool, credential, private_key) for credential in credentials])
+
+        # THEN they are registered in a transaction by a wallet of the pool.
+        assert local_rpc_server.method_counts["icx_sendTransaction"] == 1
+        assert sum(stats["sent"] for stats in pool.wallet_stats()) == 1
+        assert len(local_rpc_server.credentials) == 20
+
+    async def test_create_many(self, local_rpc_server: LocalRpcServer, local_iconservice: IconService):
+        # GIVEN a pool of 2 wallets with an operation in flight per wallet
+        did_service = DidService(local_iconservice, network_id=2, score_address=LocalRpcServer.DID_SCORE_ADDRESS)
+        pool = WalletPool([KeyWallet.create(), KeyWallet.create()], max_in_flight=1)
+        public_keys = []
+        for _ in range(4):
+            private_key = PrivateKey()
+            key_provider = KeyProvider("key1", AlgorithmType.ES256K, private_key.public_key, private_key)
+            public_keys.append(DidScoreParameter.create(key_provider, EncodeType.BASE64))
+
+        # WHEN create DID documents with the pool
+        results = await did_service.create_many(pool, public_keys)
+
+        # THEN each wallet sends half of them.
+        assert all(result.did for result in results)
+        assert [stats["sent"] for stats in pool.wallet_stats()] == [2, 2]
@@ -0,0 +1,31 @@
+import secrets
+import time
+from typing import List
+
+from coincurve import PrivateKey
+
+from didsdk.jwt.elements import Header, Payload
+from didsdk.jwt.jwt import Jwt
+
+
+class CredentialFactory:
+    ISSUER_DID = "did:icon:02:" + "1a" * 24
+    KEY_ID = "issuer-key"
+
+    @staticmethod
+    def create(private_key: PrivateKey, issuer_did: str = ISSUER_DID) -> str:
+        issued = int(time.time())
+        payload = Payload(
+            {
+                Payload.ISSUER: issuer_did,
+                Payload.ISSUED_AT: issued,
+                Payload.EXPIRATION: issued + 3600,
+                Payload.NONCE: secrets.token_hex(16),
+                Payload.TYPE: ["CREDENTIAL"],
+            }
+        )
+        return Jwt(Header(alg="ES256K", kid=f"{issuer_did}#{CredentialFactory.KEY_ID}"), payload).sign(private_key)
+
+    @staticmethod
+    def create_list(private_key: PrivateKey, count: int, issuer_did: str = ISSUER_DID) -> List[str]:
+        return [CredentialFactory.create(private_key, issuer_did) for _ in range(count)]
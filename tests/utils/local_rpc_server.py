@@ -0,0 +1,379 @@
+import base64
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class ScoreFailure(Exception):
+    pass
+
+
+def decode_jwt_payload(jwt: str) -> dict:
+    payload = jwt.split(".")[1]
+    return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+
+
+class LocalRpcServer:
+    """A stand-in ICON JSON-RPC node for tests and benchmarks.
+
+    It runs a DID SCORE and a VC SCORE in memory. Every transaction is executed in its own block,
+    and its result can be read `confirm_delay` seconds after it was sent.
+    `icx_waitTransactionResult` holds the request until the result is available or `wait_timeout` passes.
+    """
+
+    DID_SCORE_ADDRESS = "cx" + "d1" * 20
+    VC_SCORE_ADDRESS = "cx" + "fc" * 20
+    SCORE_ERROR = -30032
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        confirm_delay: float = 0.0,
+        network_id: int = 2,
+        wait_timeout: float = 5.0,
+        long_poll: bool = True,
+        batch: bool = True,
+    ):
+        """Create the instance.
+
+        :param latency: the seconds to wait before handling each HTTP request.
+        :param confirm_delay: the seconds until the result of a transaction is available.
+        :param network_id: the network ID used to make DIDs.
+        :param wait_timeout: the maximum seconds `icx_waitTransactionResult` holds a request.
+        :param long_poll: if False, `icx_waitTransactionResult` is not supported like an old node.
+        :param batch: if False, a JSON-RPC batch request is rejected.
+        """
+        self.latency: float = latency
+        self.confirm_delay: float = confirm_delay
+        self.wait_timeout: float = wait_timeout
+        self.long_poll: bool = long_poll
+        self.batch: bool = batch
+        self.network_id: int = network_id
+        self.method_counts: Counter = Counter()
+        self.http_request_count: int = 0
+        # The `height` param of each `icx_call`, None for the latest state
+        self.call_heights: List[Optional[str]] = []
+        self.blocks: List[dict] = [self._make_block(0, [])]
+        self.documents: Dict[str, dict] = {}
+        self.credentials: Dict[str, dict] = {}
+        self.revoked_dids: set = set()
+        self._transactions: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "LocalRpcServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/v3"
+
+    def start(self) -> "LocalRpcServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, response = server.handle(body)
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 1024
+
+            def handle_error(self, request, client_address):
+                # A client which timed out closes the connection before the response.
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, body: bytes) -> tuple:
+        with self._lock:
+            self.http_request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        request = json.loads(body)
+        if isinstance(request, list):
+            if not self.batch:
+                return 400, {"jsonrpc": "2.0", "error": {"code": -32600, "message": "InvalidRequest"}, "id": None}
+            return 200, [self._handle_request(item) for item in request]
+
+        response = self._handle_request(request)
+        return (200 if "result" in response else 400), response
+
+    def _handle_request(self, request: dict) -> dict:
+        method = request.get("method")
+        with self._lock:
+            self.method_counts[method] += 1
+        try:
+            handler = getattr(self, f"_rpc_{method}", None)
+            if handler is None:
+                raise RpcError(-32601, f"MethodNotFound: {method}")
+            result = handler(request.get("params") or {})
+            return {"jsonrpc": "2.0", "result": result, "id": request.get("id")}
+        except RpcError as e:
+            return {"jsonrpc": "2.0", "error": {"code": e.code, "message": e.message}, "id": request.get("id")}
+
+    @staticmethod
+    def _make_block(height: int, transactions: list) -> dict:
+        block_hash = hashlib.sha3_256(f"block-{height}".encode()).hexdigest()
+        return {
+            "height": height,
+            "block_hash": block_hash,
+            "time_stamp": int(time.time() * 1_000_000),
+            "confirmed_transaction_list": transactions,
+        }
+
+    # JSON-RPC methods
+    def _rpc_icx_call(self, params: dict) -> Any:
+        data = params["data"]
+        with self._lock:
+            self.call_heights.append(params.get("height"))
+            try:
+                return self._read(params["to"], data["method"], data.get("params") or {})
+            except ScoreFailure as e:
+                raise RpcError(self.SCORE_ERROR, f"Reverted: {e}")
+
+    def _rpc_icx_getLastBlock(self, params: dict) -> dict:
+        with self._lock:
+            return self.blocks[-1]
+
+    def _rpc_icx_getBlockByHeight(self, params: dict) -> dict:
+        height = int(params["height"], 16)
+        with self._lock:
+            if height >= len(self.blocks):
+                raise RpcError(-31004, f"NotFound: block {height}")
+            return self.blocks[height]
+
+    def _rpc_icx_getTransactionResult(self, params: dict) -> dict:
+        with self._lock:
+            transaction = self._transactions.get(params["txHash"])
+            if transaction is None:
+                raise RpcError(-31004, f"NotFound: E1005:not found tx={params['txHash']}")
+            if time.monotonic() < transaction["ready_at"]:
+                raise RpcError(-31003, "Executing: Executing")
+            return transaction["result"]
+
+    def _rpc_icx_waitTransactionResult(self, params: dict) -> dict:
+        if not self.long_poll:
+            raise RpcError(-32601, "MethodNotFound: icx_waitTransactionResult")
+        with self._lock:
+            transaction = self._transactions.get(params["txHash"])
+            if transaction is None:
+                raise RpcError(-31004, f"NotFound: E1005:not found tx={params['txHash']}")
+            wait_time = transaction["ready_at"] - time.monotonic()
+        if wait_time > self.wait_timeout:
+            time.sleep(self.wait_timeout)
+            raise RpcError(-31006, "Timeout: E1006:timeout")
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return transaction["result"]
+
+    def _rpc_icx_sendTransaction(self, params: dict) -> str:
+        tx_hash = "0x" + hashlib.sha3_256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        with self._lock:
+            if tx_hash in self._transactions:
+                raise RpcError(-32600, f"InvalidRequest: duplicated transaction {tx_hash}")
+
+            height = len(self.blocks)
+            transaction = dict(params, txHash=tx_hash)
+            result = self._execute(transaction, height)
+            self.blocks.append(self._make_block(height, [transaction]))
+            self._transactions[tx_hash] = {"result": result, "ready_at": time.monotonic() + self.confirm_delay}
+            return tx_hash
+
+    # SCORE execution
+    def _execute(self, transaction: dict, height: int) -> dict:
+        data = transaction.get("data") or {}
+        step_used = 100_000 + 25 * len(json.dumps(data))
+        result = {
+            "blockHash": "0x" + hashlib.sha3_256(f"block-{height}".encode()).hexdigest(),
+            "blockHeight": hex(height),
+            "eventLogs": [],
+            "status": "0x1",
+            "stepPrice": "0x2e90edd00",
+            "stepUsed": hex(step_used),
+            "cumulativeStepUsed": hex(step_used),
+            "to": transaction["to"],
+            "txHash": transaction["txHash"],
+            "txIndex": "0x0",
+        }
+        if step_used > int(transaction.get("stepLimit", "0x0"), 16):
+            result["status"] = "0x0"
+            result["stepUsed"] = result["cumulativeStepUsed"] = transaction["stepLimit"]
+            result["failure"] = {"code": "0xa", "message": "OutOfStep"}
+            return result
+        try:
+            result["eventLogs"] = self._write(
+                transaction["to"], transaction["from"], data["method"], data.get("params") or {}, height
+            )
+        except ScoreFailure as e:
+            result["status"] = "0x0"
+            result["failure"] = {"code": "0x20", "message": str(e)}
+        return result
+
+    def _read(self, to: str, method: str, params: dict) -> Any:
+        if to == self.DID_SCORE_ADDRESS:
+            if method == "read":
+                document = self.documents.get(params["did"])
+                if document is None:
+                    raise ScoreFailure(f"{params['did']} is not found.")
+                return json.dumps(document)
+            if method == "getVersion":
+                return "1.0.0"
+        elif to == self.VC_SCORE_ADDRESS:
+            if method == "isValid":
+                credential = self.credentials.get(params["sig"])
+                valid = bool(credential) and not credential["isRevoked"]
+                valid = valid and credential["issuerDid"] not in self.revoked_dids
+                return "0x1" if valid else "0x0"
+            if method == "get":
+                credential = self.credentials.get(params["sig"])
+                if credential is None:
+                    raise ScoreFailure(f"{params['sig']} is not found.")
+                return credential
+        raise ScoreFailure(f"{method} is not found.")
+
+    def _write(self, to: str, from_: str, method: str, params: dict, height: int) -> List[dict]:
+        if to == self.DID_SCORE_ADDRESS:
+            return self._write_did(from_, method, params, height)
+        if to == self.VC_SCORE_ADDRESS:
+            return self._write_vc(from_, method, params, height)
+        raise ScoreFailure(f"{to} is not a score.")
+
+    def _event(self, to: str, signature: str, indexed: list, data: list = None) -> dict:
+        return {"scoreAddress": to, "indexed": [signature] + indexed, "data": data or []}
+
+    def _write_did(self, from_: str, method: str, params: dict, height: int) -> List[dict]:
+        if method == "create":
+            public_key = json.loads(params["publicKey"])
+            public_key["created"] = height
+            seed = f"{from_}-{height}-{params['publicKey']}".encode()
+            did = f"did:icon:{self.network_id:02x}:{hashlib.sha3_256(seed).hexdigest()[:48]}"
+            self.documents[did] = {
+                "version": "1.0",
+                "id": did,
+                "created": height,
+                "publicKey": [public_key],
+                "authentication": [{"publicKey": public_key["id"]}],
+            }
+            return [self._event(self.DID_SCORE_ADDRESS, "Create(Address,str,str)", [from_, did], [public_key["id"]])]
+
+        if method == "update":
+            payload = decode_jwt_payload(params["jwt"])
+            param = payload["param"]
+            document = self.documents.get(param["id"])
+            if document is None:
+                raise ScoreFailure(f"{param['id']} is not found.")
+            keys = {key["id"]: key for key in document["publicKey"]}
+
+            if payload["method"] == "addKey":
+                public_key = dict(param["publicKey"], created=height)
+                if public_key["id"] in keys:
+                    raise ScoreFailure(f"{public_key['id']} already exists.")
+                document["publicKey"].append(public_key)
+                document["authentication"].append({"publicKey": public_key["id"]})
+                document["updated"] = height
+                return [
+                    self._event(
+                        self.DID_SCORE_ADDRESS, "AddKey(Address,str,str)", [from_, document["id"]], [public_key["id"]]
+                    )
+                ]
+            if payload["method"] == "revokeKey":
+                key = keys.get(param["publicKey"])
+                if key is None or key.get("revoked"):
+                    raise ScoreFailure(f"{param['publicKey']} can not be revoked.")
+                key["revoked"] = height
+                document["authentication"] = [
+                    authentication
+                    for authentication in document["authentication"]
+                    if authentication["publicKey"] != key["id"]
+                ]
+                document["updated"] = height
+                return [
+                    self._event(
+                        self.DID_SCORE_ADDRESS, "RevokeKey(Address,str,str)", [from_, document["id"]], [key["id"]]
+                    )
+                ]
+        raise ScoreFailure(f"{method} is not found.")
+
+    def _register(self, from_: str, credential_jwt: str, height: int) -> dict:
+        payload = decode_jwt_payload(credential_jwt)
+        if payload["sig"] in self.credentials:
+            raise ScoreFailure(f"{payload['sig']} is already registered.")
+        self.credentials[payload["sig"]] = {
+            "sig": payload["sig"],
+            "issuerDid": payload["issuerDid"],
+            "issueDate": payload.get("issueDate"),
+            "expiryDate": payload.get("expiryDate"),
+            "created": height,
+            "isRevoked": False,
+        }
+        return self._event(self.VC_SCORE_ADDRESS, "AddCredential(Address,str)", [from_, payload["issuerDid"]])
+
+    def _revoke(self, from_: str, payload: dict, height: int) -> dict:
+        credential = self.credentials.get(payload["sig"])
+        if credential is None or credential["isRevoked"]:
+            raise ScoreFailure(f"{payload['sig']} can not be revoked.")
+        credential["isRevoked"] = True
+        credential["revoked"] = height
+        return self._event(self.VC_SCORE_ADDRESS, "RevokeCredential(Address,str)", [from_, payload["issuerDid"]])
+
+    def _write_vc(self, from_: str, method: str, params: dict, height: int) -> List[dict]:
+        if method == "register":
+            return [self._register(from_, params["credentialJwt"], height)]
+        if method == "registerList":
+            credential_jwts = params["credentialJwtList"].split(",")
+            sigs = [decode_jwt_payload(credential_jwt)["sig"] for credential_jwt in credential_jwts]
+            if len(set(sigs)) != len(sigs) or any(sig in self.credentials for sig in sigs):
+                raise ScoreFailure("A credential is already registered.")
+            return [self._register(from_, credential_jwt, height) for credential_jwt in credential_jwts]
+
+        payload = decode_jwt_payload(params["credentialJwt"])
+        if method == "revoke":
+            return [self._revoke(from_, payload, height)]
+        if method == "revokeDid":
+            self.revoked_dids.add(payload["issuerDid"])
+            return [self._event(self.VC_SCORE_ADDRESS, "RevokeDid(Address,str)", [from_, payload["issuerDid"]])]
+        if method == "revokeVcAndDid":
+            event = self._revoke(from_, payload, height)
+            self.revoked_dids.add(payload["issuerDid"])
+            return [event, self._event(self.VC_SCORE_ADDRESS, "RevokeDid(Address,str)", [from_, payload["issuerDid"]])]
+        raise ScoreFailure(f"{method} is not found.")